@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+IntelliNemo Agent - Adaptive Concurrency Limit
+Drives a simulated NIM endpoint (a fixed number of replicas, each serving
+one request at a time, answering 429 once its queue is full) with many
+caller threads, using hand-picked fixed concurrency and then the adaptive
+limiter from src/lambda/adaptive_limiter.py. Halfway through each run the
+endpoint scales its replicas, so the adaptive limit has to follow it.
+
+Usage:
+    python benchmarks/adaptive_limit.py --callers 64 --replicas 8 --scaled-replicas 16
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+from collections import deque
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'src', 'lambda'))
+from adaptive_limiter import AdaptiveLimiter
+
+class SimulatedEndpoint:
+    """Replicas serve one request each in FIFO order; requests beyond replicas * queue_factor get 429"""
+
+    def __init__(self, replicas, service_ms, jitter=0.5, queue_factor=2):
+        self.replicas = replicas
+        self.service_s = service_ms / 1000
+        self.jitter = jitter
+        self.queue_factor = queue_factor
+        self.busy = 0
+        self.queue = deque()
+        self.lock = threading.Lock()
+
+    def scale(self, replicas):
+        with self.lock:
+            self.replicas = replicas
+            while self.queue and self.busy < self.replicas:
+                self.busy += 1
+                self.queue.popleft().set()
+
+    def call(self):
+        with self.lock:
+            if self.busy + len(self.queue) >= self.replicas * self.queue_factor:
+                return 429
+            turn = None
+            if self.busy < self.replicas and not self.queue:
+                self.busy += 1
+            else:
+                turn = threading.Event()
+                self.queue.append(turn)
+        if turn is not None:
+            turn.wait()
+        # Generation time varies with the length of the answer
+        time.sleep(self.service_s * random.uniform(1 - self.jitter, 1 + self.jitter))
+        with self.lock:
+            # Hand the replica straight to the next queued request
+            if self.queue and self.busy <= self.replicas:
+                self.queue.popleft().set()
+            else:
+                self.busy -= 1
+        return 200
+
+def run(endpoint, callers, seconds, scaled_replicas, gate):
+    """Callers loop through gate(endpoint.call) for seconds; replicas change at the midpoint"""
+    latencies = []
+    counts = {'ok': 0, 'throttled': 0}
+    lock = threading.Lock()
+    deadline = time.monotonic() + seconds
+
+    def caller():
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            status = gate(endpoint.call)
+            elapsed = (time.perf_counter() - start) * 1000
+            with lock:
+                if status == 200:
+                    counts['ok'] += 1
+                    latencies.append(elapsed)
+                else:
+                    counts['throttled'] += 1
+            if status != 200:
+                time.sleep(0.01)
+
+    threads = [threading.Thread(target=caller) for _ in range(callers)]
+    for t in threads:
+        t.start()
+    time.sleep(seconds / 2)
+    endpoint.scale(scaled_replicas)
+    for t in threads:
+        t.join()
+
+    latencies.sort()
+    return {
+        'throughput_per_s': round(counts['ok'] / seconds, 1),
+        'throttled': counts['throttled'],
+        'p50_ms': round(statistics.median(latencies), 1) if latencies else None,
+        'p99_ms': round(latencies[int(len(latencies) * 0.99) - 1], 1) if latencies else None
+    }
+
+def fixed_gate(concurrency):
+    semaphore = threading.Semaphore(concurrency)
+
+    def gate(call):
+        with semaphore:
+            return call()
+    return gate
+
+def adaptive_gate(limiter, trace):
+    def gate(call):
+        with limiter.track() as sample:
+            status = call()
+            sample.status(status)
+        trace.append((time.monotonic(), limiter.limit))
+        return status
+    return gate
+
+def main():
+    """Compare fixed concurrency settings with the adaptive limiter"""
+    parser = argparse.ArgumentParser(description='Fixed vs. adaptive concurrency against a scaling endpoint')
+    parser.add_argument('--callers', type=int, default=64)
+    parser.add_argument('--replicas', type=int, default=8)
+    parser.add_argument('--scaled-replicas', type=int, default=16)
+    parser.add_argument('--service-ms', type=float, default=20.0)
+    parser.add_argument('--jitter', type=float, default=0.5, help='service time varies by +/- this fraction')
+    parser.add_argument('--seconds', type=float, default=6.0)
+    parser.add_argument('--fixed', default='4,16,64', help='comma-separated fixed concurrency settings')
+    parser.add_argument('--output', help='write results to this JSON file')
+    args = parser.parse_args()
+
+    print("📈 IntelliNemo Agent - Adaptive Concurrency Limit")
+    print(f"   {args.callers} callers, {args.replicas} -> {args.scaled_replicas} replicas at "
+          f"{args.service_ms:.0f} ms (+/-{args.jitter:.0%}) per request, {args.seconds:.0f}s per run")
+
+    results = {}
+    for concurrency in [int(c) for c in args.fixed.split(',')]:
+        endpoint = SimulatedEndpoint(args.replicas, args.service_ms, args.jitter)
+        results[f'fixed-{concurrency}'] = run(endpoint, args.callers, args.seconds, args.scaled_replicas,
+                                              fixed_gate(concurrency))
+
+    limiter = AdaptiveLimiter()
+    trace = []
+    endpoint = SimulatedEndpoint(args.replicas, args.service_ms, args.jitter)
+    started = time.monotonic()
+    results['adaptive'] = run(endpoint, args.callers, args.seconds, args.scaled_replicas,
+                              adaptive_gate(limiter, trace))
+    # Settled limit: the second quarter of each phase
+    quarter = args.seconds / 4
+    for key, low in [('limit_before_scale', quarter), ('limit_after_scale', 3 * quarter)]:
+        limits = [limit for at, limit in trace if low <= at - started < low + quarter]
+        results['adaptive'][key] = round(statistics.median(limits), 1)
+    results['adaptive']['overloads'] = limiter.stats['overloads']
+
+    print(f"\n   {'mode':<12}{'req/s':>9}{'429s':>8}{'p50 ms':>9}{'p99 ms':>9}")
+    for mode, r in results.items():
+        print(f"   {mode:<12}{r['throughput_per_s']:>9}{r['throttled']:>8}{r['p50_ms']:>9}{r['p99_ms']:>9}")
+    adaptive = results['adaptive']
+    print(f"\n   Adaptive limit: {adaptive['limit_before_scale']} with {args.replicas} replicas, "
+          f"{adaptive['limit_after_scale']} with {args.scaled_replicas}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n📄 Results saved: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+IntelliNemo Agent - Cold Start Benchmarks
+Launches a fresh interpreter per run for each handler variant and
+measures interpreter start, module import/init and first-invocation
+latency, plus a per-package import breakdown from -X importtime.
+
+AWS and NIM calls are pointed at a closed local port so the first
+invocation exercises client construction and the error path without
+network waits.
+
+Usage:
+    python benchmarks/cold_start.py --runs 20
+    python benchmarks/cold_start.py --variant lambda-package --no-bytecode-cache
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+SRC_LAMBDA = os.path.join(REPO_ROOT, 'src', 'lambda')
+
+# variant -> (handler module, extra sys.path entries searched after src/lambda)
+VARIANTS = {
+    'lambda': ('lambda_function', []),
+    'sagemaker': ('sagemaker_lambda_function', []),
+    'eks': ('eks_lambda_function', []),
+    'lambda-package': ('lambda_function', [os.path.join(REPO_ROOT, 'lambda-package')]),
+    'lambda-package-sagemaker': ('sagemaker_lambda_function', [os.path.join(REPO_ROOT, 'lambda-package')]),
+    'lambda-package-eks': ('eks_lambda_function', [os.path.join(REPO_ROOT, 'lambda-package-eks')])
+}
+
+# Modules called out separately in the report because they dominate vendored imports
+WATCHED_MODULES = ('charset_normalizer', 'idna.uts46data', 'urllib3.contrib', 'urllib3.http2', 'certifi')
+
+SENTINEL = '__INTELLINEMO_COLD_START__'
+
+CHILD_PROGRAM = '''
+import json, os, sys, time
+start = time.perf_counter()
+sys.path[:0] = json.loads(os.environ['COLD_START_PATH'])
+import importlib
+handler = importlib.import_module(os.environ['COLD_START_MODULE'])
+init_done = time.perf_counter()
+stdout, sys.stdout = sys.stdout, open(os.devnull, 'w')
+handler.lambda_handler(json.loads(os.environ['COLD_START_EVENT']), None)
+sys.stdout = stdout
+invoke_done = time.perf_counter()
+print(%r + json.dumps({'init_ms': (init_done - start) * 1000, 'first_invocation_ms': (invoke_done - init_done) * 1000}))
+''' % SENTINEL
+
+CLOSED_ENDPOINT = 'http://127.0.0.1:9'
+
+def child_environment(module: str, path: List[str], event: Dict, pycache_prefix: str = None) -> Dict:
+    """Environment for a fresh handler interpreter with all remote calls failing fast"""
+    env = dict(os.environ)
+    env.update({
+        'COLD_START_MODULE': module,
+        'COLD_START_PATH': json.dumps(path),
+        'COLD_START_EVENT': json.dumps(event),
+        'AWS_DEFAULT_REGION': 'us-east-1',
+        'AWS_ACCESS_KEY_ID': 'cold-start',
+        'AWS_SECRET_ACCESS_KEY': 'cold-start',
+        'AWS_ENDPOINT_URL': CLOSED_ENDPOINT,
+        'AWS_MAX_ATTEMPTS': '1',
+        'SECRETS_ARN': 'arn:aws:secretsmanager:us-east-1:123456789012:secret:cold-start',
+        'S3_BUCKET': 'cold-start-bucket',
+        'MODE': 'DRY_RUN',
+        'LLAMA_ENDPOINT': f'{CLOSED_ENDPOINT}/v1/completions',
+        'RETRIEVAL_ENDPOINT': f'{CLOSED_ENDPOINT}/v1/retrieval'
+    })
+    env.pop('PYTHONPATH', None)
+    if pycache_prefix:
+        # An empty cache directory forces every module to be compiled from source
+        env['PYTHONPYCACHEPREFIX'] = pycache_prefix
+    return env
+
+def run_once(module: str, path: List[str], event: Dict, importtime: bool, no_bytecode_cache: bool) -> Dict:
+    """Launch one fresh interpreter and collect its timings"""
+    command = [sys.executable] + (['-X', 'importtime'] if importtime else []) + ['-c', CHILD_PROGRAM]
+    with tempfile.TemporaryDirectory() as pycache_prefix:
+        env = child_environment(module, path, event, pycache_prefix if no_bytecode_cache else None)
+        start = time.perf_counter()
+        proc = subprocess.run(command, env=env, capture_output=True, text=True, timeout=120)
+        wall_ms = (time.perf_counter() - start) * 1000
+
+    line = next((l for l in proc.stdout.splitlines() if l.startswith(SENTINEL)), None)
+    if proc.returncode != 0 or line is None:
+        raise RuntimeError(f"{module} run failed:\n{proc.stderr[-2000:]}")
+
+    result = json.loads(line[len(SENTINEL):])
+    result['process_ms'] = wall_ms
+    if importtime:
+        result['imports'] = parse_importtime(proc.stderr)
+    return result
+
+def parse_importtime(stderr: str) -> Dict[str, float]:
+    """Self import time in milliseconds per module from -X importtime output"""
+    imports = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        imports[name.strip()] = int(self_us) / 1000
+    return imports
+
+def group_imports(imports: Dict[str, float]) -> Dict[str, float]:
+    """Sum self import time per top-level package, with watched submodules split out"""
+    groups = {}
+    for name, ms in imports.items():
+        key = next((w for w in WATCHED_MODULES if name == w or name.startswith(w + '.')), name.split('.')[0])
+        groups[key] = groups.get(key, 0.0) + ms
+    return groups
+
+def distribution(values: List[float]) -> Dict:
+    values = sorted(values)
+    return {
+        'min': values[0],
+        'median': statistics.median(values),
+        'p90': values[min(len(values) - 1, int(len(values) * 0.9))],
+        'max': values[-1]
+    }
+
+def benchmark_variant(name: str, runs: int, event: Dict, no_bytecode_cache: bool) -> Dict:
+    """Timing runs without instrumentation plus separate -X importtime runs"""
+    module, extra_path = VARIANTS[name]
+    path = [SRC_LAMBDA] + extra_path
+
+    timings = [run_once(module, path, event, False, no_bytecode_cache) for _ in range(runs)]
+    traced = [run_once(module, path, event, True, no_bytecode_cache) for _ in range(runs)]
+
+    packages = {}
+    for run in traced:
+        for package, ms in group_imports(run['imports']).items():
+            packages.setdefault(package, []).append(ms)
+
+    return {
+        'module': module,
+        'runs': runs,
+        'process_ms': distribution([t['process_ms'] for t in timings]),
+        'init_ms': distribution([t['init_ms'] for t in timings]),
+        'first_invocation_ms': distribution([t['first_invocation_ms'] for t in timings]),
+        'import_ms_by_package': {
+            package: distribution(values + [0.0] * (runs - len(values)))
+            for package, values in sorted(packages.items(), key=lambda item: -statistics.median(item[1]))
+        }
+    }
+
+def print_variant(name: str, result: Dict, top: int):
+    print(f"\n📦 {name} ({result['module']}, {result['runs']} runs)")
+    for label, key in [('Process', 'process_ms'), ('Import + init', 'init_ms'), ('First invocation', 'first_invocation_ms')]:
+        d = result[key]
+        print(f"   {label:<18} median {d['median']:8.1f} ms   p90 {d['p90']:8.1f} ms   max {d['max']:8.1f} ms")
+
+    print(f"   Top imports (self time, median / p90):")
+    for package, d in list(result['import_ms_by_package'].items())[:top]:
+        marker = ' ⚠️' if package in WATCHED_MODULES else ''
+        print(f"     {package:<28}{d['median']:8.1f} / {d['p90']:6.1f} ms{marker}")
+
+def main():
+    """Run cold start benchmarks"""
+    parser = argparse.ArgumentParser(description='Cold start benchmarks for each handler variant')
+    parser.add_argument('--variant', action='append', choices=sorted(VARIANTS), help='variant to run (repeatable, default all)')
+    parser.add_argument('--runs', type=int, default=10, help='fresh interpreters per variant and mode')
+    parser.add_argument('--top', type=int, default=12, help='packages to show in the import breakdown')
+    parser.add_argument('--no-bytecode-cache', action='store_true',
+                        help='compile every module from source, as a zip without .pyc files does on Lambda')
+    parser.add_argument('--output', help='write the full distributions to this JSON file')
+    args = parser.parse_args()
+
+    with open(os.path.join(REPO_ROOT, 'test-payload.json')) as f:
+        event = json.load(f)
+
+    print("🧊 IntelliNemo Agent - Cold Start Benchmarks")
+    print(f"   Python {sys.version.split()[0]}, bytecode cache {'disabled' if args.no_bytecode_cache else 'enabled'}")
+
+    results = {}
+    for name in args.variant or sorted(VARIANTS):
+        results[name] = benchmark_variant(name, args.runs, event, args.no_bytecode_cache)
+        print_variant(name, results[name], args.top)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n📄 Results saved: {args.output}")
+
+if __name__ == "__main__":
+    main()
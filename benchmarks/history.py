@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+IntelliNemo Agent - Benchmark History
+SQLite store of latency and throughput results keyed by git commit,
+handler variant, model and scenario, with change-point detection
+across runs.
+
+Usage:
+    python benchmarks/history.py record-validation domain_validation_results_<ts>.ndjson --variant eks --model llama-3.1-nemotron-nano-8b-v1
+    python benchmarks/history.py record-benchmark hot_paths.json --variant lambda
+    python benchmarks/history.py report
+"""
+
+import argparse
+import json
+import math
+import os
+import sqlite3
+import subprocess
+import sys
+from datetime import datetime
+from typing import Dict, List, Optional
+
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'history.sqlite')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    recorded_at TEXT NOT NULL,
+    git_commit TEXT NOT NULL,
+    handler_variant TEXT NOT NULL,
+    model TEXT NOT NULL,
+    source TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    scenario TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_series ON results (scenario, metric, run_id);
+"""
+
+# Metrics where a larger value is an improvement
+HIGHER_IS_BETTER = {'throughput_rps'}
+
+def current_commit() -> str:
+    """Short hash of the checked-out commit, or 'unknown' outside a git tree"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+class BenchmarkHistory:
+    """Append-only history of benchmark runs"""
+
+    def __init__(self, path: str = DEFAULT_DB_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def record_run(self, variant: str, model: str, source: str, results: List[tuple],
+                   git_commit: Optional[str] = None) -> int:
+        """Store one run; results are (scenario, metric, value) tuples"""
+        with self.conn:
+            cursor = self.conn.execute(
+                'INSERT INTO runs (recorded_at, git_commit, handler_variant, model, source) VALUES (?, ?, ?, ?, ?)',
+                (datetime.utcnow().isoformat(), git_commit or current_commit(), variant, model, source)
+            )
+            run_id = cursor.lastrowid
+            self.conn.executemany(
+                'INSERT INTO results (run_id, scenario, metric, value) VALUES (?, ?, ?, ?)',
+                [(run_id, scenario, metric, value) for scenario, metric, value in results]
+            )
+        return run_id
+
+    def series(self) -> Dict[tuple, List[Dict]]:
+        """Group results into time-ordered series keyed by (variant, model, scenario, metric)"""
+        rows = self.conn.execute(
+            'SELECT r.handler_variant, r.model, x.scenario, x.metric, r.id, r.git_commit, AVG(x.value) '
+            'FROM results x JOIN runs r ON r.id = x.run_id '
+            'GROUP BY r.id, x.scenario, x.metric ORDER BY r.id'
+        )
+        grouped = {}
+        for variant, model, scenario, metric, run_id, commit, value in rows:
+            grouped.setdefault((variant, model, scenario, metric), []).append(
+                {'run_id': run_id, 'commit': commit, 'value': value})
+        return grouped
+
+    def close(self):
+        self.conn.close()
+
+def validation_results(path: str) -> List[tuple]:
+    """Per-scenario latency plus run throughput from a domain validation NDJSON stream"""
+    results = []
+    total_time = 0.0
+    with open(path) as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record.get('record_type', 'test') != 'test' or 'error' in record:
+                continue
+            results.append((record['test'], 'latency_s', record['execution_time']))
+            total_time += record['execution_time']
+
+    if results and total_time > 0:
+        results.append(('*', 'throughput_rps', len(results) / total_time))
+    return results
+
+def benchmark_results(path: str) -> List[tuple]:
+    """Per-function latency from a benchmarks/hot_paths.py results file"""
+    with open(path) as f:
+        data = json.load(f)
+    return [(name, 'latency_us', stats['min_us']) for name, stats in data['results'].items()]
+
+def detect_change_point(values: List[float], min_segment: int = 2) -> Optional[Dict]:
+    """Find the single split that best separates the series into two mean levels"""
+    best = None
+    for split in range(min_segment, len(values) - min_segment + 1):
+        before, after = values[:split], values[split:]
+        mean_before = sum(before) / len(before)
+        mean_after = sum(after) / len(after)
+        var_before = sum((v - mean_before) ** 2 for v in before) / max(len(before) - 1, 1)
+        var_after = sum((v - mean_after) ** 2 for v in after) / max(len(after) - 1, 1)
+        stderr = math.sqrt(var_before / len(before) + var_after / len(after))
+        # Floor the noise estimate so perfectly flat segments do not produce infinite scores
+        stderr = max(stderr, 1e-3 * max(abs(mean_before), 1e-9))
+        score = abs(mean_after - mean_before) / stderr
+        if best is None or score > best['score']:
+            best = {'index': split, 'score': score, 'mean_before': mean_before, 'mean_after': mean_after}
+    return best
+
+def find_regressions(history: BenchmarkHistory, min_score: float, min_change: float,
+                     min_latency_delta: float) -> List[Dict]:
+    """Run change-point detection on every series and keep the shifts that are regressions"""
+    regressions = []
+    for (variant, model, scenario, metric), points in history.series().items():
+        change = detect_change_point([point['value'] for point in points])
+        if not change or change['score'] < min_score:
+            continue
+
+        delta = change['mean_after'] - change['mean_before']
+        if metric in HIGHER_IS_BETTER:
+            delta = -delta
+        relative = delta / abs(change['mean_before']) if change['mean_before'] else math.inf
+        if delta <= 0 or relative < min_change:
+            continue
+        if metric == 'latency_s' and delta < min_latency_delta:
+            continue
+
+        regressions.append({
+            'variant': variant,
+            'model': model,
+            'scenario': scenario,
+            'metric': metric,
+            'commit': points[change['index']]['commit'],
+            'mean_before': change['mean_before'],
+            'mean_after': change['mean_after'],
+            'change': relative,
+            'score': change['score'],
+            'runs': len(points)
+        })
+    return regressions
+
+def print_report(regressions: List[Dict]):
+    """Print the regression report"""
+    print("📈 IntelliNemo Agent - Benchmark Regression Report")
+    print("=" * 60)
+    if not regressions:
+        print("✅ No regressions detected")
+        return
+
+    for r in sorted(regressions, key=lambda r: -r['change']):
+        print(f"\n❌ {r['scenario']} [{r['metric']}]")
+        print(f"   Variant: {r['variant']}  Model: {r['model']}")
+        print(f"   First slow commit: {r['commit']} (score {r['score']:.1f} over {r['runs']} runs)")
+        print(f"   Before: {r['mean_before']:.3f}  After: {r['mean_after']:.3f}  Regression: {r['change'] * 100:.1f}%")
+
+def main():
+    """Benchmark history CLI"""
+    parser = argparse.ArgumentParser(description='Benchmark history and cross-run regression detection')
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help='SQLite history file')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    for name, help_text in [('record-validation', 'store a domain validation NDJSON stream'),
+                            ('record-benchmark', 'store a benchmarks/hot_paths.py results file')]:
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument('path')
+        command.add_argument('--variant', required=True, help='handler variant, e.g. lambda, sagemaker, eks')
+        command.add_argument('--model', default='unknown', help='model served by the endpoint')
+        command.add_argument('--commit', help='git commit (defaults to HEAD)')
+
+    report = commands.add_parser('report', help='run change-point detection and print regressions')
+    report.add_argument('--min-score', type=float, default=4.0, help='minimum change-point score')
+    report.add_argument('--min-change', type=float, default=0.10, help='minimum relative slowdown')
+    report.add_argument('--min-latency-delta', type=float, default=0.2,
+                        help='minimum absolute slowdown in seconds for end-to-end latency series')
+    args = parser.parse_args()
+
+    history = BenchmarkHistory(args.db)
+    try:
+        if args.command == 'report':
+            regressions = find_regressions(history, args.min_score, args.min_change, args.min_latency_delta)
+            print_report(regressions)
+            sys.exit(1 if regressions else 0)
+
+        loader = validation_results if args.command == 'record-validation' else benchmark_results
+        results = loader(args.path)
+        run_id = history.record_run(args.variant, args.model, os.path.basename(args.path), results, args.commit)
+        print(f"📄 Recorded run {run_id}: {len(results)} results from {args.path}")
+    finally:
+        history.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+IntelliNemo Agent - Per-Alarm Hot Path Micro-Benchmarks
+Times the CPU-bound handler functions over the scenario corpus and
+compares the results against the baseline stored in the repository.
+
+Usage:
+    python benchmarks/hot_paths.py                  # compare against baseline
+    python benchmarks/hot_paths.py --save-baseline  # record a new baseline
+"""
+
+import argparse
+import importlib.util
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List
+
+REPO_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+sys.path.insert(0, os.path.join(REPO_ROOT, 'src', 'lambda'))
+import lambda_function
+import sagemaker_lambda_function
+import eks_lambda_function
+
+class NullS3Client:
+    """Accepts audit writes without network I/O so only serialization is timed"""
+
+    def put_object(self, **kwargs):
+        return {}
+
+def load_scenario_corpus() -> List[Dict]:
+    """Load alarm events from the critical scenarios catalog and sample payload"""
+    spec = importlib.util.spec_from_file_location(
+        'critical_shutdown_scenarios', os.path.join(REPO_ROOT, 'critical-shutdown-scenarios.py'))
+    scenarios = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(scenarios)
+
+    events = [scenario['alarm'] for scenario in scenarios.critical_scenarios]
+    with open(os.path.join(REPO_ROOT, 'test-payload.json')) as f:
+        events.append(json.load(f))
+    return events
+
+def build_benchmarks(events: List[Dict]) -> Dict[str, Callable]:
+    """Build one zero-argument callable per hot function, each covering the whole corpus"""
+    alarms = [lambda_function.extract_alarm_data(event) for event in events]
+    reasoning = {'reasoning': 'High utilisation detected, remediation recommended', 'confidence': 8}
+    analyses = [
+        {'action': 'restart_service', 'confidence': 8, 'reasoning': f"{alarm['metric_name']} breach"}
+        for alarm in alarms
+    ]
+    generated_texts = []
+    for alarm in alarms:
+        generated_texts.append(
+            'Based on the retrieved knowledge the recommended remediation is below.\n'
+            f'{{"action": "restart_service", "confidence": 8, "reasoning": "{alarm["metric_name"]} in {alarm["namespace"]} exceeded threshold"}}\n'
+        )
+        generated_texts.append(f"The {alarm['metric_name']} alarm needs a human to look at it. " * 8)
+    completion_texts = [
+        f"Root cause: {alarm['reason']}. Recommended action: restart the service. Confidence: 8/10"
+        for alarm in alarms
+    ]
+    audit_entries = [
+        {
+            'timestamp': '2026-01-01T00:00:00',
+            'alarm': alarm,
+            'retrieved_context': {'query': 'q', 'retrieved_knowledge': 'k', 'retrieval_successful': True},
+            'llama_analysis': analysis,
+            'decision': sagemaker_lambda_function.make_remediation_decision(analysis, alarm),
+            'execution': None,
+            'mode': 'DRY_RUN'
+        }
+        for alarm, analysis in zip(alarms, analyses)
+    ]
+    s3_client = NullS3Client()
+
+    # The handlers print one line per audit write; send it to /dev/null instead of the terminal
+    devnull = open(os.devnull, 'w')
+
+    def quiet(func):
+        def run():
+            stdout = sys.stdout
+            sys.stdout = devnull
+            try:
+                return func()
+            finally:
+                sys.stdout = stdout
+        return run
+
+    return {
+        'extract_alarm_data': lambda: [lambda_function.extract_alarm_data(event) for event in events],
+        'generate_action': lambda: [lambda_function.generate_action(reasoning, alarm) for alarm in alarms],
+        'make_remediation_decision': lambda: [
+            sagemaker_lambda_function.make_remediation_decision(analysis, alarm)
+            for analysis, alarm in zip(analyses, alarms)
+        ],
+        'extract_confidence': lambda: [eks_lambda_function.extract_confidence(text) for text in completion_texts],
+        'parse_llama_output': lambda: [sagemaker_lambda_function.parse_llama_output(text) for text in generated_texts],
+        'audit_serialization': quiet(lambda: [
+            sagemaker_lambda_function.log_to_s3(s3_client, 'bench-bucket', entry) for entry in audit_entries
+        ])
+    }
+
+def measure(func: Callable, calls_per_run: int, warmup: int, repeat: int, number: int) -> Dict:
+    """Time a benchmark callable and summarise per-call latency in microseconds"""
+    for _ in range(warmup):
+        func()
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        samples.append(elapsed / (number * calls_per_run) * 1e6)
+
+    return {
+        'min_us': min(samples),
+        'median_us': statistics.median(samples),
+        'stdev_us': statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        'samples_us': samples
+    }
+
+def mann_whitney_z(current: List[float], baseline: List[float]) -> float:
+    """One-sided Mann-Whitney U z-score; positive when current samples are slower"""
+    ranked = sorted([(value, 0) for value in current] + [(value, 1) for value in baseline])
+    ranks = [0.0] * len(ranked)
+    i = 0
+    while i < len(ranked):
+        j = i
+        while j + 1 < len(ranked) and ranked[j + 1][0] == ranked[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        i = j + 1
+
+    n1, n2 = len(current), len(baseline)
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, ranked) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    sigma = math.sqrt(n1 * n2 * (n1 + n2 + 1) / 12)
+    return (u - n1 * n2 / 2) / sigma if sigma else 0.0
+
+def compare(results: Dict, baseline: Dict, threshold: float, min_z: float) -> List[str]:
+    """Return the benchmarks that are slower than baseline beyond the threshold"""
+    # Best-of-N is the least noisy estimate of per-call cost; the rank test
+    # guards against flagging a single unlucky run
+    regressions = []
+    print(f"\n{'benchmark':<28}{'baseline µs':>14}{'current µs':>14}{'change':>10}{'z':>8}  status")
+    for name, current in results.items():
+        base = baseline.get('results', {}).get(name)
+        if not base:
+            print(f"{name:<28}{'-':>14}{current['min_us']:>14.2f}{'-':>10}{'-':>8}  NEW")
+            continue
+
+        change = current['min_us'] / base['min_us'] - 1
+        z = mann_whitney_z(current['samples_us'], base['samples_us'])
+        regressed = change > threshold and z > min_z
+        status = "❌ REGRESSION" if regressed else ("⚡ faster" if change < -threshold else "✅ ok")
+        print(f"{name:<28}{base['min_us']:>14.2f}{current['min_us']:>14.2f}{change * 100:>9.1f}%{z:>8.1f}  {status}")
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+def main():
+    """Run the hot path benchmarks"""
+    parser = argparse.ArgumentParser(description='Per-alarm hot path micro-benchmarks')
+    parser.add_argument('--warmup', type=int, default=50, help='untimed runs before measuring')
+    parser.add_argument('--repeat', type=int, default=30, help='timed samples per benchmark')
+    parser.add_argument('--number', type=int, default=100, help='corpus passes per sample')
+    parser.add_argument('--threshold', type=float, default=0.20, help='relative slowdown that counts as a regression')
+    parser.add_argument('--min-z', type=float, default=3.0, help='minimum Mann-Whitney z-score for a regression')
+    parser.add_argument('--only', action='append', help='run only the named benchmark (repeatable)')
+    parser.add_argument('--save-baseline', action='store_true', help=f'write results to {BASELINE_PATH}')
+    parser.add_argument('--output', help='also write results to this file (for benchmarks/history.py)')
+    args = parser.parse_args()
+
+    events = load_scenario_corpus()
+    benchmarks = build_benchmarks(events)
+    if args.only:
+        benchmarks = {name: func for name, func in benchmarks.items() if name in args.only}
+
+    print("⏱️  IntelliNemo Agent - Hot Path Benchmarks")
+    print(f"   Corpus: {len(events)} alarm events, {args.repeat} samples x {args.number} passes")
+
+    results = {}
+    for name, func in benchmarks.items():
+        calls_per_run = len(func())
+        results[name] = measure(func, calls_per_run, args.warmup, args.repeat, args.number)
+        print(f"   {name:<28}{results[name]['min_us']:>10.2f} µs/call (median {results[name]['median_us']:.2f})")
+
+    report = {
+        'recorded_at': datetime.utcnow().isoformat(),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': results
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n📄 Results saved: {args.output}")
+
+    if args.save_baseline:
+        with open(BASELINE_PATH, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n📄 Baseline saved: {BASELINE_PATH}")
+        return
+
+    if not os.path.exists(BASELINE_PATH):
+        print("\n⚠️  No baseline recorded yet - run with --save-baseline")
+        return
+
+    with open(BASELINE_PATH) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold, args.min_z)
+
+    if regressions:
+        print(f"\n🐌 {len(regressions)} regression(s) beyond {args.threshold * 100:.0f}%: {', '.join(regressions)}")
+        sys.exit(1)
+    print("\n✅ No regressions against baseline")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+IntelliNemo Agent - Process Pool Memory
+Compares resident memory per worker process when every process builds its
+own runbook index (baseline) against the worker's process-pool mode, where
+the parent saves the index once and children memory-map it.
+
+Usage:
+    python benchmarks/process_pool_memory.py --workers 4 --passages 20000
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'src', 'lambda'))
+import offload
+import runbooks
+
+QUERY = 'SRE remediation for MemoryUtilization alarm in AWS/ECS - Container killed due to memory limit'
+
+def synthetic_corpus(passages):
+    """Scale the runbook corpus up to a realistic passage count"""
+    corpus = []
+    for i in range(passages):
+        runbook = runbooks.RUNBOOKS[i % len(runbooks.RUNBOOKS)]
+        corpus.append(dict(runbook, id=f"{runbook['id']}-{i}", text=f"{runbook['text']} Variant {i} host i-{i:08x}."))
+    return corpus
+
+def memory_kib():
+    """VmRSS plus its private (anonymous) and shared-memory parts from /proc"""
+    fields = {}
+    with open('/proc/self/status') as f:
+        for line in f:
+            name, _, value = line.partition(':')
+            if name in ('VmRSS', 'RssAnon', 'RssFile', 'RssShmem'):
+                fields[name] = int(value.split()[0])
+    return fields
+
+def baseline_worker(passages):
+    """What each process pays without sharing: build the whole index itself"""
+    runbooks.use_index(runbooks.RunbookIndex.build(synthetic_corpus(passages)))
+    runbooks.get_index().search(QUERY)
+    return os.getpid(), memory_kib()
+
+def shared_worker(_):
+    runbooks.get_index().search(QUERY)  # touches every row of the mapped matrix
+    return os.getpid(), memory_kib()
+
+def collect(executor, func, arg, workers):
+    """Run on every worker process once and return one sample per pid"""
+    samples = {}
+    while len(samples) < workers:
+        for pid, memory in executor.map(func, [arg] * workers * 2):
+            samples[pid] = memory
+    return list(samples.values())
+
+def summarize(samples):
+    return {field: round(sum(s.get(field, 0) for s in samples) / len(samples) / 1024, 1)
+            for field in ('VmRSS', 'RssAnon', 'RssFile', 'RssShmem')}
+
+def main():
+    """Measure resident memory per worker"""
+    parser = argparse.ArgumentParser(description='Resident memory per worker: private vs shared runbook index')
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--passages', type=int, default=20000)
+    parser.add_argument('--output', help='write results to this JSON file')
+    args = parser.parse_args()
+
+    print("🧠 IntelliNemo Agent - Process Pool Memory")
+    dim = runbooks.encoder_dim()
+    print(f"   {args.workers} workers, {args.passages} passages x {dim} dims ({runbooks.RUNBOOK_ENCODER}) "
+          f"({args.passages * dim * 4 / 2 ** 20:.1f} MiB matrix)")
+
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=args.workers, mp_context=context) as executor:
+        start = time.perf_counter()
+        baseline = collect(executor, baseline_worker, args.passages, args.workers)
+        baseline_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = runbooks.RunbookIndex.build(synthetic_corpus(args.passages))
+    build_s = time.perf_counter() - start
+    offload.start_process_pool(args.workers, index=index)
+    try:
+        start = time.perf_counter()
+        shared = collect(offload._executor, shared_worker, None, args.workers)
+        shared_s = time.perf_counter() - start
+    finally:
+        offload.shutdown()
+
+    results = {
+        'workers': args.workers,
+        'passages': args.passages,
+        'baseline_mib_per_worker': summarize(baseline),
+        'shared_mib_per_worker': summarize(shared),
+        'baseline_startup_s': round(baseline_s, 2),
+        'shared_startup_s': round(build_s + shared_s, 2)
+    }
+    print(f"\n   {'MiB per worker':<16}{'VmRSS':>9}{'private':>9}{'file':>9}{'shmem':>9}")
+    for label, key in [('baseline', 'baseline_mib_per_worker'), ('shared', 'shared_mib_per_worker')]:
+        m = results[key]
+        print(f"   {label:<16}{m['VmRSS']:>9}{m['RssAnon']:>9}{m['RssFile']:>9}{m['RssShmem']:>9}")
+    saved = results['baseline_mib_per_worker']['RssAnon'] - results['shared_mib_per_worker']['RssAnon']
+    print(f"\n   Private memory saved: {saved:.1f} MiB per worker, {saved * args.workers:.1f} MiB across the pool")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n📄 Results saved: {args.output}")
+
+if __name__ == "__main__":
+    main()
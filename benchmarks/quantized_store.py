@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+IntelliNemo Agent - Quantized Embedding Store
+Builds an embedding store from a synthetic clustered corpus shaped like
+Retrieval NIM output and reports, for several re-rank candidate counts,
+recall@k and latency of the int8 scan + float re-rank against an exact
+float32 scan of the same mapped file, plus the bytes each scan touches.
+
+Usage:
+    python benchmarks/quantized_store.py --passages 5000 --dim 1024 --candidates 10,25,50,100
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'src', 'lambda'))
+import embedding_store
+
+def synthetic_corpus(passages, dim, topics, seed):
+    """Passages scattered around topic centres, so neighbours are close but not trivially separable"""
+    rng = random.Random(seed)
+    centres = [[rng.gauss(0, 1) for _ in range(dim)] for _ in range(topics)]
+    return [[c + rng.gauss(0, 3.0) for c in centres[i % topics]] for i in range(passages)], rng
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description='Recall and latency of the int8 embedding store')
+    parser.add_argument('--passages', type=int, default=5000)
+    parser.add_argument('--dim', type=int, default=1024)
+    parser.add_argument('--topics', type=int, default=100)
+    parser.add_argument('--queries', type=int, default=20)
+    parser.add_argument('--k', type=int, default=10)
+    parser.add_argument('--candidates', default='10,25,50,100')
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--output', help='write results to this JSON file')
+    args = parser.parse_args()
+
+    backend = 'numpy' if embedding_store.numpy is not None else 'pure python'
+    print("🗜️  IntelliNemo Agent - Quantized Embedding Store")
+    print(f"   {args.passages} passages x {args.dim} dims, {args.queries} queries, recall@{args.k}, scan: {backend}")
+
+    vectors, rng = synthetic_corpus(args.passages, args.dim, args.topics, args.seed)
+    path = os.path.join(tempfile.mkdtemp(), 'embeddings.bin')
+    _, build_ms = timed(embedding_store.write_store, path, vectors, [{'id': i} for i in range(args.passages)])
+    store, open_ms = timed(embedding_store.EmbeddingStore, path)
+    queries = [[v + rng.gauss(0, 3.0) for v in vectors[rng.randrange(args.passages)]] for _ in range(args.queries)]
+
+    exact, exact_ms = [], []
+    for query in queries:
+        matches, ms = timed(store.exact_search, query, args.k)
+        exact.append({m['id'] for m in matches})
+        exact_ms.append(ms)
+
+    results = {
+        'backend': backend,
+        'passages': args.passages,
+        'dim': args.dim,
+        'file_mib': round(os.path.getsize(path) / 2 ** 20, 2),
+        'build_ms': round(build_ms, 1),
+        'open_ms': round(open_ms, 3),
+        'float32': {'scanned_mib': round(args.passages * args.dim * 4 / 2 ** 20, 2),
+                    'median_ms': round(statistics.median(exact_ms), 2), f"recall@{args.k}": 1.0},
+        'int8': {}
+    }
+    print(f"\n   file {results['file_mib']} MiB, mapped in {results['open_ms']} ms")
+    print(f"   float32 exact   scans {results['float32']['scanned_mib']:7.2f} MiB   "
+          f"median {results['float32']['median_ms']:8.2f} ms   recall 1.000")
+
+    for candidates in [int(c) for c in args.candidates.split(',')]:
+        recalls, latencies = [], []
+        for query, truth in zip(queries, exact):
+            matches, ms = timed(store.approximate_search, query, args.k, candidates)
+            recalls.append(len(truth & {m['id'] for m in matches}) / args.k)
+            latencies.append(ms)
+        scanned = args.passages * args.dim + max(candidates, args.k) * args.dim * 4
+        row = {'scanned_mib': round(scanned / 2 ** 20, 2), 'median_ms': round(statistics.median(latencies), 2),
+               f"recall@{args.k}": round(statistics.mean(recalls), 3)}
+        results['int8'][str(candidates)] = row
+        print(f"   int8 + {candidates:>4} re-rank scans {row['scanned_mib']:5.2f} MiB   "
+              f"median {row['median_ms']:8.2f} ms   recall {row[f'recall@{args.k}']:.3f}")
+
+    # What the handler gets: the int8 path under NumPy, otherwise the exact scan
+    search_ms = [timed(store.search, query, args.k)[1] for query in queries]
+    results['search'] = {'path': 'int8' if embedding_store.numpy is not None else 'float32',
+                         'median_ms': round(statistics.median(search_ms), 2)}
+    print(f"\n   search() uses the {results['search']['path']} scan   median {results['search']['median_ms']:8.2f} ms")
+
+    os.remove(path)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n📄 Results saved: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+IntelliNemo Agent - NIM Transport Comparison
+Drives concurrent NIM-shaped requests through src/lambda/nim_transport.py
+against local stand-in endpoints, once over pooled HTTP/1.1 and once over
+multiplexed HTTP/2 (h2c), and reports latency, throughput, stream
+concurrency and connection counts for both.
+
+Usage:
+    python benchmarks/transport_modes.py --requests 200 --concurrency 16 --latency-ms 50
+"""
+
+import argparse
+import json
+import logging
+import os
+import socket
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'src', 'lambda'))
+import nim_transport
+
+COMPLETION = {'choices': [{'text': 'Restart the service. Confidence: 8', 'message': {'content': 'Confidence: 8'}}]}
+
+class HTTP1Endpoint:
+    """Threaded HTTP/1.1 stand-in that answers every POST after a fixed latency"""
+
+    def __init__(self, latency_s):
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                time.sleep(latency_s)
+                body = json.dumps(COMPLETION).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/v1/completions"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+class H2CEndpoint:
+    """Cleartext HTTP/2 stand-in; each stream is answered after a fixed latency"""
+
+    def __init__(self, latency_s):
+        import h2.config
+        import h2.connection
+        import h2.events
+        self.h2 = h2
+        self.latency_s = latency_s
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.bind(('127.0.0.1', 0))
+        self.sock.listen(16)
+        self.url = f"http://127.0.0.1:{self.sock.getsockname()[1]}/v1/completions"
+        self.connections = 0
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                client, _ = self.sock.accept()
+            except OSError:
+                return
+            self.connections += 1
+            threading.Thread(target=self._serve, args=(client,), daemon=True).start()
+
+    def _serve(self, client):
+        h2 = self.h2
+        conn = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False, header_encoding='utf-8'))
+        lock = threading.Lock()
+        conn.initiate_connection()
+        client.sendall(conn.data_to_send())
+
+        def respond(stream_id):
+            body = json.dumps(COMPLETION).encode()
+            with lock:
+                try:
+                    conn.send_headers(stream_id, [(':status', '200'), ('content-type', 'application/json'),
+                                                  ('content-length', str(len(body)))])
+                    conn.send_data(stream_id, body, end_stream=True)
+                    client.sendall(conn.data_to_send())
+                except Exception:
+                    pass
+
+        while True:
+            try:
+                data = client.recv(65535)
+            except OSError:
+                return
+            if not data:
+                client.close()
+                return
+            with lock:
+                for event in conn.receive_data(data):
+                    if isinstance(event, h2.events.DataReceived):
+                        conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                    elif isinstance(event, h2.events.StreamEnded):
+                        threading.Timer(self.latency_s, respond, (event.stream_id,)).start()
+                client.sendall(conn.data_to_send())
+
+    def close(self):
+        self.sock.close()
+
+def drive(url, total, concurrency):
+    """Send total requests from concurrency threads and time each one"""
+    payload = {'model': 'meta/llama-3.1-nemotron-nano-8b-v1', 'prompt': 'ping', 'max_tokens': 16}
+
+    def one(_):
+        start = time.perf_counter()
+        response = nim_transport.post(url, payload, timeout=30)
+        response.json()
+        return (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = sorted(executor.map(one, range(total)))
+    wall_s = time.perf_counter() - start
+    return {
+        'requests': total,
+        'throughput_rps': total / wall_s,
+        'latency_ms': {
+            'median': statistics.median(latencies),
+            'p95': latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+            'max': latencies[-1]
+        }
+    }
+
+def run_mode(mode, endpoint, args):
+    os.environ['NIM_HTTP2'] = 'true' if mode == 'h2' else 'false'
+    nim_transport.reset()
+    result = drive(endpoint.url, args.requests, args.concurrency)
+    stats = next(iter(nim_transport.transport_stats().values()))
+    result['transport'] = stats
+    if mode == 'h2':
+        result['transport']['server_connections'] = endpoint.connections
+    return result
+
+def main():
+    """Compare HTTP/1.1 and HTTP/2 NIM transports"""
+    parser = argparse.ArgumentParser(description='Compare pooled HTTP/1.1 and multiplexed HTTP/2 NIM transports')
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--latency-ms', type=float, default=50, help='simulated model latency per request')
+    parser.add_argument('--output', help='write results to this JSON file')
+    args = parser.parse_args()
+
+    # requests' pool discards surplus connections with a warning per request
+    logging.getLogger('urllib3').setLevel(logging.ERROR)
+
+    print("🔀 IntelliNemo Agent - NIM Transport Comparison")
+    print(f"   {args.requests} requests, concurrency {args.concurrency}, simulated latency {args.latency_ms:.0f} ms")
+
+    endpoints = {'http/1.1': HTTP1Endpoint(args.latency_ms / 1000)}
+    try:
+        endpoints['h2'] = H2CEndpoint(args.latency_ms / 1000)
+    except ImportError:
+        print("⚠️  h2 package not installed - HTTP/2 mode skipped")
+
+    results = {}
+    for mode, endpoint in endpoints.items():
+        results[mode] = run_mode(mode, endpoint, args)
+        endpoint.close()
+        r = results[mode]
+        t = r['transport']
+        connections = t['http2_connections'] if mode == 'h2' else t.get('http1_connections')
+        print(f"\n   {mode:<9} {r['throughput_rps']:8.1f} req/s   median {r['latency_ms']['median']:7.1f} ms"
+              f"   p95 {r['latency_ms']['p95']:7.1f} ms")
+        print(f"             peak concurrent streams {t['peak_concurrency']}, pooled connections {connections},"
+              f" fallbacks {t['fallbacks']}, errors {t['errors']}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n📄 Results saved: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -10,18 +10,24 @@ import time
 import concurrent.futures
 from datetime import datetime
 from typing import Dict, List, Any
+from result_sink import NDJSONResultSink, iter_records, print_report
 
 class IntelliNemoTestSuite:
     def __init__(self):
         self.lambda_client = boto3.client('lambda')
         self.function_name = 'autocloudops-agent-dev-agent'
-        self.results = {}
+        self.sink = None
         
     def run_all_tests(self):
         """Execute comprehensive test suite across all 5 domains"""
         print("🧠 IntelliNemo Agent - Comprehensive Test Suite")
         print("=" * 60)
         
+        # Stream every result to disk as it completes so a crash loses nothing
+        timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
+        self.sink = NDJSONResultSink(f'intellinemo_comprehensive_test_{timestamp}.ndjson')
+        print(f"📝 Streaming results to: {self.sink.path}")
+        
         domains = [
             ("AI Reasoning & Decision Quality", self.test_ai_reasoning),
             ("Infrastructure Automation", self.test_infrastructure),
@@ -33,9 +39,10 @@ class IntelliNemoTestSuite:
         for domain_name, test_func in domains:
             print(f"\n🎯 Testing Domain: {domain_name}")
             print("-" * 50)
-            self.results[domain_name] = test_func()
+            test_func()
             
         self.generate_comprehensive_report()
+        self.sink.close()
     
     def test_ai_reasoning(self) -> List[Dict]:
         """Domain 1: AI Reasoning & Decision Quality"""
@@ -252,6 +259,13 @@ class IntelliNemoTestSuite:
         
         return self.execute_test_batch("Industry", test_cases)
     
+    def record_result(self, domain: str, result: Dict) -> Dict:
+        """Stream a full result to the sink and return a copy without the response payload"""
+        result['domain'] = domain
+        if self.sink:
+            self.sink.write(result)
+        return {key: value for key, value in result.items() if key != 'response'}
+    
     def execute_test_batch(self, domain: str, test_cases: List[Dict]) -> List[Dict]:
         """Execute a batch of test cases for a domain"""
         results = []
@@ -274,27 +288,27 @@ class IntelliNemoTestSuite:
                     
                     # Evaluate test result
                     test_result = self.evaluate_test_result(test_case, body, execution_time)
-                    results.append(test_result)
+                    results.append(self.record_result(domain, test_result))
                     
                     status = "✅ PASS" if test_result['passed'] else "❌ FAIL"
                     print(f"     {status} ({execution_time:.2f}s)")
                     
                 else:
-                    results.append({
+                    results.append(self.record_result(domain, {
                         'test': test_case['name'],
                         'passed': False,
                         'error': result,
                         'execution_time': execution_time
-                    })
+                    }))
                     print(f"     ❌ ERROR ({execution_time:.2f}s)")
                     
             except Exception as e:
-                results.append({
+                results.append(self.record_result(domain, {
                     'test': test_case['name'],
                     'passed': False,
                     'error': str(e),
                     'execution_time': time.time() - start_time
-                })
+                }))
                 print(f"     ❌ EXCEPTION: {str(e)}")
         
         return results
@@ -388,51 +402,29 @@ class IntelliNemoTestSuite:
         return json.loads(response['Payload'].read())
     
     def generate_comprehensive_report(self):
-        """Generate comprehensive test report across all domains"""
+        """Generate comprehensive test report from the streamed results"""
         print("\n" + "=" * 80)
         print("🎯 INTELLINEMO AGENT - COMPREHENSIVE TEST REPORT")
         print("=" * 80)
         
-        total_tests = 0
-        total_passed = 0
-        domain_summary = {}
+        # Aggregates are maintained incrementally by the sink
+        report = self.sink.aggregates.summary()
+        print_report(report)
         
-        for domain, results in self.results.items():
-            domain_passed = sum(1 for r in results if r.get('passed', False))
-            domain_total = len(results)
-            
-            total_tests += domain_total
-            total_passed += domain_passed
-            
-            avg_time = sum(r.get('execution_time', 0) for r in results) / domain_total if domain_total > 0 else 0
-            
-            domain_summary[domain] = {
-                'passed': domain_passed,
-                'total': domain_total,
-                'success_rate': (domain_passed / domain_total * 100) if domain_total > 0 else 0,
-                'avg_response_time': avg_time
-            }
-            
-            print(f"\n📋 {domain}")
-            print(f"   Tests: {domain_passed}/{domain_total} PASSED ({domain_summary[domain]['success_rate']:.1f}%)")
-            print(f"   Avg Response Time: {avg_time:.2f}s")
-            
-            # Show individual test results
-            for result in results:
-                status = "✅" if result.get('passed', False) else "❌"
-                perf_status = "⚡" if result.get('performance_pass', True) else "🐌"
-                print(f"     {status}{perf_status} {result['test']} ({result.get('execution_time', 0):.2f}s)")
+        # Show individual test results by re-reading the stream
+        print(f"\n🧾 Individual Results:")
+        for result in iter_records(self.sink.path):
+            if result.get('record_type', 'test') != 'test':
+                continue
+            status = "✅" if result.get('passed', False) else "❌"
+            perf_status = "⚡" if result.get('performance_pass', True) else "🐌"
+            print(f"     {status}{perf_status} [{result['domain']}] {result['test']} ({result.get('execution_time', 0):.2f}s)")
         
-        # Overall metrics
-        overall_success_rate = (total_passed / total_tests * 100) if total_tests > 0 else 0
-        
-        print(f"\n🎯 OVERALL RESULTS:")
-        print(f"   Total Tests: {total_tests}")
-        print(f"   Passed: {total_passed}")
-        print(f"   Success Rate: {overall_success_rate:.1f}%")
+        overall_success_rate = report['overall_metrics']['success_rate']
         
         # Performance test
         load_results = self.test_concurrent_load(5)
+        self.sink.write(dict(load_results, record_type='load_test'))
         
         # Final assessment
         print(f"\n🏆 ASSESSMENT:")
@@ -445,26 +437,23 @@ class IntelliNemoTestSuite:
         else:
             print("   🔧 NEEDS WORK: Significant improvements required")
         
-        # Save detailed results
+        # Save summary; full per-test detail lives in the NDJSON stream
         timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
         report_file = f'intellinemo_comprehensive_test_{timestamp}.json'
         
         full_report = {
             'timestamp': timestamp,
-            'overall_metrics': {
-                'total_tests': total_tests,
-                'total_passed': total_passed,
-                'success_rate': overall_success_rate
-            },
-            'domain_results': domain_summary,
+            'overall_metrics': report['overall_metrics'],
+            'domain_results': report['domain_results'],
             'load_test': load_results,
-            'detailed_results': self.results
+            'detailed_results_stream': self.sink.path
         }
         
         with open(report_file, 'w') as f:
             json.dump(full_report, f, indent=2)
         
-        print(f"\n📄 Detailed report saved: {report_file}")
+        print(f"\n📄 Summary report saved: {report_file}")
+        print(f"📄 Detailed results stream: {self.sink.path}")
 
 def main():
     """Run comprehensive test suite"""
@@ -38,15 +38,13 @@ kubectl apply -f src/nim-deployments/retrieval-nim-eks.yaml
 
 # Package and deploy Lambda
 echo "📦 Packaging Lambda function..."
-mkdir -p lambda-package-eks
-cp src/lambda/eks_lambda_function.py lambda-package-eks/lambda_function.py
-pip install requests -t lambda-package-eks/
-cd lambda-package-eks && zip -r ../lambda-eks-package.zip . && cd ..
+# Handlers import their sibling modules; package-lambda.py ships them with the vendored deps
+python3 package-lambda.py --variant eks --runs 0
 
 # Update Lambda function
 aws lambda update-function-code \
   --function-name intellinemo-agent-eks \
-  --zip-file fileb://lambda-eks-package.zip
+  --zip-file fileb://dist/eks.zip
 
 echo "✅ EKS Hackathon deployment complete!"
 echo "📊 Cluster: $CLUSTER_NAME"
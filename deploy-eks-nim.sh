@@ -59,18 +59,17 @@ kubectl wait --for=condition=available --timeout=300s deployment/retrieval-nim-e
 
 # Update Lambda function
 echo "🔄 Updating Lambda function for EKS integration..."
-cd src/lambda
-zip -r ../../lambda-eks.zip eks_lambda_function.py
-cd ../..
+# Handlers import their sibling modules; package-lambda.py ships them with the vendored deps
+python3 package-lambda.py --variant eks --runs 0
 
 aws lambda update-function-code \
     --function-name intellinemo-agent \
-    --zip-file fileb://lambda-eks.zip \
+    --zip-file fileb://dist/eks.zip \
     --region ${REGION}
 
 aws lambda update-function-configuration \
     --function-name intellinemo-agent \
-    --handler eks_lambda_function.lambda_handler \
+    --handler lambda_function.lambda_handler \
     --region ${REGION}
 
 # Test deployment
@@ -92,4 +91,4 @@ echo "💰 Monthly Cost: ~$654.92"
 echo "🎯 Status: Production-ready AI-powered SRE automation"
 
 # Cleanup
-rm -f lambda-eks.zip
\ No newline at end of file
+rm -f dist/eks.zip
\ No newline at end of file
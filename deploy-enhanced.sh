@@ -29,10 +29,11 @@ aws cloudformation deploy \
 
 # Update Lambda with enhanced code
 echo "🔄 Updating Lambda function..."
-cd lambda-package && rm -f lambda_function.py && cp ../src/lambda/lambda_function.py . && zip -r ../lambda-enhanced.zip . && cd ..
+# Handlers import their sibling modules; package-lambda.py ships them with the vendored deps
+python3 package-lambda.py --variant lambda --runs 0
 aws lambda update-function-code \
     --function-name intellinemo-agent \
-    --zip-file fileb://lambda-enhanced.zip \
+    --zip-file fileb://dist/lambda.zip \
     --region ${REGION}
 
 # Update Lambda permissions for SSM
@@ -48,4 +49,4 @@ echo "aws cloudwatch put-metric-alarm --alarm-name intellinemo-test --alarm-desc
 echo ""
 echo "aws cloudwatch set-alarm-state --alarm-name intellinemo-test --state-value ALARM --state-reason 'Testing enhanced IntelliNemo'"
 
-rm -f lambda-enhanced.zip
\ No newline at end of file
+rm -f dist/lambda.zip
\ No newline at end of file
@@ -45,10 +45,8 @@ aws sagemaker wait endpoint-in-service \
 
 # Step 3: Package Lambda with SageMaker integration
 echo "Step 3: Packaging Lambda function..."
-cd lambda-package
-cp ../src/lambda/sagemaker_lambda_function.py lambda_function.py
-zip -r ../hackathon-lambda.zip . -x "*.pyc" "__pycache__/*"
-cd ..
+# Handlers import their sibling modules; package-lambda.py ships them with the vendored deps
+python3 package-lambda.py --variant sagemaker --runs 0
 
 # Step 4: Deploy/Update Lambda
 echo "Step 4: Deploying Lambda function..."
@@ -57,7 +55,7 @@ aws lambda create-function \
     --runtime python3.11 \
     --role arn:aws:iam::$ACCOUNT_ID:role/IntelliNemoLambdaRole \
     --handler lambda_function.lambda_handler \
-    --zip-file fileb://hackathon-lambda.zip \
+    --zip-file fileb://dist/sagemaker.zip \
     --timeout 300 \
     --environment Variables="{
         LLAMA_ENDPOINT=intellinemo-hackathon-endpoint,
@@ -70,7 +68,7 @@ aws lambda create-function \
 
 aws lambda update-function-code \
     --function-name intellinemo-agent-hackathon \
-    --zip-file fileb://hackathon-lambda.zip \
+    --zip-file fileb://dist/sagemaker.zip \
     --region $REGION
 
 aws lambda update-function-configuration \
@@ -85,7 +83,7 @@ aws lambda update-function-configuration \
     --region $REGION
 
 # Cleanup
-rm -f hackathon-lambda.zip
+rm -f dist/sagemaker.zip
 
 echo ""
 echo "✅ HACKATHON DEPLOYMENT COMPLETE!"
@@ -52,12 +52,8 @@ aws sagemaker wait endpoint-in-service \
 # Package and deploy Lambda with SageMaker integration
 echo ""
 echo "📦 Packaging Lambda function..."
-cd lambda-package
-cp ../src/lambda/sagemaker_lambda_function.py lambda_function.py
-
-# Create deployment package
-zip -r ../intellinemo-hackathon-lambda.zip . -x "*.pyc" "__pycache__/*"
-cd ..
+# Handlers import their sibling modules; package-lambda.py ships them with the vendored deps
+python3 package-lambda.py --variant sagemaker --runs 0
 
 # Deploy Lambda
 echo ""
@@ -67,7 +63,7 @@ aws lambda create-function \
     --runtime python3.11 \
     --role arn:aws:iam::$ACCOUNT_ID:role/IntelliNemoLambdaRole \
     --handler lambda_function.lambda_handler \
-    --zip-file fileb://intellinemo-hackathon-lambda.zip \
+    --zip-file fileb://dist/sagemaker.zip \
     --timeout 300 \
     --environment Variables="{
         LLAMA_ENDPOINT=intellinemo-hackathon-endpoint,
@@ -80,11 +76,11 @@ aws lambda create-function \
 # Update if exists
 aws lambda update-function-code \
     --function-name intellinemo-agent-hackathon \
-    --zip-file fileb://intellinemo-hackathon-lambda.zip \
+    --zip-file fileb://dist/sagemaker.zip \
     --region $REGION
 
 # Clean up
-rm -f intellinemo-hackathon-lambda.zip
+rm -f dist/sagemaker.zip
 
 echo ""
 echo "✅ HACKATHON DEPLOYMENT COMPLETE!"
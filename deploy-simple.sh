@@ -26,9 +26,8 @@ SECRET_ARN=$(aws secretsmanager create-secret \
 
 # Package Lambda function
 echo "📦 Packaging Lambda function..."
-cd src/lambda
-zip -r ../../intellinemo-lambda.zip .
-cd ../..
+# Handlers import their sibling modules; package-lambda.py ships them with the vendored deps
+python3 package-lambda.py --variant lambda --runs 0
 
 # Create Lambda function directly
 echo "⚡ Creating Lambda function..."
@@ -37,7 +36,7 @@ aws lambda create-function \
     --runtime python3.11 \
     --role arn:aws:iam::442042519962:role/lambda-execution-role \
     --handler lambda_function.lambda_handler \
-    --zip-file fileb://intellinemo-lambda.zip \
+    --zip-file fileb://dist/lambda.zip \
     --timeout 300 \
     --memory-size 512 \
     --environment Variables="{S3_BUCKET=$BUCKET_NAME,SECRETS_ARN=$SECRET_ARN,MODE=DRY_RUN}" \
@@ -49,4 +48,4 @@ echo "🔐 Secrets ARN: $SECRET_ARN"
 echo "⚡ Lambda: intellinemo-agent"
 
 # Cleanup
-rm -f intellinemo-lambda.zip
\ No newline at end of file
+rm -f dist/lambda.zip
\ No newline at end of file
@@ -27,9 +27,8 @@ echo "✅ Prerequisites check passed"
 
 # Package Lambda function
 echo "📦 Packaging Lambda function..."
-cd src/lambda
-zip -r ../../lambda-deployment.zip .
-cd ../..
+# Handlers import their sibling modules; package-lambda.py ships them with the vendored deps
+python3 package-lambda.py --variant lambda --runs 0
 
 # Deploy CloudFormation stack
 echo "☁️ Deploying CloudFormation stack..."
@@ -48,7 +47,7 @@ echo "🔄 Updating Lambda function code..."
 FUNCTION_NAME="${PROJECT_NAME}-${ENVIRONMENT}-agent"
 aws lambda update-function-code \
     --function-name ${FUNCTION_NAME} \
-    --zip-file fileb://lambda-deployment.zip \
+    --zip-file fileb://dist/lambda.zip \
     --region ${REGION}
 
 # Get stack outputs
@@ -71,4 +70,4 @@ echo "3. Check Lambda logs:"
 echo "   aws logs tail /aws/lambda/${FUNCTION_NAME} --follow"
 
 # Cleanup
-rm -f lambda-deployment.zip
\ No newline at end of file
+rm -f dist/lambda.zip
\ No newline at end of file
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+IntelliNemo Agent - Runbook Embedding Store Builder
+Embeds every runbook passage with the Retrieval NIM (nv-embedqa-e5-v5) and
+writes the int8 embedding store the SageMaker handler memory-maps to search
+with the NIM's query embedding.
+
+Usage:
+    NVIDIA_API_KEY=... python embed-runbooks.py
+    python embed-runbooks.py --sagemaker-endpoint intellinemo-hackathon-retrieval-endpoint
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'src', 'lambda'))
+import runbooks
+from embedding_store import RUNBOOK_EMBEDDINGS_PATH, EmbeddingStore, write_store
+from lambda_function import EMBEDDING_ENDPOINT
+
+BATCH_SIZE = 32
+
+def embed_with_api(texts: List[str], api_key: str) -> List[List[float]]:
+    import requests
+    response = requests.post(
+        EMBEDDING_ENDPOINT,
+        headers={'Authorization': f"Bearer {api_key}", 'Content-Type': 'application/json'},
+        json={'input': texts, 'model': 'nvidia/nv-embedqa-e5-v5', 'input_type': 'passage'},
+        timeout=60
+    )
+    response.raise_for_status()
+    return [item['embedding'] for item in sorted(response.json()['data'], key=lambda item: item['index'])]
+
+def embed_with_sagemaker(texts: List[str], endpoint: str) -> List[List[float]]:
+    import boto3
+    client = boto3.client('sagemaker-runtime')
+    response = client.invoke_endpoint(
+        EndpointName=endpoint,
+        ContentType='application/json',
+        Body=json.dumps({'input': texts, 'model': 'nv-embedqa-e5-v5', 'input_type': 'passage'})
+    )
+    data = json.loads(response['Body'].read().decode())['data']
+    return [item['embedding'] for item in sorted(data, key=lambda item: item['index'])]
+
+def build(corpus: List[Dict], embed, output: str) -> EmbeddingStore:
+    vectors = []
+    for start in range(0, len(corpus), BATCH_SIZE):
+        batch = corpus[start:start + BATCH_SIZE]
+        vectors.extend(embed([runbooks.runbook_text(runbook) for runbook in batch]))
+        print(f"   embedded {len(vectors)}/{len(corpus)} passages")
+    write_store(output, vectors, corpus)
+    return EmbeddingStore(output)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', default=RUNBOOK_EMBEDDINGS_PATH, help='store path (shipped next to the handler)')
+    parser.add_argument('--sagemaker-endpoint', help='embed through a SageMaker Retrieval NIM endpoint')
+    args = parser.parse_args()
+
+    if args.sagemaker_endpoint:
+        def embed(texts):
+            return embed_with_sagemaker(texts, args.sagemaker_endpoint)
+    else:
+        api_key = os.environ['NVIDIA_API_KEY']
+        def embed(texts):
+            return embed_with_api(texts, api_key)
+
+    print(f"🔧 Embedding {len(runbooks.RUNBOOKS)} runbook passages")
+    store = build(runbooks.RUNBOOKS, embed, args.output)
+    print(f"\n📦 {args.output}: {store.size} x {store.dim} int8 "
+          f"({os.path.getsize(args.output) / 1024:.1f} KiB with float re-rank rows)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+IntelliNemo Agent - Lambda Artifact Packager
+Builds one minimal, precompiled zip per handler variant from the single
+vendored dependency tree in lambda-package/, then measures the cold
+start of the staged artifact and publishes the numbers next to it.
+
+Usage:
+    python package-lambda.py                       # all variants into dist/
+    python package-lambda.py --variant eks --runs 20
+"""
+
+import argparse
+import compileall
+import fnmatch
+import json
+import modulefinder
+import os
+import py_compile
+import shutil
+import sys
+import zipfile
+from datetime import datetime
+
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+SRC_LAMBDA = os.path.join(REPO_ROOT, 'src', 'lambda')
+VENDOR_DIR = os.path.join(REPO_ROOT, 'lambda-package')
+
+# variant -> handler module in src/lambda; each is shipped as lambda_function.py
+HANDLERS = {
+    'lambda': 'lambda_function',
+    'sagemaker': 'sagemaker_lambda_function',
+    'eks': 'eks_lambda_function'
+}
+
+# Provided by the Lambda Python runtime and never copied into the artifact
+RUNTIME_PROVIDED = ['boto3', 'botocore', 's3transfer', 'jmespath', 'dateutil']
+
+# Reachable through shared modules (clients.get_session) but never called by the variant
+VARIANT_EXCLUDES = {
+    'sagemaker': ['requests']
+}
+
+# Vendored packages a local module imports lazily; a build that reaches the
+# module without them would only fail once the code path is switched on
+VENDOR_REQUIRED = {
+    'nim_transport': ['h2', 'hpack', 'hyperframe']
+}
+
+# Build artifacts in src/lambda shipped next to the handler when they exist
+VARIANT_DATA = {
+    'lambda': ['decision_catalog.json'],
+    'sagemaker': ['runbook_embeddings.bin']
+}
+
+# Paths inside vendored packages that no handler code path imports
+PRUNE_PATTERNS = [
+    '*/__pycache__',
+    '*.dist-info',
+    '*-darwin.so',
+    'urllib3/contrib/emscripten',
+    'urllib3/contrib/pyopenssl.py',
+    'urllib3/contrib/socks.py',
+    'charset_normalizer/cli',
+    'charset_normalizer/__main__.py',
+    'certifi/__main__.py',
+    '*/py.typed'
+]
+
+def vendored_packages():
+    """Top-level importable names available in the vendor tree"""
+    names = set()
+    for entry in os.listdir(VENDOR_DIR):
+        path = os.path.join(VENDOR_DIR, entry)
+        if os.path.isdir(path) and os.path.exists(os.path.join(path, '__init__.py')):
+            names.add(entry)
+    return names
+
+def find_dependencies(module_name, drop_charset_detection, excludes=()):
+    """Local modules and vendored top-level packages reachable from a handler"""
+    finder = modulefinder.ModuleFinder(path=[SRC_LAMBDA, VENDOR_DIR] + sys.path[1:],
+                                       excludes=RUNTIME_PROVIDED + list(excludes))
+    finder.run_script(os.path.join(SRC_LAMBDA, f'{module_name}.py'))
+
+    local_modules = set()
+    packages = set()
+    vendored = vendored_packages()
+    for name, module in finder.modules.items():
+        filename = getattr(module, '__file__', None) or ''
+        if filename.startswith(SRC_LAMBDA + os.sep) and name != '__main__':
+            local_modules.add(name)
+        if name.split('.')[0] in vendored:
+            packages.add(name.split('.')[0])
+
+    if drop_charset_detection:
+        # requests only needs a charset detector for Response.text without a
+        # declared encoding; the handlers read JSON bodies
+        packages.discard('charset_normalizer')
+        packages.discard('chardet')
+    return sorted(local_modules), sorted(packages)
+
+def is_pruned(relative_path):
+    return any(fnmatch.fnmatch(relative_path, pattern) for pattern in PRUNE_PATTERNS)
+
+def copy_package(name, staging_dir):
+    """Copy a vendored package into the staging directory, skipping pruned paths"""
+    for root, dirs, files in os.walk(os.path.join(VENDOR_DIR, name)):
+        relative_root = os.path.relpath(root, VENDOR_DIR)
+        dirs[:] = [d for d in dirs if not is_pruned(os.path.join(relative_root, d))]
+        for filename in files:
+            relative_path = os.path.join(relative_root, filename)
+            if is_pruned(relative_path) or filename.endswith('.pyc'):
+                continue
+            os.makedirs(os.path.join(staging_dir, relative_root), exist_ok=True)
+            shutil.copy2(os.path.join(VENDOR_DIR, relative_path), os.path.join(staging_dir, relative_path))
+
+def build_variant(variant, output_dir, drop_charset_detection):
+    """Stage, precompile and zip one handler variant"""
+    module_name = HANDLERS[variant]
+    staging_dir = os.path.join(output_dir, variant)
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    os.makedirs(staging_dir)
+
+    local_modules, packages = find_dependencies(module_name, drop_charset_detection, VARIANT_EXCLUDES.get(variant, ()))
+    for name in local_modules:
+        missing = [package for package in VENDOR_REQUIRED.get(name, []) if package not in packages]
+        if missing:
+            raise SystemExit(f"{variant}: {name} needs {', '.join(missing)} in {VENDOR_DIR} "
+                             f"(pip install -r requirements.txt -t lambda-package)")
+    shutil.copy2(os.path.join(SRC_LAMBDA, f'{module_name}.py'), os.path.join(staging_dir, 'lambda_function.py'))
+    for name in local_modules:
+        if name != module_name:
+            shutil.copy2(os.path.join(SRC_LAMBDA, f'{name}.py'), os.path.join(staging_dir, f'{name}.py'))
+    for name in packages:
+        copy_package(name, staging_dir)
+    for name in VARIANT_DATA.get(variant, []):
+        if os.path.exists(os.path.join(SRC_LAMBDA, name)):
+            shutil.copy2(os.path.join(SRC_LAMBDA, name), os.path.join(staging_dir, name))
+
+    # Unchecked hash-based pycs are used without stat-ing the source, and the
+    # Lambda filesystem is read-only so nothing would be cached at runtime
+    compileall.compile_dir(staging_dir, quiet=1,
+                           invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH)
+
+    zip_path = os.path.join(output_dir, f'{variant}.zip')
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for root, _, files in os.walk(staging_dir):
+            for filename in sorted(files):
+                path = os.path.join(root, filename)
+                archive.write(path, os.path.relpath(path, staging_dir))
+
+    return {
+        'variant': variant,
+        'handler_module': module_name,
+        'local_modules': local_modules,
+        'vendored_packages': packages,
+        'zip_path': zip_path,
+        'zip_bytes': os.path.getsize(zip_path),
+        'staging_dir': staging_dir
+    }
+
+def measure_artifact(staging_dir, runs):
+    """Cold start distribution of the staged artifact, using the benchmark harness"""
+    sys.path.insert(0, os.path.join(REPO_ROOT, 'benchmarks'))
+    import cold_start
+
+    with open(os.path.join(REPO_ROOT, 'test-payload.json')) as f:
+        event = json.load(f)
+
+    timings = [cold_start.run_once('lambda_function', [staging_dir], event, False, False) for _ in range(runs)]
+    traced = [cold_start.run_once('lambda_function', [staging_dir], event, True, False) for _ in range(runs)]
+    packages = {}
+    for run in traced:
+        for package, ms in cold_start.group_imports(run['imports']).items():
+            packages.setdefault(package, []).append(ms)
+
+    return {
+        'runs': runs,
+        'python': sys.version.split()[0],
+        'init_ms': cold_start.distribution([t['init_ms'] for t in timings]),
+        'first_invocation_ms': cold_start.distribution([t['first_invocation_ms'] for t in timings]),
+        'process_ms': cold_start.distribution([t['process_ms'] for t in timings]),
+        'import_ms_by_package': {
+            name: cold_start.distribution(values + [0.0] * (runs - len(values)))
+            for name, values in sorted(packages.items(), key=lambda item: -max(item[1]))[:15]
+        }
+    }
+
+def main():
+    """Build Lambda artifacts"""
+    parser = argparse.ArgumentParser(description='Build minimal precompiled Lambda artifacts')
+    parser.add_argument('--variant', action='append', choices=sorted(HANDLERS), help='variant to build (repeatable, default all)')
+    parser.add_argument('--output-dir', default=os.path.join(REPO_ROOT, 'dist'))
+    parser.add_argument('--runs', type=int, default=10, help='cold start runs measured per artifact (0 to skip)')
+    parser.add_argument('--drop-charset-detection', action='store_true',
+                        help='omit charset_normalizer; Response.text then assumes UTF-8 when no charset is declared')
+    args = parser.parse_args()
+
+    print("📦 IntelliNemo Agent - Lambda Artifact Packager")
+    print(f"   Bytecode compiled for Python {sys.version.split()[0]} - build with the Lambda runtime's version")
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    for variant in args.variant or sorted(HANDLERS):
+        artifact = build_variant(variant, args.output_dir, args.drop_charset_detection)
+        print(f"\n✅ {variant}: {artifact['zip_path']} ({artifact['zip_bytes'] / 1024:.0f} KiB)")
+        print(f"   Vendored: {', '.join(artifact['vendored_packages']) or 'none'}")
+
+        if args.runs:
+            artifact['cold_start'] = measure_artifact(artifact['staging_dir'], args.runs)
+            init = artifact['cold_start']['init_ms']
+            first = artifact['cold_start']['first_invocation_ms']
+            print(f"   Import + init: median {init['median']:.1f} ms, p90 {init['p90']:.1f} ms")
+            print(f"   First invocation: median {first['median']:.1f} ms, p90 {first['p90']:.1f} ms")
+
+        artifact['built_at'] = datetime.utcnow().isoformat()
+        metrics_path = os.path.join(args.output_dir, f'{variant}.metrics.json')
+        with open(metrics_path, 'w') as f:
+            json.dump(artifact, f, indent=2)
+        print(f"   Metrics: {metrics_path}")
+
+if __name__ == "__main__":
+    main()
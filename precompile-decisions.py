@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+IntelliNemo Agent - Decision Precompiler
+Runs the reasoning pipeline once per alarm template in the known catalog
+(every alarm event in the scenario and domain suites) and writes the
+decisions to a lookup artifact versioned with the prompt and model. The
+handler loads the artifact at init and answers matching alarms without a
+model call.
+
+Usage:
+    NVIDIA_API_KEY=... python precompile-decisions.py
+    python precompile-decisions.py --secrets-arn arn:aws:secretsmanager:...
+    python precompile-decisions.py --report        # coverage and staleness only
+"""
+
+import argparse
+import ast
+import json
+import os
+import sys
+import time
+from typing import Dict, List, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'src', 'lambda'))
+import lambda_function
+from decision_catalog import ARTIFACT_FORMAT, DECISION_CATALOG_PATH, load_catalog, prompt_version, template_key
+
+# Files whose alarm event literals make up the catalog
+CATALOG_SOURCES = [
+    'critical-shutdown-scenarios.py',
+    'test-scenarios.py',
+    'domain-specific-validators.py',
+    'comprehensive-test-suite.py',
+    os.path.join('tests', 'test_domains.py')
+]
+
+def alarm_literals(path: str) -> List[Dict]:
+    """Every dict literal in a Python file that looks like a CloudWatch ALARM event"""
+    with open(path) as f:
+        tree = ast.parse(f.read(), path)
+    events = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Dict):
+            continue
+        try:
+            value = ast.literal_eval(node)
+        except ValueError:
+            continue
+        detail = value.get('detail') if isinstance(value, dict) else None
+        if isinstance(detail, dict) and detail.get('alarmName') and \
+                detail.get('state', {}).get('value', 'ALARM') == 'ALARM':
+            events.append(value)
+    return events
+
+def catalog_templates(sources: List[str]) -> Dict[str, Tuple[Dict, str]]:
+    """template key -> (alarm_data of its first example, source file)"""
+    templates = {}
+    for source in sources:
+        path = os.path.join(REPO_ROOT, source)
+        if not os.path.exists(path):
+            print(f"⚠️  Catalog source missing: {source}")
+            continue
+        for event in alarm_literals(path):
+            alarm_data = lambda_function.extract_alarm_data(event)
+            templates.setdefault(template_key(alarm_data), (alarm_data, source))
+    return templates
+
+def nim_credentials(secrets_arn: str) -> Dict:
+    if secrets_arn:
+        import boto3
+        return lambda_function.get_nim_credentials(boto3.client('secretsmanager'), secrets_arn)
+    return {
+        'api_key': os.environ['NVIDIA_API_KEY'],
+        'llama_endpoint': lambda_function.LLAMA_ENDPOINT,
+        'embedding_endpoint': lambda_function.EMBEDDING_ENDPOINT
+    }
+
+def build(templates: Dict[str, Tuple[Dict, str]], nim_config: Dict, output: str) -> Dict:
+    """Reason about each template and write the artifact; fallback answers are left out"""
+    decisions = {}
+    for key, (alarm_data, source) in sorted(templates.items()):
+        decision = lambda_function.process_with_nim(alarm_data, nim_config)
+        if decision.get('model_used'):
+            decisions[key] = {'decision': decision, 'alarm': alarm_data['alarm_name'], 'source': source}
+            print(f"   ✅ {key}")
+        else:
+            print(f"   ❌ {key}: {decision.get('reasoning')}")
+
+    artifact = {
+        'version': {
+            'format': ARTIFACT_FORMAT,
+            'prompt': prompt_version(lambda_function.REASONING_PROMPT),
+            'model': lambda_function.LLAMA_MODEL
+        },
+        'built_at': time.time(),
+        'templates': decisions
+    }
+    temp_path = f"{output}.tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(artifact, f, separators=(',', ':'), sort_keys=True)
+    os.replace(temp_path, output)
+    return artifact
+
+def report(templates: Dict[str, Tuple[Dict, str]], path: str) -> Dict:
+    """Template coverage of the artifact at path, and whether the handler would use it"""
+    built = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            built = json.load(f).get('templates', {})
+    status = load_catalog(path, lambda_function.REASONING_PROMPT, lambda_function.LLAMA_MODEL).status()
+    covered = [key for key in templates if key in built]
+    return {
+        'artifact': path,
+        'catalog_templates': len(templates),
+        'covered': len(covered),
+        'coverage': round(len(covered) / len(templates), 3) if templates else 0.0,
+        'missing': sorted(key for key in templates if key not in built),
+        'orphaned': sorted(key for key in built if key not in templates),
+        'age_days': status['age_days'],
+        'stale': status['stale'] or not os.path.exists(path),
+        'stale_reason': status['stale_reason'] if os.path.exists(path) else 'not built'
+    }
+
+def print_report(summary: Dict):
+    print(f"\n📦 Decision catalog: {summary['artifact']}")
+    print(f"   Coverage: {summary['covered']}/{summary['catalog_templates']} templates ({summary['coverage']:.0%})")
+    for key in summary['missing']:
+        print(f"   missing:  {key}")
+    for key in summary['orphaned']:
+        print(f"   orphaned: {key}")
+    if summary['stale']:
+        print(f"   ⚠️  Stale: {summary['stale_reason']}")
+    elif summary['age_days'] is not None:
+        print(f"   Built {summary['age_days']} days ago for the current prompt and model")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', default=DECISION_CATALOG_PATH, help='artifact path (shipped next to the handler)')
+    parser.add_argument('--secrets-arn', help='read the NIM API key from Secrets Manager instead of NVIDIA_API_KEY')
+    parser.add_argument('--report', action='store_true', help='report coverage and staleness without building')
+    parser.add_argument('--json', action='store_true', help='print the report as JSON')
+    args = parser.parse_args()
+
+    templates = catalog_templates(CATALOG_SOURCES)
+    if not args.report:
+        print(f"🔧 Precompiling {len(templates)} alarm templates")
+        build(templates, nim_credentials(args.secrets_arn), args.output)
+
+    summary = report(templates, args.output)
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print_report(summary)
+    sys.exit(1 if summary['stale'] else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+IntelliNemo Agent - Streaming Result Sink
+Append-only NDJSON test results with incrementally maintained aggregates
+"""
+
+import json
+import os
+import sys
+from typing import Dict, Iterator
+
+# Upper bounds (seconds) of the latency histogram buckets; slower results land in the overflow bucket
+LATENCY_BUCKETS = (0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 30.0)
+
+def bucket_label(index: int) -> str:
+    if index < len(LATENCY_BUCKETS):
+        return f"<={LATENCY_BUCKETS[index]:g}s"
+    return f">{LATENCY_BUCKETS[-1]:g}s"
+
+class RunningAggregates:
+    """Pass rate and latency histogram per domain, updated one record at a time"""
+
+    def __init__(self):
+        self.domains = {}
+
+    def add(self, record: Dict):
+        """Fold a single test record into the running aggregates"""
+        if record.get('record_type', 'test') != 'test':
+            return
+
+        domain = record.get('domain', 'general')
+        if domain not in self.domains:
+            self.domains[domain] = {'total': 0, 'passed': 0, 'latency_sum': 0.0, 'histogram': [0] * (len(LATENCY_BUCKETS) + 1)}
+        stats = self.domains[domain]
+
+        latency = record.get('execution_time', 0) or 0
+        stats['total'] += 1
+        stats['passed'] += 1 if record.get('passed', False) else 0
+        stats['latency_sum'] += latency
+
+        index = 0
+        while index < len(LATENCY_BUCKETS) and latency > LATENCY_BUCKETS[index]:
+            index += 1
+        stats['histogram'][index] += 1
+
+    def summary(self) -> Dict:
+        """Render the current aggregates as a report dictionary"""
+        domain_results = {}
+        total_tests = 0
+        total_passed = 0
+
+        for domain, stats in self.domains.items():
+            total_tests += stats['total']
+            total_passed += stats['passed']
+            domain_results[domain] = {
+                'passed': stats['passed'],
+                'total': stats['total'],
+                'success_rate': stats['passed'] / stats['total'] * 100,
+                'avg_response_time': stats['latency_sum'] / stats['total'],
+                'latency_histogram': {bucket_label(i): count for i, count in enumerate(stats['histogram'])}
+            }
+
+        return {
+            'overall_metrics': {
+                'total_tests': total_tests,
+                'total_passed': total_passed,
+                'success_rate': (total_passed / total_tests * 100) if total_tests > 0 else 0
+            },
+            'domain_results': domain_results
+        }
+
+class NDJSONResultSink:
+    """Appends each result to an NDJSON file as soon as it completes"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.aggregates = RunningAggregates()
+        self._file = open(path, 'a')
+
+    def write(self, record: Dict):
+        """Persist one result and update the running aggregates"""
+        self._file.write(json.dumps(record, default=str) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.aggregates.add(record)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+def iter_records(path: str) -> Iterator[Dict]:
+    """Stream records back from an NDJSON results file"""
+    with open(path) as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                # A crash mid-write leaves at most one truncated trailing line
+                continue
+
+def render_report(path: str) -> Dict:
+    """Rebuild the aggregate report from a results stream in constant memory"""
+    aggregates = RunningAggregates()
+    for record in iter_records(path):
+        aggregates.add(record)
+    return aggregates.summary()
+
+def print_report(report: Dict):
+    """Print an aggregate report produced by RunningAggregates.summary"""
+    for domain, stats in report['domain_results'].items():
+        print(f"\n📋 {domain}")
+        print(f"   Tests: {stats['passed']}/{stats['total']} PASSED ({stats['success_rate']:.1f}%)")
+        print(f"   Avg Response Time: {stats['avg_response_time']:.2f}s")
+        histogram = ', '.join(f"{label}: {count}" for label, count in stats['latency_histogram'].items() if count)
+        print(f"   Latency: {histogram}")
+
+    overall = report['overall_metrics']
+    print(f"\n🎯 OVERALL RESULTS:")
+    print(f"   Total Tests: {overall['total_tests']}")
+    print(f"   Passed: {overall['total_passed']}")
+    print(f"   Success Rate: {overall['success_rate']:.1f}%")
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python result_sink.py <results.ndjson>")
+        sys.exit(1)
+    print_report(render_report(sys.argv[1]))
@@ -0,0 +1,152 @@
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from metrics import emit_metrics
+
+# Adaptive concurrency limits for outbound model calls, one per endpoint,
+# in the style of the gradient limiter: the limit grows by about
+# sqrt(limit) per sample while latency stays near its long-run baseline,
+# shrinks in proportion once short-term latency inflates past tolerance,
+# and halves (at most once per round trip) on 429/503 or a timeout.
+
+OVERLOAD_STATUSES = (429, 503)
+OVERLOAD_ERROR_CODES = ('ThrottlingException', 'TooManyRequestsException', 'ServiceUnavailable')
+INITIAL_LIMIT = int(os.environ.get('MODEL_LIMIT_INITIAL', '4'))
+MAX_LIMIT = int(os.environ.get('MODEL_LIMIT_MAX', '64'))
+# Coarse clocks and instant transports can time a call at 0ms
+MIN_RTT_MS = 0.001
+
+class LimitExceeded(Exception):
+    """No call slot became free under the adaptive limit before the timeout"""
+
+def is_overload_error(error):
+    """Timeouts, throttling errors and 429/503 responses raised as exceptions"""
+    if isinstance(error, TimeoutError) or 'Timeout' in type(error).__name__:
+        return True
+    response = getattr(error, 'response', None)
+    if isinstance(response, dict):
+        # botocore ClientError
+        if response.get('Error', {}).get('Code') in OVERLOAD_ERROR_CODES:
+            return True
+        return response.get('ResponseMetadata', {}).get('HTTPStatusCode') in OVERLOAD_STATUSES
+    return getattr(response, 'status_code', None) in OVERLOAD_STATUSES
+
+class _Sample:
+    def __init__(self):
+        self.overloaded = False
+
+    def status(self, status_code):
+        """Record the response status of the call"""
+        self.overloaded = status_code in OVERLOAD_STATUSES
+
+class AdaptiveLimiter:
+    """Concurrency limit for one endpoint that follows its measured capacity"""
+
+    def __init__(self, initial=INITIAL_LIMIT, min_limit=1, max_limit=MAX_LIMIT, smoothing=0.2, tolerance=1.5,
+                 long_window=100, backoff=0.5):
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.smoothing = smoothing
+        self.tolerance = tolerance
+        self.long_alpha = 2.0 / (long_window + 1)
+        self.backoff = backoff
+        self.in_flight = 0
+        self.short_rtt = 0.0
+        self.long_rtt = 0.0
+        self.last_backoff = 0.0
+        self.stats = {'samples': 0, 'overloads': 0, 'rejected': 0, 'peak_limit': float(initial)}
+        self._cond = threading.Condition()
+
+    def acquire(self, timeout=None):
+        """Wait until a call fits under the limit; returns the in-flight count it started with"""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self.in_flight < int(self.limit), timeout):
+                self.stats['rejected'] += 1
+                raise LimitExceeded(f"{self.in_flight} calls in flight at limit {int(self.limit)}")
+            self.in_flight += 1
+            return self.in_flight
+
+    def release(self, rtt_ms, in_flight_at_start, overloaded=False, sample=True):
+        """Finish a call and adjust the limit from its latency or overload signal"""
+        with self._cond:
+            self.in_flight -= 1
+            if overloaded:
+                self.stats['overloads'] += 1
+                now = time.monotonic()
+                if now - self.last_backoff >= self.short_rtt / 1000:
+                    self.limit = max(self.min_limit, self.limit * self.backoff)
+                    self.last_backoff = now
+            elif sample:
+                self._update(rtt_ms, in_flight_at_start)
+            self._cond.notify_all()
+
+    def _update(self, rtt_ms, in_flight_at_start):
+        self.stats['samples'] += 1
+        rtt_ms = max(rtt_ms, MIN_RTT_MS)
+        if not self.long_rtt:
+            self.short_rtt = self.long_rtt = rtt_ms
+        else:
+            self.short_rtt += 0.3 * (rtt_ms - self.short_rtt)
+            self.long_rtt += self.long_alpha * (rtt_ms - self.long_rtt)
+            # The baseline follows latency up slowly but down at once
+            self.long_rtt = min(self.long_rtt, self.short_rtt)
+        # Only grow when the limit was actually being used
+        if in_flight_at_start < self.limit / 2:
+            return
+        gradient = max(0.5, min(1.0, self.tolerance * self.long_rtt / self.short_rtt))
+        if gradient < 1.0:
+            self.limit *= 1 - self.smoothing * (1 - gradient)
+        else:
+            # Additive increase: about one more per round of limit calls
+            self.limit += 1.0 / self.limit
+        self.limit = max(self.min_limit, min(self.max_limit, self.limit))
+        self.stats['peak_limit'] = max(self.stats['peak_limit'], self.limit)
+
+    @contextmanager
+    def track(self, timeout=None):
+        """Hold a slot for one call; the yielded sample takes the response status"""
+        in_flight = self.acquire(timeout)
+        sample = _Sample()
+        start = time.perf_counter()
+        try:
+            yield sample
+        except Exception as e:
+            overloaded = is_overload_error(e)
+            self.release((time.perf_counter() - start) * 1000, in_flight, overloaded=overloaded, sample=False)
+            raise
+        self.release((time.perf_counter() - start) * 1000, in_flight, overloaded=sample.overloaded)
+
+    def snapshot(self):
+        with self._cond:
+            return dict(self.stats, limit=round(self.limit, 2), in_flight=self.in_flight,
+                        short_rtt_ms=round(self.short_rtt, 1), long_rtt_ms=round(self.long_rtt, 1))
+
+_limiters = {}
+_lock = threading.Lock()
+
+def get_limiter(target):
+    """The limiter for an endpoint origin or SageMaker endpoint name"""
+    with _lock:
+        limiter = _limiters.get(target)
+        if limiter is None:
+            limiter = _limiters[target] = AdaptiveLimiter()
+        return limiter
+
+def limiter_stats():
+    with _lock:
+        limiters = dict(_limiters)
+    return {target: limiter.snapshot() for target, limiter in limiters.items()}
+
+def emit_limit_metrics():
+    """Emit each endpoint's current limit and in-flight calls"""
+    for target, stats in limiter_stats().items():
+        emit_metrics({'ModelConcurrencyLimit': stats['limit'], 'ModelInFlight': stats['in_flight']},
+                     dimensions={'Endpoint': target})
+
+def reset():
+    with _lock:
+        _limiters.clear()
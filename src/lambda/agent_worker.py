@@ -0,0 +1,489 @@
+#!/usr/bin/env python3
+"""
+IntelliNemo Agent - Queue Worker
+Long-running alternative to one Lambda invocation per alarm: consumes
+alarm events from SQS (or a local directory queue) and runs them through
+the same handler pipeline on a pool of worker threads, so clients,
+connections and caches are shared across alarms. Fetched alarms wait in
+a severity-aware priority scheduler rather than in arrival order.
+
+Usage:
+    python agent_worker.py --queue-url https://sqs.us-east-1.amazonaws.com/123456789012/intellinemo-alarms
+    python agent_worker.py --queue-dir /tmp/intellinemo-queue --handler lambda --concurrency 8
+    python agent_worker.py --queue-url ... --handler sagemaker --processes 4
+    python agent_worker.py --batch alarms.ndjson --handler lambda
+"""
+
+import argparse
+import importlib
+import json
+import os
+import signal
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import offload
+from adaptive_limiter import emit_limit_metrics, limiter_stats
+from bulkhead import bulkhead_stats, emit_bulkhead_metrics
+from clients import get_client
+from load_shedding import get_shedder, shedding_stats
+from pending import add_cancel_hook
+from scheduler import PriorityScheduler
+from single_flight import flight_stats
+
+HANDLER_MODULES = {
+    'lambda': 'lambda_function',
+    'sagemaker': 'sagemaker_lambda_function',
+    'eks': 'eks_lambda_function'
+}
+
+# Seconds between bulkhead and concurrency limit metric exports
+METRICS_INTERVAL = 60.0
+
+class SQSQueue:
+    """Alarm events delivered to SQS by an EventBridge rule target"""
+
+    def __init__(self, queue_url, sqs_client=None, wait_seconds=10, visibility_timeout=120):
+        self.queue_url = queue_url
+        self.sqs = sqs_client or get_client('sqs')
+        self.wait_seconds = wait_seconds
+        self.visibility_timeout = visibility_timeout
+        self.last_message_age = 0.0
+
+    def receive(self, max_messages):
+        response = self.sqs.receive_message(
+            QueueUrl=self.queue_url,
+            MaxNumberOfMessages=min(max_messages, 10),
+            WaitTimeSeconds=self.wait_seconds,
+            VisibilityTimeout=self.visibility_timeout,
+            AttributeNames=['SentTimestamp']
+        )
+        messages = []
+        for raw in response.get('Messages', []):
+            sent_at = int(raw.get('Attributes', {}).get('SentTimestamp', time.time() * 1000)) / 1000
+            self.last_message_age = max(time.time() - sent_at, 0.0)
+            messages.append({
+                'id': raw['MessageId'],
+                'event': json.loads(raw['Body']),
+                'enqueued_at': sent_at,
+                'receipt': raw['ReceiptHandle']
+            })
+        return messages
+
+    def ack(self, message):
+        self.sqs.delete_message(QueueUrl=self.queue_url, ReceiptHandle=message['receipt'])
+
+    def release(self, message):
+        """Make the message visible again straight away"""
+        self.sqs.change_message_visibility(QueueUrl=self.queue_url, ReceiptHandle=message['receipt'],
+                                           VisibilityTimeout=0)
+
+    def lag(self):
+        attributes = self.sqs.get_queue_attributes(
+            QueueUrl=self.queue_url,
+            AttributeNames=['ApproximateNumberOfMessages', 'ApproximateNumberOfMessagesNotVisible']
+        )['Attributes']
+        return {
+            'depth': int(attributes['ApproximateNumberOfMessages']),
+            'in_flight': int(attributes['ApproximateNumberOfMessagesNotVisible']),
+            'oldest_age_s': round(self.last_message_age, 3)
+        }
+
+class DirectoryQueue:
+    """
+    Local stand-in for SQS: one JSON event per file in pending/, claimed
+    by an atomic rename into processing/
+    """
+
+    def __init__(self, path, wait_seconds=1.0):
+        self.path = path
+        self.wait_seconds = wait_seconds
+        for state in ('pending', 'processing', 'done', 'failed'):
+            os.makedirs(os.path.join(path, state), exist_ok=True)
+
+    def enqueue(self, event):
+        message_id = f"{time.time():.6f}-{uuid.uuid4().hex[:8]}"
+        temp_path = os.path.join(self.path, f".{message_id}.tmp")
+        with open(temp_path, 'w') as f:
+            json.dump(event, f)
+        os.rename(temp_path, os.path.join(self.path, 'pending', f"{message_id}.json"))
+        return message_id
+
+    def _pending(self):
+        return sorted(os.listdir(os.path.join(self.path, 'pending')))
+
+    def receive(self, max_messages):
+        deadline = time.monotonic() + self.wait_seconds
+        while True:
+            messages = []
+            for filename in self._pending()[:max_messages]:
+                pending_path = os.path.join(self.path, 'pending', filename)
+                processing_path = os.path.join(self.path, 'processing', filename)
+                try:
+                    enqueued_at = os.path.getmtime(pending_path)
+                    os.rename(pending_path, processing_path)
+                except FileNotFoundError:
+                    continue  # claimed by another worker
+                with open(processing_path) as f:
+                    event = json.load(f)
+                messages.append({'id': filename[:-len('.json')], 'event': event,
+                                 'enqueued_at': enqueued_at, 'receipt': filename})
+            if messages or time.monotonic() >= deadline:
+                return messages
+            time.sleep(0.05)
+
+    def ack(self, message):
+        os.rename(os.path.join(self.path, 'processing', message['receipt']),
+                  os.path.join(self.path, 'done', message['receipt']))
+
+    def release(self, message):
+        os.rename(os.path.join(self.path, 'processing', message['receipt']),
+                  os.path.join(self.path, 'pending', message['receipt']))
+
+    def fail(self, message):
+        os.rename(os.path.join(self.path, 'processing', message['receipt']),
+                  os.path.join(self.path, 'failed', message['receipt']))
+
+    def lag(self):
+        pending = self._pending()
+        oldest_age = 0.0
+        if pending:
+            try:
+                oldest_age = time.time() - os.path.getmtime(os.path.join(self.path, 'pending', pending[0]))
+            except FileNotFoundError:
+                pass
+        return {
+            'depth': len(pending),
+            'in_flight': len(os.listdir(os.path.join(self.path, 'processing'))),
+            'oldest_age_s': round(max(oldest_age, 0.0), 3)
+        }
+
+class ListQueue:
+    """Batch source: a fixed list of events, processed once each"""
+
+    def __init__(self, events):
+        self.events = list(events)
+        self.results = {}
+
+    def receive(self, max_messages):
+        messages = []
+        while self.events and len(messages) < max_messages:
+            index = len(self.results) + len(messages)
+            messages.append({'id': str(index), 'event': self.events.pop(0), 'enqueued_at': time.time(), 'receipt': index})
+        for message in messages:
+            self.results[message['id']] = None
+        return messages
+
+    def ack(self, message):
+        self.results[message['id']] = 'processed'
+
+    def fail(self, message):
+        self.results[message['id']] = 'failed'
+
+    def release(self, message):
+        self.results[message['id']] = 'released'
+
+    def lag(self):
+        return {'depth': len(self.events), 'in_flight': 0, 'oldest_age_s': 0.0}
+
+def load_batch(path):
+    """Events from a JSON list or NDJSON file"""
+    with open(path) as f:
+        content = f.read()
+    if content.lstrip().startswith('['):
+        return json.loads(content)
+    return [json.loads(line) for line in content.splitlines() if line.strip()]
+
+class AgentWorker:
+    """Fetches alarms from a queue and runs the handler on a thread pool"""
+
+    def __init__(self, source, handler, concurrency=4, prefetch=None, drain_timeout=30.0, stall_seconds=300.0,
+                 scheduler=None):
+        self.source = source
+        self.handler = handler
+        self.concurrency = concurrency
+        self.prefetch = prefetch or concurrency * 2
+        self.drain_timeout = drain_timeout
+        self.stall_seconds = stall_seconds
+
+        self.pending = scheduler or PriorityScheduler()
+        self.stopping = threading.Event()
+        self.lock = threading.Lock()
+        self.threads = []
+        self.started = False
+        self.heartbeat = time.monotonic()
+        self.last_completed = time.monotonic()
+        self.stats = {'processed': 0, 'failed': 0, 'released': 0, 'cancelled': 0, 'in_flight': 0,
+                      'queue_wait_ms_total': 0.0, 'processing_ms_total': 0.0}
+
+    def submit(self, message):
+        message['received_at'] = time.time()
+        self.pending.put(message)
+
+    def next_message(self, timeout):
+        return self.pending.get(timeout=timeout)
+
+    def backlog(self):
+        return self.pending.qsize()
+
+    def process(self, message):
+        """Run one alarm through the handler pipeline and settle it on the queue"""
+        started = time.time()
+        with self.lock:
+            self.stats['in_flight'] += 1
+            self.stats['queue_wait_ms_total'] += (started - message['enqueued_at']) * 1000
+        ok = False
+        try:
+            response = self.handler(message['event'], None)
+            ok = isinstance(response, dict) and response.get('statusCode', 500) < 500
+        except Exception as e:
+            print(f"Error processing message {message['id']}: {str(e)}")
+
+        try:
+            if message.get('reanalysis'):
+                pass  # re-analysis of a shed alarm; nothing to settle on the source
+            elif ok:
+                self.source.ack(message)
+            elif hasattr(self.source, 'fail'):
+                self.source.fail(message)
+            # SQS: leave failed messages to the visibility timeout and redrive policy
+        except Exception as e:
+            print(f"Error settling message {message['id']}: {str(e)}")
+
+        with self.lock:
+            self.stats['in_flight'] -= 1
+            self.stats['processed' if ok else 'failed'] += 1
+            self.stats['processing_ms_total'] += (time.time() - started) * 1000
+            self.last_completed = time.monotonic()
+
+    def _consume(self):
+        while True:
+            message = self.next_message(timeout=0.2)
+            if message is None:
+                if self.stopping.is_set():
+                    return
+                continue
+            if self.stopping.is_set():
+                self._release(message)
+                continue
+            self.process(message)
+
+    def _release(self, message):
+        try:
+            if message.get('reanalysis'):
+                get_shedder().defer(message['event'])
+            else:
+                self.source.release(message)
+        except Exception as e:
+            print(f"Error releasing message {message['id']}: {str(e)}")
+        with self.lock:
+            self.stats['released'] += 1
+
+    def cancel_queued(self, alarm_name):
+        """Settle queued ALARM deliveries of an alarm that has since recovered"""
+        removed = self.pending.remove(lambda m: m['event'].get('detail', {}).get('alarmName') == alarm_name
+                                      and m['event'].get('detail', {}).get('state', {}).get('value') == 'ALARM')
+        for message in removed:
+            try:
+                if not message.get('reanalysis'):
+                    self.source.ack(message)
+            except Exception as e:
+                print(f"Error settling message {message['id']}: {str(e)}")
+        with self.lock:
+            self.stats['cancelled'] += len(removed)
+        return len(removed)
+
+    def start(self):
+        add_cancel_hook('queued', self.cancel_queued)
+        for i in range(self.concurrency):
+            thread = threading.Thread(target=self._consume, name=f"agent-worker-{i}", daemon=True)
+            thread.start()
+            self.threads.append(thread)
+        self.started = True
+
+    def reanalyse_deferred(self):
+        """Report queue depth to the load shedder and requeue shed alarms once it recovers"""
+        shedder = get_shedder()
+        shedder.observe_queue_depth(self.backlog())
+        events = shedder.take_deferred(max(self.prefetch - self.backlog(), 0))
+        for event in events:
+            self.submit({'id': f"reanalysis-{uuid.uuid4().hex[:8]}", 'event': event, 'enqueued_at': time.time(),
+                         'receipt': None, 'reanalysis': True})
+        return len(events)
+
+    def poll_once(self):
+        """Fetch more messages when the local backlog has room"""
+        self.heartbeat = time.monotonic()
+        self.reanalyse_deferred()
+        room = self.prefetch - self.backlog()
+        if room <= 0:
+            time.sleep(0.05)
+            return 0
+        messages = self.source.receive(room)
+        for message in messages:
+            self.submit(message)
+        return len(messages)
+
+    def run(self):
+        """Poll until stopped, then drain"""
+        self.start()
+        exported = time.monotonic()
+        while not self.stopping.is_set():
+            try:
+                self.poll_once()
+            except Exception as e:
+                print(f"Error polling queue: {str(e)}")
+                time.sleep(1)
+            if time.monotonic() - exported >= METRICS_INTERVAL:
+                self.emit_metrics()
+                exported = time.monotonic()
+        self.drain()
+        self.emit_metrics()
+
+    def run_batch(self):
+        """Queue a finite source up front so the scheduler orders the whole batch, then drain"""
+        submitted = 0
+        while True:
+            messages = self.source.receive(1000)
+            if not messages:
+                break
+            for message in messages:
+                self.submit(message)
+            submitted += len(messages)
+        self.reanalyse_deferred()
+        self.start()
+        while not self.stopping.is_set() and (self.stats['processed'] + self.stats['failed']
+                                              + self.stats['cancelled'] < submitted
+                                              or get_shedder().deferred):
+            submitted += self.reanalyse_deferred()
+            time.sleep(0.05)
+        self.drain()
+        self.emit_metrics()
+
+    def emit_metrics(self):
+        """Per-tenant bulkhead counters and per-endpoint concurrency limits"""
+        emit_bulkhead_metrics()
+        emit_limit_metrics()
+
+    def stop(self, *args):
+        if not self.stopping.is_set():
+            print("Worker stopping: no new messages will be fetched")
+        self.stopping.set()
+
+    def drain(self):
+        """Finish in-flight alarms and hand the unstarted backlog back to the queue"""
+        self.stopping.set()
+        deadline = time.monotonic() + self.drain_timeout
+        for thread in self.threads:
+            thread.join(max(deadline - time.monotonic(), 0))
+        while True:
+            message = self.next_message(timeout=0)
+            if message is None:
+                break
+            self._release(message)
+        with self.lock:
+            print(f"Worker drained: {self.stats['processed']} processed, {self.stats['failed']} failed, "
+                  f"{self.stats['released']} released, {self.stats['in_flight']} still in flight")
+
+    def status(self):
+        """Probe payload: liveness, readiness and queue lag"""
+        try:
+            lag = self.source.lag()
+        except Exception as e:
+            lag = {'error': str(e)}
+        with self.lock:
+            stats = dict(self.stats)
+        completed = stats['processed'] + stats['failed']
+        now = time.monotonic()
+        stalled = lag.get('depth', 0) > 0 and now - self.last_completed > self.stall_seconds \
+            and stats['in_flight'] > 0
+        return {
+            'live': self.started and now - self.heartbeat < max(self.stall_seconds, 60) and not stalled,
+            'ready': self.started and not self.stopping.is_set() and 'error' not in lag,
+            'draining': self.stopping.is_set(),
+            'queue_lag': lag,
+            'local_backlog': self.backlog(),
+            'stats': stats,
+            'avg_queue_wait_ms': round(stats['queue_wait_ms_total'] / completed, 1) if completed else 0.0,
+            'avg_processing_ms': round(stats['processing_ms_total'] / completed, 1) if completed else 0.0,
+            'queue_wait_by_priority': self.pending.wait_stats(),
+            'single_flight': flight_stats(),
+            'bulkheads': bulkhead_stats(),
+            'load_shedding': shedding_stats(),
+            'adaptive_limits': limiter_stats()
+        }
+
+def start_probe_server(worker, port):
+    """Serve /healthz (liveness) and /readyz (readiness) with the worker status"""
+    class ProbeHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path not in ('/healthz', '/readyz'):
+                self.send_error(404)
+                return
+            status = worker.status()
+            healthy = status['live'] if self.path == '/healthz' else status['ready']
+            body = json.dumps(status).encode()
+            self.send_response(200 if healthy else 503)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('0.0.0.0', port), ProbeHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def main():
+    """Run the queue worker"""
+    parser = argparse.ArgumentParser(description='Long-running IntelliNemo alarm queue worker')
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--queue-url', default=os.environ.get('WORKER_QUEUE_URL'), help='SQS queue URL')
+    source.add_argument('--queue-dir', default=os.environ.get('WORKER_QUEUE_DIR'), help='local directory queue')
+    source.add_argument('--batch', help='process a JSON list or NDJSON file of events once and exit')
+    parser.add_argument('--handler', choices=sorted(HANDLER_MODULES), default=os.environ.get('WORKER_HANDLER', 'eks'))
+    parser.add_argument('--concurrency', type=int, default=int(os.environ.get('WORKER_CONCURRENCY', '4')))
+    parser.add_argument('--probe-port', type=int, default=int(os.environ.get('WORKER_PROBE_PORT', '8080')))
+    parser.add_argument('--drain-timeout', type=float, default=float(os.environ.get('WORKER_DRAIN_TIMEOUT', '30')))
+    parser.add_argument('--processes', type=int, default=int(os.environ.get('WORKER_PROCESSES', '0')),
+                        help='run CPU-bound steps in this many processes sharing one mapped runbook index')
+    args = parser.parse_args()
+
+    if args.queue_url:
+        alarm_queue = SQSQueue(args.queue_url)
+    elif args.queue_dir:
+        alarm_queue = DirectoryQueue(args.queue_dir)
+    elif args.batch:
+        alarm_queue = ListQueue(load_batch(args.batch))
+    else:
+        parser.error('one of --queue-url, --queue-dir (WORKER_QUEUE_URL / WORKER_QUEUE_DIR) or --batch is required')
+
+    handler = importlib.import_module(HANDLER_MODULES[args.handler]).lambda_handler
+    worker = AgentWorker(alarm_queue, handler, concurrency=args.concurrency, drain_timeout=args.drain_timeout)
+    signal.signal(signal.SIGTERM, worker.stop)
+    signal.signal(signal.SIGINT, worker.stop)
+
+    if args.processes:
+        index_path = offload.start_process_pool(args.processes)
+        print(f"   Process pool: {args.processes} processes mapping {index_path}")
+
+    try:
+        if args.batch:
+            print(f"🤖 IntelliNemo batch: {len(alarm_queue.events)} alarms, {args.handler} handler, {args.concurrency} threads")
+            worker.run_batch()
+            for priority_class, wait in worker.pending.wait_stats().items():
+                print(f"   {priority_class:<9} {wait['count']:>5} alarms   avg wait {wait['avg_ms']:>9.1f} ms   max {wait['max_ms']:>9.1f} ms")
+        else:
+            start_probe_server(worker, args.probe_port)
+            print(f"🤖 IntelliNemo worker: {args.handler} handler, {args.concurrency} threads, probes on :{args.probe_port}")
+            worker.run()
+    finally:
+        offload.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from load_shedding import observe_model_latency
+from metrics import emit_metrics
+
+# Per-namespace bulkheads in front of the model client. Each tenant
+# (alarm namespace) has a weight and an optional hard concurrency limit.
+# While capacity is free any tenant may borrow beyond its weighted share;
+# once callers queue, the next free slot goes to the waiting tenant with
+# the lowest start tag (start-time fair queuing), so a noisy namespace
+# cannot starve the others.
+
+MODEL_CONCURRENCY = int(os.environ.get('MODEL_CONCURRENCY', '8'))
+# Seconds a call may queue for a slot before it is rejected
+MODEL_SLOT_TIMEOUT = float(os.environ.get('MODEL_SLOT_TIMEOUT', '10'))
+DEFAULT_WEIGHTS = {'AWS/RDS': 2.0, 'Finance/Trading': 2.0, 'Healthcare/Patient': 2.0}
+DEFAULT_LIMITS = {}
+
+class BulkheadRejected(Exception):
+    """A model call was refused because its tenant's queue is full or the wait timed out"""
+
+class _Tenant:
+    def __init__(self, weight, limit, max_queue):
+        self.weight = weight
+        self.limit = limit
+        self.max_queue = max_queue
+        self.virtual_time = 0.0
+        self.waiters = deque()
+        self.in_use = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.completed = 0
+        self.borrowed = 0
+        self.wait_ms_total = 0.0
+        self.completions = deque(maxlen=1024)
+
+class FairShareLimiter:
+    """Weighted fair sharing of a fixed number of model call slots"""
+
+    def __init__(self, capacity=MODEL_CONCURRENCY, weights=None, limits=None, max_queue=64, throughput_window=60.0):
+        self.capacity = capacity
+        self.weights = dict(DEFAULT_WEIGHTS if weights is None else weights)
+        self.limits = dict(DEFAULT_LIMITS if limits is None else limits)
+        self.max_queue = max_queue
+        self.throughput_window = throughput_window
+        self.in_use = 0
+        self.virtual_clock = 0.0
+        self.tenants = {}
+        self._cond = threading.Condition()
+
+    def _tenant(self, name):
+        tenant = self.tenants.get(name)
+        if tenant is None:
+            tenant = self.tenants[name] = _Tenant(self.weights.get(name, 1.0), self.limits.get(name), self.max_queue)
+        return tenant
+
+    def _fair_share(self, tenant):
+        """Weighted share of capacity among tenants currently holding or waiting for slots"""
+        total_weight = sum(t.weight for t in self.tenants.values() if t is tenant or t.in_use or t.waiters)
+        return self.capacity * tenant.weight / total_weight
+
+    def _at_limit(self, tenant):
+        return tenant.limit is not None and tenant.in_use >= tenant.limit
+
+    def _grant(self, tenant):
+        # Start tag is the later of the tenant's last finish tag and the
+        # system virtual time; each slot costs 1/weight of virtual time
+        start_tag = max(tenant.virtual_time, self.virtual_clock)
+        tenant.virtual_time = start_tag + 1.0 / tenant.weight
+        self.virtual_clock = start_tag
+        if tenant.in_use >= self._fair_share(tenant):
+            tenant.borrowed += 1
+        tenant.in_use += 1
+        tenant.admitted += 1
+        self.in_use += 1
+
+    def _next_tenant(self):
+        waiting = [t for t in self.tenants.values() if t.waiters and not self._at_limit(t)]
+        if not waiting:
+            return None
+        return min(waiting, key=lambda t: (max(t.virtual_time, self.virtual_clock), t.waiters[0][0]))
+
+    def acquire(self, name, timeout=None):
+        """Wait for a slot for tenant name; raises BulkheadRejected"""
+        start = time.monotonic()
+        with self._cond:
+            tenant = self._tenant(name)
+            if self.in_use < self.capacity and not self._at_limit(tenant) and self._next_tenant() is None:
+                self._grant(tenant)
+                return
+            if len(tenant.waiters) >= tenant.max_queue:
+                tenant.rejected += 1
+                raise BulkheadRejected(f"{name}: {len(tenant.waiters)} model calls already queued")
+
+            ticket = (start, object())
+            tenant.waiters.append(ticket)
+            deadline = None if timeout is None else start + timeout
+            while not (self.in_use < self.capacity and self._next_tenant() is tenant
+                       and tenant.waiters[0] is ticket):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    tenant.waiters.remove(ticket)
+                    tenant.rejected += 1
+                    self._cond.notify_all()
+                    raise BulkheadRejected(f"{name}: no model capacity within {timeout}s")
+                self._cond.wait(remaining)
+            tenant.waiters.popleft()
+            tenant.wait_ms_total += (time.monotonic() - start) * 1000
+            self._grant(tenant)
+            self._cond.notify_all()
+
+    def release(self, name):
+        with self._cond:
+            tenant = self.tenants[name]
+            tenant.in_use -= 1
+            tenant.completed += 1
+            tenant.completions.append(time.monotonic())
+            self.in_use -= 1
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, name, timeout=None):
+        self.acquire(name, timeout)
+        try:
+            yield
+        finally:
+            self.release(name)
+
+    def stats(self):
+        """Per-tenant counters and recent throughput"""
+        now = time.monotonic()
+        with self._cond:
+            tenants = {}
+            for name, t in self.tenants.items():
+                recent = sum(1 for c in t.completions if now - c <= self.throughput_window)
+                tenants[name] = {
+                    'weight': t.weight,
+                    'limit': t.limit,
+                    'in_use': t.in_use,
+                    'queued': len(t.waiters),
+                    'admitted': t.admitted,
+                    'borrowed': t.borrowed,
+                    'completed': t.completed,
+                    'rejected': t.rejected,
+                    'avg_wait_ms': round(t.wait_ms_total / t.admitted, 1) if t.admitted else 0.0,
+                    'throughput_per_s': round(recent / self.throughput_window, 3)
+                }
+            return {'capacity': self.capacity, 'in_use': self.in_use, 'tenants': tenants}
+
+def _load(defaults, variable):
+    """Defaults overlaid with a JSON object of namespace -> value from the environment"""
+    values = dict(defaults)
+    values.update(json.loads(os.environ.get(variable, '{}')))
+    return values
+
+_limiter = FairShareLimiter(weights=_load(DEFAULT_WEIGHTS, 'BULKHEAD_WEIGHTS'),
+                            limits=_load(DEFAULT_LIMITS, 'BULKHEAD_LIMITS'))
+
+@contextmanager
+def model_slot(namespace, timeout=MODEL_SLOT_TIMEOUT):
+    """
+    Hold one of the shared model call slots on behalf of an alarm namespace;
+    the time spent waiting plus calling feeds the load shedder
+    """
+    start = time.perf_counter()
+    try:
+        _limiter.acquire(namespace, timeout)
+    except BulkheadRejected:
+        emit_metrics({'BulkheadRejections': 1}, dimensions={'Tenant': namespace})
+        observe_model_latency((time.perf_counter() - start) * 1000)
+        raise
+    try:
+        yield
+    finally:
+        _limiter.release(namespace)
+        observe_model_latency((time.perf_counter() - start) * 1000)
+
+def bulkhead_stats():
+    return _limiter.stats()
+
+_exported = {}
+
+def emit_bulkhead_metrics():
+    """Emit per-tenant admissions, rejections and throughput since the last export"""
+    for name, t in bulkhead_stats()['tenants'].items():
+        last = _exported.get(name, {'admitted': 0, 'rejected': 0, 'borrowed': 0})
+        emit_metrics(
+            {'BulkheadAdmitted': t['admitted'] - last['admitted'],
+             'BulkheadRejected': t['rejected'] - last['rejected'],
+             'BulkheadBorrowed': t['borrowed'] - last['borrowed'],
+             'BulkheadThroughputPerSecond': t['throughput_per_s']},
+            dimensions={'Tenant': name}
+        )
+        _exported[name] = t
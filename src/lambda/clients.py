@@ -0,0 +1,60 @@
+import json
+import os
+import threading
+import time
+
+# Clients, HTTP sessions and secrets live at module level so that warm
+# invocations reuse pooled, already-handshaken connections. boto3 and
+# requests are imported on first use so that module init stays cheap.
+
+SECRET_CACHE_TTL = int(os.environ.get('SECRET_CACHE_TTL', '300'))
+
+_clients = {}
+_sessions = {}
+_secrets = {}
+_lock = threading.Lock()
+
+def get_client(service_name):
+    """Shared boto3 client for a service, created on first use"""
+    client = _clients.get(service_name)
+    if client is None:
+        with _lock:
+            client = _clients.get(service_name)
+            if client is None:
+                import boto3
+                client = boto3.client(service_name)
+                _clients[service_name] = client
+    return client
+
+def get_session(name='default'):
+    """Shared requests.Session whose connection pool survives between invocations"""
+    session = _sessions.get(name)
+    if session is None:
+        with _lock:
+            session = _sessions.get(name)
+            if session is None:
+                import requests
+                session = requests.Session()
+                _sessions[name] = session
+    return session
+
+def get_secret(secrets_client, secret_id, ttl=None):
+    """Parsed SecretString, cached for ttl seconds"""
+    ttl = SECRET_CACHE_TTL if ttl is None else ttl
+    cached = _secrets.get(secret_id)
+    if cached and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+
+    response = secrets_client.get_secret_value(SecretId=secret_id)
+    secret = json.loads(response['SecretString'])
+    _secrets[secret_id] = (time.monotonic(), secret)
+    return secret
+
+def reset():
+    """Drop every cached client, session and secret"""
+    with _lock:
+        for session in _sessions.values():
+            session.close()
+        _clients.clear()
+        _sessions.clear()
+        _secrets.clear()
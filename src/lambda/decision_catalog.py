@@ -0,0 +1,92 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+
+# Decisions for the known alarm catalog, computed at build time by
+# precompile-decisions.py and loaded once per container. Alarms are
+# matched by template - namespace, metric and alarm name with environment
+# prefixes and numbers folded away - so prod-web-1-cpu-high and
+# staging-web-2-cpu-high share one decision. An artifact built for a
+# different prompt or model is reported stale and not used.
+
+DECISION_CATALOG_PATH = os.environ.get(
+    'DECISION_CATALOG_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'decision_catalog.json'))
+DECISION_CATALOG_MAX_AGE_DAYS = float(os.environ.get('DECISION_CATALOG_MAX_AGE_DAYS', '30'))
+ARTIFACT_FORMAT = 1
+
+_ENV_PREFIX = re.compile(r'^(prod|production|staging|stage|dev|test|qa)[-_.]')
+_NUMBER = re.compile(r'\d+')
+
+def prompt_version(prompt):
+    """Short hash identifying a prompt template"""
+    return hashlib.sha256(prompt.encode()).hexdigest()[:12]
+
+def template_key(alarm_data):
+    """namespace|metric|alarm name template for an alarm_data dict"""
+    name = _NUMBER.sub('#', _ENV_PREFIX.sub('', alarm_data['alarm_name'].lower()))
+    return f"{alarm_data['namespace']}|{alarm_data['metric_name']}|{name}"
+
+class DecisionCatalog:
+    """Read-only template -> decision lookup"""
+
+    def __init__(self, decisions=None, version=None, built_at=None, stale_reason=None):
+        self.decisions = decisions or {}
+        self.version = version or {}
+        self.built_at = built_at
+        self.stale_reason = stale_reason
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def covers(self, alarm_data):
+        return template_key(alarm_data) in self.decisions
+
+    def lookup(self, alarm_data):
+        """The precompiled decision for the alarm's template, or None"""
+        entry = self.decisions.get(template_key(alarm_data))
+        with self._lock:
+            self.stats['hits' if entry else 'misses'] += 1
+        if entry is None:
+            return None
+        decision = dict(entry['decision'])
+        decision['catalog'] = {'template': template_key(alarm_data), 'built_at': self.built_at}
+        return decision
+
+    def status(self):
+        """Template count, age and staleness of the loaded artifact"""
+        age_days = round((time.time() - self.built_at) / 86400, 1) if self.built_at else None
+        stale_reason = self.stale_reason
+        if stale_reason is None and age_days is not None and age_days > DECISION_CATALOG_MAX_AGE_DAYS:
+            stale_reason = f"built {age_days} days ago"
+        return {'templates': len(self.decisions), 'version': self.version, 'age_days': age_days,
+                'stale': stale_reason is not None, 'stale_reason': stale_reason, **self.stats}
+
+def load_catalog(path, prompt, model):
+    """
+    Catalog from the artifact at path, or an empty one if it is missing,
+    unreadable or was built for another prompt or model
+    """
+    if not path or not os.path.exists(path):
+        return DecisionCatalog()
+    try:
+        with open(path) as f:
+            artifact = json.load(f)
+    except Exception as e:
+        print(f"Ignoring unreadable decision catalog {path}: {str(e)}")
+        return DecisionCatalog(stale_reason='unreadable')
+
+    version = artifact.get('version', {})
+    expected = {'format': ARTIFACT_FORMAT, 'prompt': prompt_version(prompt), 'model': model}
+    changed = [name for name, value in expected.items() if version.get(name) != value]
+    if changed:
+        print(f"Decision catalog {path} is stale ({', '.join(changed)} changed); not using it")
+        return DecisionCatalog(version=version, built_at=artifact.get('built_at'),
+                               stale_reason=f"{', '.join(changed)} changed")
+
+    catalog = DecisionCatalog(artifact.get('templates', {}), version, artifact.get('built_at'))
+    status = catalog.status()
+    print(f"Loaded {status['templates']} precompiled decisions"
+          + (f" (stale: {status['stale_reason']})" if status['stale'] else ''))
+    return catalog
@@ -1,19 +1,57 @@
 import json
-import boto3
-import requests
 import os
+import time
 from datetime import datetime
 
+import nim_transport
+from bulkhead import model_slot
+from clients import get_client
+from event_filter import filter_event
+from flapping import check as check_flapping, suppressed_response
+from idempotency import claim, duplicate_response, release
+from metrics import emit_metrics
+from pending import register, superseded
+from single_flight import coalesce
+from warmup import is_warmup_event, run_warmup
+
+AUDIT_BUCKET = 'intellinemo-audit-logs'
+
+# NIM endpoints (Kubernetes cluster IPs)
+DEFAULT_LLAMA_ENDPOINT = "http://172.20.218.211:8000/v1/completions"
+DEFAULT_RETRIEVAL_ENDPOINT = "http://172.20.137.214:8001/v1/retrieval"
+
 def lambda_handler(event, context):
     """IntelliNemo Agent - EKS NIM Integration (Hackathon Compliant)"""
     
+    # Transitions that need no decision are answered before anything else
+    filtered = filter_event(event, 'eks')
+    if filtered is not None:
+        return filtered
+    
+    if is_warmup_event(event):
+        return warm_up()
+    
+    # Redelivered alarms stop here, before any client or network work
+    delivery_key, first_delivery = claim(event)
+    if not first_delivery:
+        return duplicate_response(delivery_key, 'eks')
+    
+    # A flapping alarm gets one analysis per interval; the flips between stop here
+    suppress, flapping = check_flapping(event)
+    if suppress:
+        return suppressed_response(event, flapping, 'eks')
+    
+    start = time.perf_counter()
+    
     # Extract alarm details
     alarm_name = event.get('detail', {}).get('alarmName', 'Unknown')
     metric_name = event.get('detail', {}).get('configuration', {}).get('metricName', 'Unknown')
+    namespace = event.get('detail', {}).get('configuration', {}).get('namespace', 'Unknown')
+    state_timestamp = event.get('detail', {}).get('state', {}).get('timestamp')
     
-    # NIM endpoints (Kubernetes cluster IPs)
-    llama_endpoint = "http://172.20.218.211:8000/v1/completions"
-    retrieval_endpoint = "http://172.20.137.214:8001/v1/retrieval"
+    llama_endpoint = os.environ.get('LLAMA_ENDPOINT', DEFAULT_LLAMA_ENDPOINT)
+    retrieval_endpoint = os.environ.get('RETRIEVAL_ENDPOINT', DEFAULT_RETRIEVAL_ENDPOINT)
+    remediated = False
     
     try:
         # Step 1: Retrieval NIM - Get context
@@ -30,7 +68,11 @@ def lambda_handler(event, context):
             "temperature": 0.1
         }
         
-        llama_response = requests.post(llama_endpoint, json=llama_payload, timeout=30)
+        def call_llama():
+            with model_slot(namespace):
+                return nim_transport.post(llama_endpoint, llama_payload, timeout=30)
+        
+        llama_response = coalesce(llama_endpoint, llama_payload, call_llama)
         ai_decision = llama_response.json()
         
         # Extract confidence score
@@ -38,15 +80,22 @@ def lambda_handler(event, context):
         confidence = extract_confidence(response_text)
         
         # Step 3: Decision Logic
-        if confidence >= 7:
+        if superseded(alarm_name, state_timestamp):
+            action = "CANCELLED_RECOVERED"
+        elif confidence >= 7:
             action = "AUTO_REMEDIATE"
+            remediated = True
             execute_remediation(alarm_name, metric_name)
         else:
             action = "ESCALATE_TO_HUMAN"
         
         # Step 4: Audit Logging
-        log_audit(alarm_name, ai_decision, confidence, action)
+        log_audit(alarm_name, ai_decision, confidence, action, flapping)
         
+        emit_metrics(
+            {'AlarmInvocations': 1, 'AlarmDurationMs': round((time.perf_counter() - start) * 1000, 1)},
+            dimensions={'Handler': 'eks', 'InvocationType': 'Alarm'}
+        )
         return {
             'statusCode': 200,
             'body': json.dumps({
@@ -58,11 +107,34 @@ def lambda_handler(event, context):
         }
         
     except Exception as e:
+        # Once remediation has started, a redelivery must not run it again
+        if not remediated:
+            release(delivery_key)
         return {
             'statusCode': 500,
             'body': json.dumps({'error': str(e)})
         }
 
+def warm_up():
+    """Keep the Llama NIM warm and open pooled connections; nothing is audited"""
+    llama_endpoint = os.environ.get('LLAMA_ENDPOINT', DEFAULT_LLAMA_ENDPOINT)
+    
+    def keep_alive_inference():
+        nim_transport.post(
+            llama_endpoint,
+            {"model": "meta/llama-3.1-nemotron-nano-8b-v1", "prompt": "ping", "max_tokens": 1},
+            timeout=5
+        ).raise_for_status()
+    
+    s3 = get_client('s3')
+    ssm = get_client('ssm')
+    result = run_warmup('eks', {
+        'llama': keep_alive_inference,
+        's3': lambda: s3.head_bucket(Bucket=AUDIT_BUCKET),
+        'ssm': lambda: ssm.list_documents(MaxResults=1)
+    })
+    return {'statusCode': 200, 'body': json.dumps(result)}
+
 def extract_confidence(text):
     """Extract confidence score from AI response"""
     import re
@@ -71,29 +143,34 @@ def extract_confidence(text):
 
 def execute_remediation(alarm_name, metric_name):
     """Execute automated remediation"""
-    ssm = boto3.client('ssm')
+    ssm = get_client('ssm')
     
     if 'cpu' in metric_name.lower():
-        ssm.send_command(
+        response = ssm.send_command(
             DocumentName="AWS-RunShellScript",
             Parameters={'commands': ['systemctl restart application']},
             Targets=[{'Key': 'tag:Environment', 'Values': ['production']}]
         )
+        register(alarm_name, command_id=response.get('Command', {}).get('CommandId'))
 
-def log_audit(alarm_name, ai_decision, confidence, action):
+def log_audit(alarm_name, ai_decision, confidence, action, flapping=None):
     """Log to S3 for audit trail"""
-    s3 = boto3.client('s3')
+    s3 = get_client('s3')
     
     audit_log = {
         'timestamp': datetime.utcnow().isoformat(),
         'alarm': alarm_name,
         'ai_decision': ai_decision,
         'confidence': confidence,
-        'action': action
+        'action': action,
+        'flapping': flapping
     }
     
-    s3.put_object(
-        Bucket='intellinemo-audit-logs',
-        Key=f'logs/{datetime.utcnow().strftime("%Y/%m/%d")}/{alarm_name}-{datetime.utcnow().isoformat()}.json',
-        Body=json.dumps(audit_log)
-    )
\ No newline at end of file
+    try:
+        s3.put_object(
+            Bucket=AUDIT_BUCKET,
+            Key=f'logs/{datetime.utcnow().strftime("%Y/%m/%d")}/{alarm_name}-{datetime.utcnow().isoformat()}.json',
+            Body=json.dumps(audit_log)
+        )
+    except Exception as e:
+        print(f"Error logging audit to S3: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,154 @@
+import heapq
+import json
+import mmap
+import operator
+import os
+import struct
+import threading
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Runbook passage embeddings from the Retrieval NIM, stored for search
+# against the NIM's query embedding. Each vector is L2-normalised and
+# quantised to int8 with its own float32 scale; codes are stored offset by
+# 128 so a row is a plain bytes slice. A search scans the int8 block, then
+# re-ranks the best RERANK_CANDIDATES by exact float32 dot product. Both
+# matrices live in one memory-mapped file: the scan reads a quarter of the
+# float bytes and the re-rank pages in a handful of float rows, so a cold
+# start maps the file instead of loading it.
+#
+# The int8 scan only pays off under NumPy. The Lambda artifact does not
+# ship it, and in pure Python the scan plus re-rank measured slower than
+# the exact float32 scan (benchmarks/quantized_store.json), so without
+# NumPy search() runs the exact scan over the mapped float block instead.
+
+RUNBOOK_EMBEDDINGS_PATH = os.environ.get(
+    'RUNBOOK_EMBEDDINGS_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'runbook_embeddings.bin'))
+RERANK_CANDIDATES = int(os.environ.get('RERANK_CANDIDATES', '50'))
+MAGIC = b'EMB1'
+HEADER = struct.Struct('<4sII')
+
+def normalise(vector):
+    norm = sum(v * v for v in vector) ** 0.5
+    return [v / norm for v in vector] if norm else list(vector)
+
+def quantise(vector):
+    """(int8 values, scale) with vector ~= values * scale"""
+    peak = max(map(abs, vector), default=0.0)
+    scale = peak / 127 if peak else 1.0
+    return [round(v / scale) for v in vector], scale
+
+def write_store(path, vectors, records):
+    """Write [header][uint8 codes][pad][float32 scales][float32 matrix][uint32 offsets][JSON records]"""
+    dim = len(vectors[0]) if vectors else 0
+    codes, scales, floats = bytearray(), array('f'), array('f')
+    for vector in vectors:
+        unit = normalise(vector)
+        values, scale = quantise(unit)
+        codes.extend(v + 128 for v in values)
+        scales.append(scale)
+        floats.extend(unit)
+    encoded = [json.dumps(record).encode() for record in records]
+    offsets = array('I', [0])
+    for blob in encoded:
+        offsets.append(offsets[-1] + len(blob))
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, len(vectors), dim))
+        f.write(codes)
+        f.write(bytes(-len(codes) % 4))
+        f.write(scales.tobytes())
+        f.write(floats.tobytes())
+        f.write(offsets.tobytes())
+        f.write(b''.join(encoded))
+    os.replace(temp_path, path)
+    return path
+
+class EmbeddingStore:
+    """Memory-mapped int8 embeddings with float32 re-ranking"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mapping)
+        magic, self.size, self.dim = HEADER.unpack_from(view)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not an embedding store")
+        self._codes_start = codes_start = HEADER.size
+        scales_start = codes_start + self.size * self.dim + (-(self.size * self.dim) % 4)
+        floats_start = scales_start + self.size * 4
+        offsets_start = floats_start + self.size * self.dim * 4
+        blob_start = offsets_start + (self.size + 1) * 4
+        self.scales = view[scales_start:floats_start].cast('f')
+        self.floats = view[floats_start:offsets_start].cast('f')
+        self._offsets = view[offsets_start:blob_start].cast('I')
+        self._blob = view[blob_start:]
+        if numpy is not None:
+            self._codes = numpy.frombuffer(self._mapping, numpy.uint8, self.size * self.dim,
+                                           codes_start).reshape(self.size, self.dim)
+            self._scales = numpy.frombuffer(self._mapping, numpy.float32, self.size, scales_start)
+
+    def record(self, i):
+        return json.loads(bytes(self._blob[self._offsets[i]:self._offsets[i + 1]]))
+
+    def _row(self, matrix, i):
+        return matrix[i * self.dim:(i + 1) * self.dim]
+
+    def candidates(self, query, n):
+        """Rows of the n best approximate scores from the int8 scan"""
+        values, _ = quantise(normalise(query))
+        # Codes are stored +128, so every row's dot product is high by the same amount
+        offset = 128 * sum(values)
+        if numpy is not None:
+            approx = (self._codes @ numpy.array(values, numpy.int32) - offset) * self._scales
+            n = min(n, self.size)
+            return [int(i) for i in numpy.argpartition(-approx, n - 1)[:n]] if n else []
+        mapping, scales, dim, start = self._mapping, self.scales, self.dim, self._codes_start
+        approx = (((sum(map(operator.mul, values, mapping[start + i * dim:start + (i + 1) * dim])) - offset)
+                   * scales[i], i) for i in range(self.size))
+        return [i for _, i in heapq.nlargest(n, approx)]
+
+    def search(self, query, k=3, candidates=RERANK_CANDIDATES):
+        """Top-k records by cosine similarity, by whichever scan is faster here"""
+        if numpy is None:
+            return self.exact_search(query, k)
+        return self.approximate_search(query, k, candidates)
+
+    def approximate_search(self, query, k=3, candidates=RERANK_CANDIDATES):
+        """Top-k records re-ranked in float32 from the int8 candidates"""
+        unit = normalise(query)
+        rows = self.candidates(unit, max(k, candidates))
+        scored = [(sum(map(operator.mul, unit, self._row(self.floats, i))), i) for i in rows]
+        scored.sort(reverse=True)
+        return [dict(self.record(i), score=round(score, 4)) for score, i in scored[:k]]
+
+    def exact_search(self, query, k=3):
+        """Float32 scan of every row; the baseline approximate search is measured against"""
+        unit = normalise(query)
+        scored = heapq.nlargest(k, ((sum(map(operator.mul, unit, self._row(self.floats, i))), i)
+                                    for i in range(self.size)))
+        return [dict(self.record(i), score=round(score, 4)) for score, i in scored]
+
+_store = None
+_store_loaded = False
+_store_lock = threading.Lock()
+
+def get_store():
+    """The store at RUNBOOK_EMBEDDINGS_PATH, or None when no artifact was shipped"""
+    global _store, _store_loaded
+    if not _store_loaded:
+        with _store_lock:
+            if not _store_loaded:
+                if os.path.exists(RUNBOOK_EMBEDDINGS_PATH):
+                    try:
+                        _store = EmbeddingStore(RUNBOOK_EMBEDDINGS_PATH)
+                        print(f"Mapped {_store.size} runbook embeddings ({_store.dim} dims, int8)")
+                    except Exception as e:
+                        print(f"Ignoring unreadable embedding store {RUNBOOK_EMBEDDINGS_PATH}: {str(e)}")
+                _store_loaded = True
+    return _store
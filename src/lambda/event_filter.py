@@ -0,0 +1,95 @@
+import json
+import os
+
+import flapping
+import pending
+from metrics import emit_metrics
+
+# Declarative routing of alarm state changes, checked before a handler
+# creates any client. Rules use the EventBridge pattern shape (nested
+# keys ending in lists of allowed values); the first matching rule picks
+# the route, and events no rule matches are processed as before.
+#   process - run the full pipeline
+#   skip    - answer at once; nothing needs deciding
+#   cancel   - the alarm recovered: call off its pending remediation
+#   prefetch - the alarm may fire soon: decide ahead of time, if the
+#              handler can, otherwise skip
+
+ROUTES = ('process', 'skip', 'cancel', 'prefetch')
+
+DEFAULT_RULES = [
+    {'name': 'recovered', 'route': 'cancel',
+     'pattern': {'detail': {'state': {'value': ['OK']}, 'previousState': {'value': ['ALARM']}}}},
+    {'name': 'ok', 'route': 'skip',
+     'pattern': {'detail': {'state': {'value': ['OK']}}}},
+    {'name': 'insufficient-data', 'route': 'prefetch',
+     'pattern': {'detail': {'state': {'value': ['INSUFFICIENT_DATA']}}}}
+]
+
+def _flatten(pattern, path=()):
+    checks = []
+    for key, value in pattern.items():
+        if isinstance(value, dict):
+            checks.extend(_flatten(value, path + (key,)))
+        elif isinstance(value, list):
+            checks.append((path + (key,), frozenset(value)))
+        else:
+            raise ValueError(f"pattern value at {'.'.join(path + (key,))} must be an object or a list")
+    return checks
+
+def compile_rules(rules):
+    """[(name, route, ((path, allowed values), ...)), ...] from rule dicts"""
+    compiled = []
+    for rule in rules:
+        if rule.get('route') not in ROUTES:
+            raise ValueError(f"rule {rule.get('name')!r}: route must be one of {', '.join(ROUTES)}")
+        compiled.append((rule.get('name', rule['route']), rule['route'], tuple(_flatten(rule['pattern']))))
+    return compiled
+
+def load_rules(path=None):
+    """Rules from the JSON list at path or EVENT_FILTER_RULES, else the defaults"""
+    path = path or os.environ.get('EVENT_FILTER_RULES')
+    if path:
+        with open(path) as f:
+            return compile_rules(json.load(f))
+    return compile_rules(DEFAULT_RULES)
+
+RULES = load_rules()
+
+def _lookup(event, path):
+    value = event
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return None if isinstance(value, (dict, list)) else value
+
+def route(event, rules=None):
+    """(rule name, route) for an event"""
+    if isinstance(event, dict):
+        for name, route_name, checks in RULES if rules is None else rules:
+            if all(_lookup(event, path) in allowed for path, allowed in checks):
+                return name, route_name
+    return None, 'process'
+
+def filter_event(event, handler_name, prefetch=None):
+    """
+    A response for events that need no decision, or None to process the
+    event; prefetch(event) pre-analyses events routed to prefetch
+    """
+    # Every state change, filtered or not, goes into the alarm's flap history
+    flapping.observe(event)
+    name, route_name = route(event)
+    if route_name == 'process':
+        return None
+
+    detail = event.get('detail', {})
+    alarm_name = detail.get('alarmName', 'Unknown')
+    result = {'message': f"Filtered {name} transition", 'alarm': alarm_name, 'route': route_name}
+    if route_name == 'cancel':
+        result['cancelled'] = pending.cancel(alarm_name, detail.get('state', {}).get('timestamp'))
+    elif route_name == 'prefetch' and prefetch is not None:
+        result['prefetch'] = prefetch(event)
+    print(f"Filtered {alarm_name}: {name} -> {route_name}")
+    emit_metrics({'FilteredEvents': 1}, dimensions={'Handler': handler_name, 'InvocationType': 'Filtered'})
+    return {'statusCode': 200, 'body': json.dumps(result)}
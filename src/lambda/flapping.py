@@ -0,0 +1,219 @@
+import calendar
+import hashlib
+import json
+import os
+import struct
+import threading
+import time
+from array import array
+
+from metrics import emit_metrics
+
+# Alarms that oscillate between ALARM and OK would otherwise get a full
+# analysis, and possibly a remediation, on every flip. Each alarm keeps
+# its last HISTORY_SIZE state changes in a fixed-size ring of array
+# storage, persisted under FLAP_DIR (/tmp, or a shared mount such as EFS).
+# The transition rate comes from the ring's head and tail alone; an alarm
+# starts flapping at FLAP_ENTER_RATE transitions per window and stops
+# below FLAP_EXIT_RATE. While flapping it gets one analysis per
+# FLAP_ANALYSIS_INTERVAL seconds, and the deliveries suppressed in between
+# are counted into the next audit record.
+
+FLAP_DIR = os.environ.get('FLAP_DIR', '/tmp/intellinemo-flap')
+FLAP_WINDOW = float(os.environ.get('FLAP_WINDOW', '3600'))
+FLAP_ENTER_RATE = float(os.environ.get('FLAP_ENTER_RATE', '6'))
+FLAP_EXIT_RATE = float(os.environ.get('FLAP_EXIT_RATE', '3'))
+FLAP_ANALYSIS_INTERVAL = float(os.environ.get('FLAP_ANALYSIS_INTERVAL', '900'))
+HISTORY_SIZE = 16
+
+STATES = {'OK': 0, 'ALARM': 1, 'INSUFFICIENT_DATA': 2}
+
+# size, head, count, suppressed, last analysed, flapping
+_HEADER = struct.Struct('<HHHIdB')
+
+def state_time(event):
+    """Epoch seconds of the state change, or now if the event carries none"""
+    timestamp = event.get('detail', {}).get('state', {}).get('timestamp')
+    try:
+        return float(calendar.timegm(time.strptime(str(timestamp)[:19], '%Y-%m-%dT%H:%M:%S')))
+    except (TypeError, ValueError):
+        return time.time()
+
+class StateHistory:
+    """Ring buffer of one alarm's state changes"""
+
+    def __init__(self, size=HISTORY_SIZE):
+        self.size = size
+        self.times = array('d', [0.0] * size)
+        self.states = array('b', [0] * size)
+        self.head = 0
+        self.count = 0
+        self.suppressed = 0
+        self.last_analysed = 0.0
+        self.flapping = False
+
+    def last(self):
+        if not self.count:
+            return None, None
+        index = (self.head - 1) % self.size
+        return self.states[index], self.times[index]
+
+    def record(self, state, at):
+        """Append a state change; repeats of the current state and late deliveries are ignored"""
+        last_state, last_at = self.last()
+        if last_state == state or (last_at is not None and at < last_at):
+            return False
+        self.times[self.head] = at
+        self.states[self.head] = state
+        self.head = (self.head + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+        return True
+
+    def rate(self, now):
+        """Transitions per window, spread over the span the ring covers"""
+        if self.count < 2:
+            return 0.0
+        oldest = self.times[(self.head - self.count) % self.size]
+        return (self.count - 1) * FLAP_WINDOW / max(now - oldest, FLAP_WINDOW)
+
+    def update(self, now):
+        """Refresh the flapping flag with hysteresis and return the rate"""
+        rate = self.rate(now)
+        self.flapping = rate >= (FLAP_EXIT_RATE if self.flapping else FLAP_ENTER_RATE)
+        return rate
+
+    def to_bytes(self):
+        return _HEADER.pack(self.size, self.head, self.count, self.suppressed, self.last_analysed,
+                            self.flapping) + self.times.tobytes() + self.states.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data):
+        size, head, count, suppressed, last_analysed, flapping = _HEADER.unpack_from(data)
+        history = cls(size)
+        offset = _HEADER.size
+        history.times = array('d', data[offset:offset + size * 8])
+        history.states = array('b', data[offset + size * 8:offset + size * 9])
+        if len(history.times) != size or len(history.states) != size:
+            raise ValueError('truncated history')
+        history.head, history.count, history.suppressed = head, count, suppressed
+        history.last_analysed, history.flapping = last_analysed, bool(flapping)
+        return history
+
+class FlapDetector:
+    """Per-alarm state histories, cached in memory and written through to disk"""
+
+    def __init__(self, path=FLAP_DIR, interval=FLAP_ANALYSIS_INTERVAL):
+        self.path = path
+        self.interval = interval
+        self._histories = {}
+        self._lock = threading.Lock()
+        self.stats = {'transitions': 0, 'suppressed': 0, 'store_errors': 0}
+        os.makedirs(path, exist_ok=True)
+
+    def _file(self, alarm_name):
+        return os.path.join(self.path, hashlib.sha256(alarm_name.encode()).hexdigest()[:32])
+
+    def _history(self, alarm_name):
+        history = self._histories.get(alarm_name)
+        if history is None:
+            history = StateHistory()
+            try:
+                with open(self._file(alarm_name), 'rb') as f:
+                    history = StateHistory.from_bytes(f.read())
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"Discarding unreadable flap history for {alarm_name}: {str(e)}")
+            self._histories[alarm_name] = history
+        return history
+
+    def _save(self, alarm_name, history):
+        path = self._file(alarm_name)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}"
+        try:
+            with open(tmp, 'wb') as f:
+                f.write(history.to_bytes())
+            os.replace(tmp, path)
+        except Exception as e:
+            self.stats['store_errors'] += 1
+            print(f"Error saving flap history for {alarm_name}: {str(e)}")
+
+    def observe(self, alarm_name, state, at):
+        """Record a state change; True if it was a transition"""
+        if state not in STATES:
+            return False
+        with self._lock:
+            history = self._history(alarm_name)
+            if not history.record(STATES[state], at):
+                return False
+            was_flapping = history.flapping
+            rate = history.update(at)
+            if history.flapping != was_flapping:
+                print(f"Alarm {alarm_name} {'started' if history.flapping else 'stopped'} flapping: "
+                      f"{rate:.1f} transitions per {FLAP_WINDOW:.0f}s")
+            self.stats['transitions'] += 1
+            self._save(alarm_name, history)
+            return True
+
+    def check(self, alarm_name, at):
+        """(suppress?, flapping summary for the audit record) for an ALARM about to be analysed"""
+        with self._lock:
+            history = self._history(alarm_name)
+            rate = history.update(at)
+            summary = {'flapping': history.flapping, 'transitions_per_window': round(rate, 2),
+                       'suppressed': history.suppressed}
+            if history.flapping and at - history.last_analysed < self.interval:
+                history.suppressed += 1
+                summary['suppressed'] = history.suppressed
+                self.stats['suppressed'] += 1
+                self._save(alarm_name, history)
+                return True, summary
+            # This analysis accounts for everything suppressed since the last one
+            history.suppressed = 0
+            history.last_analysed = at
+            self._save(alarm_name, history)
+            return False, summary
+
+_detector = None
+_detector_lock = threading.Lock()
+
+def get_detector():
+    global _detector
+    if _detector is None:
+        with _detector_lock:
+            if _detector is None:
+                _detector = FlapDetector()
+    return _detector
+
+def observe(event):
+    """Record the state change an alarm event carries"""
+    detail = event.get('detail', {}) if isinstance(event, dict) else {}
+    if not detail.get('alarmName') or event.get('reanalysis'):
+        return False
+    try:
+        return get_detector().observe(detail['alarmName'], detail.get('state', {}).get('value'), state_time(event))
+    except Exception as e:
+        print(f"Error recording alarm state: {str(e)}")
+        return False
+
+def check(event):
+    """(suppress?, flapping summary or None) for an alarm event"""
+    detail = event.get('detail', {}) if isinstance(event, dict) else {}
+    if not detail.get('alarmName') or event.get('reanalysis'):
+        return False, None
+    try:
+        return get_detector().check(detail['alarmName'], state_time(event))
+    except Exception as e:
+        # Fail open: a flapping alarm analysed twice beats a real one missed
+        print(f"Error checking flap state: {str(e)}")
+        return False, None
+
+def suppressed_response(event, summary, handler_name):
+    """What a handler returns for a flapping alarm inside its analysis interval"""
+    alarm_name = event['detail']['alarmName']
+    print(f"Flapping alarm suppressed: {alarm_name} ({summary['suppressed']} since last analysis)")
+    emit_metrics({'FlappingSuppressed': 1}, dimensions={'Handler': handler_name, 'InvocationType': 'Alarm'})
+    return {
+        'statusCode': 200,
+        'body': json.dumps({'message': 'Flapping alarm suppressed', 'alarm': alarm_name, 'flapping': summary})
+    }
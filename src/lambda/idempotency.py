@@ -0,0 +1,190 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from clients import get_client
+from metrics import emit_metrics
+
+# EventBridge and SQS deliver at least once. Each alarm delivery is
+# claimed under its event id plus state timestamp before any other work:
+# an in-process LRU answers repeats seen by this container, and a
+# conditional write to DynamoDB (or a /tmp stand-in) answers repeats that
+# land on another one. Claims expire after IDEMPOTENCY_TTL seconds and
+# are released when processing fails, so a retry can run again. A shed
+# alarm's re-analysis reuses the original event, so it is claimed under
+# the id its deferral was given.
+
+IDEMPOTENCY_TABLE = os.environ.get('IDEMPOTENCY_TABLE')
+IDEMPOTENCY_DIR = os.environ.get('IDEMPOTENCY_DIR', '/tmp/intellinemo-idempotency')
+IDEMPOTENCY_TTL = int(os.environ.get('IDEMPOTENCY_TTL', '86400'))
+LRU_SIZE = 10000
+
+def idempotency_key(event):
+    """Event id plus alarm state timestamp, or None for events that are not alarm deliveries"""
+    if not isinstance(event, dict):
+        return None
+    detail = event.get('detail') or {}
+    timestamp = (detail.get('state') or {}).get('timestamp')
+    if not detail.get('alarmName') or not (event.get('id') or timestamp):
+        return None
+    suffix = f"#reanalysis-{event.get('deferral_id', '')}" if event.get('reanalysis') else ''
+    return f"{event.get('id', '')}#{detail['alarmName']}#{timestamp or ''}{suffix}"
+
+class DynamoDBStore:
+    """Claims as conditional puts; expired items count as free since TTL deletion lags"""
+
+    def __init__(self, table, client=None):
+        self.table = table
+        self.client = client
+
+    def claim(self, key, expires_at):
+        client = self.client or get_client('dynamodb')
+        try:
+            client.put_item(
+                TableName=self.table,
+                Item={'idempotency_key': {'S': key}, 'expires_at': {'N': str(int(expires_at))}},
+                ConditionExpression='attribute_not_exists(idempotency_key) OR expires_at < :now',
+                ExpressionAttributeValues={':now': {'N': str(int(time.time()))}}
+            )
+            return True
+        except client.exceptions.ConditionalCheckFailedException:
+            return False
+
+    def release(self, key):
+        client = self.client or get_client('dynamodb')
+        client.delete_item(TableName=self.table, Key={'idempotency_key': {'S': key}})
+
+class LocalStore:
+    """Stand-in for the table: one exclusively created file per claim"""
+
+    def __init__(self, path):
+        self.path = path
+        self.claims = 0
+        os.makedirs(path, exist_ok=True)
+
+    def _file(self, key):
+        return os.path.join(self.path, hashlib.sha256(key.encode()).hexdigest()[:32])
+
+    def claim(self, key, expires_at):
+        path = self._file(key)
+        self.claims += 1
+        if self.claims % 256 == 0:
+            self.prune()
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                with open(path) as f:
+                    if float(f.read() or 0) >= time.time():
+                        return False
+            except FileNotFoundError:
+                pass
+            # Expired claim: take it over
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}"
+            with open(tmp, 'w') as f:
+                f.write(str(expires_at))
+            os.replace(tmp, path)
+            return True
+        with os.fdopen(fd, 'w') as f:
+            f.write(str(expires_at))
+        return True
+
+    def release(self, key):
+        try:
+            os.remove(self._file(key))
+        except FileNotFoundError:
+            pass
+
+    def prune(self):
+        """Remove expired claims"""
+        now = time.time()
+        for name in os.listdir(self.path):
+            path = os.path.join(self.path, name)
+            try:
+                with open(path) as f:
+                    if float(f.read() or 0) < now:
+                        os.remove(path)
+            except (OSError, ValueError):
+                pass
+
+class IdempotencyGuard:
+    """LRU in front of a persistent claim store"""
+
+    def __init__(self, store, ttl=IDEMPOTENCY_TTL, lru_size=LRU_SIZE):
+        self.store = store
+        self.ttl = ttl
+        self.lru_size = lru_size
+        self._seen = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'claimed': 0, 'duplicates_local': 0, 'duplicates_store': 0, 'store_errors': 0}
+
+    def claim(self, key):
+        """True if this is the first delivery of key within the TTL"""
+        now = time.time()
+        with self._lock:
+            expires_at = self._seen.get(key)
+            if expires_at is not None and expires_at >= now:
+                self._seen.move_to_end(key)
+                self.stats['duplicates_local'] += 1
+                return False
+            # Hold the key while the store is asked, so concurrent copies stop here
+            self._seen[key] = now + self.ttl
+            self._seen.move_to_end(key)
+            while len(self._seen) > self.lru_size:
+                self._seen.popitem(last=False)
+
+        try:
+            first = self.store.claim(key, now + self.ttl)
+        except Exception as e:
+            # Fail open: a missed duplicate is cheaper than a dropped alarm
+            print(f"Idempotency store error, processing anyway: {str(e)}")
+            with self._lock:
+                self.stats['store_errors'] += 1
+            return True
+        with self._lock:
+            self.stats['claimed' if first else 'duplicates_store'] += 1
+        return first
+
+    def release(self, key):
+        """Forget a claim so a redelivery is processed again"""
+        with self._lock:
+            self._seen.pop(key, None)
+        try:
+            self.store.release(key)
+        except Exception as e:
+            print(f"Error releasing idempotency claim: {str(e)}")
+
+_guard = None
+_guard_lock = threading.Lock()
+
+def get_guard():
+    global _guard
+    if _guard is None:
+        with _guard_lock:
+            if _guard is None:
+                store = DynamoDBStore(IDEMPOTENCY_TABLE) if IDEMPOTENCY_TABLE else LocalStore(IDEMPOTENCY_DIR)
+                _guard = IdempotencyGuard(store)
+    return _guard
+
+def claim(event):
+    """(key, first delivery?) for an event; events without a key always count as first"""
+    key = idempotency_key(event)
+    if key is None:
+        return None, True
+    return key, get_guard().claim(key)
+
+def release(key):
+    if key is not None:
+        get_guard().release(key)
+
+def duplicate_response(key, handler_name):
+    """What a handler returns for a redelivered alarm"""
+    print(f"Duplicate delivery ignored: {key}")
+    emit_metrics({'DuplicateDeliveries': 1}, dimensions={'Handler': handler_name, 'InvocationType': 'Alarm'})
+    return {
+        'statusCode': 200,
+        'body': json.dumps({'message': 'Duplicate delivery ignored', 'idempotency_key': key})
+    }
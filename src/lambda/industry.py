@@ -0,0 +1,16 @@
+# Sector detection shared by the handlers' scheduling policy and the
+# domain validators
+
+def detect_industry(namespace, alarm_name):
+    """Detect the industry an alarm belongs to from its namespace and name"""
+    namespace = namespace.lower()
+    alarm_name = alarm_name.lower()
+
+    if 'finance' in namespace or 'trading' in alarm_name or 'payment' in alarm_name:
+        return 'finance'
+    elif 'healthcare' in namespace or 'patient' in alarm_name or 'medical' in alarm_name:
+        return 'healthcare'
+    elif 'ecommerce' in namespace or 'checkout' in alarm_name or 'cart' in alarm_name:
+        return 'ecommerce'
+    else:
+        return 'general'
@@ -1,64 +1,235 @@
 import json
-import boto3
-import requests
 import os
+import time
 from datetime import datetime
 
+import nim_transport
+from bulkhead import model_slot
+from clients import get_client, get_secret
+from decision_catalog import DECISION_CATALOG_PATH, load_catalog
+from event_filter import filter_event
+from flapping import check as check_flapping, suppressed_response
+from idempotency import claim, duplicate_response, release
+from load_shedding import get_shedder
+from log_templates import log_context
+from metrics import emit_metrics
+from near_duplicate import get_index as near_duplicates
+from pending import register, superseded
+from prefetch import (breaching_value, described_alarm, get_cache, is_prefetch_event, near_threshold, pre_analyse,
+                      predicted_alarm_data, watched_alarms)
+from single_flight import coalesce
+from warmup import is_warmup_event, run_warmup
+
+LLAMA_ENDPOINT = 'https://integrate-api.nvidia.com/v1/chat/completions'
+EMBEDDING_ENDPOINT = 'https://integrate-api.nvidia.com/v1/embeddings'
+LLAMA_MODEL = 'meta/llama-3.1-nemotron-70b-instruct'
+
+# Filled with extract_alarm_data's fields; precompiled decisions are only
+# used while this text and LLAMA_MODEL match the ones they were built with
+REASONING_PROMPT = """
+    You are an expert SRE analyzing a CloudWatch alarm. Provide concise root cause analysis and recommended action.
+    
+    Alarm Details:
+    - Name: {alarm_name}
+    - State: {state}
+    - Reason: {reason}
+    - Metric: {metric_name}
+    - Namespace: {namespace}
+    {log_context}
+    
+    Provide:
+    1. Root cause analysis (2-3 sentences)
+    2. Recommended action (specific and actionable)
+    3. Confidence level (1-10)
+    """
+
+CATALOG = load_catalog(DECISION_CATALOG_PATH, REASONING_PROMPT, LLAMA_MODEL)
+
 def lambda_handler(event, context):
     """
     IntelliNemo Agent Lambda Handler
     Processes CloudWatch alarms and executes AI-driven remediation
     """
     
+    # Shed alarms come back from the re-analysis queue as an SQS batch
+    if isinstance(event, dict) and event.get('Records'):
+        return process_sqs_batch(event, context)
+    
+    # Transitions that need no decision are answered before anything else
+    filtered = filter_event(event, 'lambda', prefetch=prefetch_alarm)
+    if filtered is not None:
+        return filtered
+    
+    # Redelivered alarms stop here, before any client or network work
+    delivery_key, first_delivery = claim(event)
+    if not first_delivery:
+        return duplicate_response(delivery_key, 'lambda')
+    
+    # A flapping alarm gets one analysis per interval; the flips between stop here
+    suppress, flapping = check_flapping(event)
+    if suppress:
+        return suppressed_response(event, flapping, 'lambda')
+    
     # Initialize AWS clients
-    secrets_client = boto3.client('secretsmanager')
-    s3_client = boto3.client('s3')
-    ssm_client = boto3.client('ssm')
+    secrets_client = get_client('secretsmanager')
+    s3_client = get_client('s3')
+    ssm_client = get_client('ssm')
     
     # Get environment variables
     secrets_arn = os.environ['SECRETS_ARN']
     s3_bucket = os.environ['S3_BUCKET']
     mode = os.environ.get('MODE', 'DRY_RUN')
     
+    if is_warmup_event(event):
+        return warm_up(secrets_client, s3_client, ssm_client, secrets_arn, s3_bucket)
+    
+    if is_prefetch_event(event):
+        return prefetch_near_threshold()
+    
+    start = time.perf_counter()
     try:
         # Extract alarm details from EventBridge event
         alarm_data = extract_alarm_data(event)
         
-        # Get NVIDIA NIM credentials
-        nim_config = get_nim_credentials(secrets_client, secrets_arn)
+        # A decision made earlier for this alarm, or one just like it
+        reasoning_result, reused_from = reuse_decision(event, alarm_data)
         
-        # Process alarm with NIM reasoning
-        reasoning_result = process_with_nim(alarm_data, nim_config)
+        # Under overload, low-priority alarms skip reasoning and get the
+        # rule-based action; they are re-analysed once load drops
+        shedder = get_shedder()
+        degraded = reasoning_result is None and shedder.should_shed(event) and shedder.defer(event)
+        if degraded:
+            reasoning_result = {
+                'reasoning': 'Load shed: rule-based action, queued for re-analysis',
+                'confidence': 0,
+                'model_used': 'rules'
+            }
+        elif reasoning_result is None:
+            # Get NVIDIA NIM credentials
+            nim_config = get_nim_credentials(secrets_client, secrets_arn)
+            
+            # Process alarm with NIM reasoning
+            reasoning_result = process_with_nim(alarm_data, nim_config)
+            if reasoning_result.get('model_used'):
+                near_duplicates().add(alarm_data, reasoning_result)
         
         # Generate remediation action
         action = generate_action(reasoning_result, alarm_data)
         
         # Log results to S3
-        log_to_s3(s3_client, s3_bucket, alarm_data, reasoning_result, action)
+        log_to_s3(s3_client, s3_bucket, alarm_data, reasoning_result, action,
+                  degraded=degraded, reanalysis=event.get('reanalysis', False), flapping=flapping)
         
-        # Execute action based on mode
-        if mode == 'ACTIVE':
-            execute_action(ssm_client, action)
+        # Execute action based on mode, unless the alarm recovered meanwhile
+        if superseded(alarm_data['alarm_name'], alarm_data['timestamp']):
+            print(f"Alarm {alarm_data['alarm_name']} recovered during analysis, not executing")
+        elif mode == 'ACTIVE':
+            execute_action(ssm_client, action, alarm_data['alarm_name'])
         else:
             print(f"DRY_RUN MODE: Would execute action: {action}")
         
+        emit_metrics(
+            {'AlarmInvocations': 1, 'AlarmsShed': int(degraded), 'AlarmsPrefetched': int(reused_from == 'prefetch'),
+             'AlarmsCatalogued': int(reused_from == 'catalog'), 'AlarmsNearDuplicate': int(reused_from == 'near_duplicate'),
+             'AlarmDurationMs': round((time.perf_counter() - start) * 1000, 1)},
+            dimensions={'Handler': 'lambda', 'InvocationType': 'Alarm'}
+        )
         return {
             'statusCode': 200,
             'body': json.dumps({
                 'message': 'IntelliNemo Agent processed alarm successfully',
                 'alarm': alarm_data['alarm_name'],
                 'action': action['type'],
+                'degraded': degraded,
                 'mode': mode
             })
         }
         
     except Exception as e:
         print(f"Error processing alarm: {str(e)}")
+        release(delivery_key)
         return {
             'statusCode': 500,
             'body': json.dumps({'error': str(e)})
         }
 
+def process_sqs_batch(event, context):
+    """Handle each queued event; failed messages are reported back for redelivery"""
+    failures = []
+    for record in event['Records']:
+        try:
+            failed = lambda_handler(json.loads(record['body']), context).get('statusCode', 200) >= 500
+        except Exception as e:
+            print(f"Error processing queued event {record.get('messageId')}: {str(e)}")
+            failed = True
+        if failed:
+            failures.append({'itemIdentifier': record['messageId']})
+    return {'batchItemFailures': failures}
+
+def warm_up(secrets_client, s3_client, ssm_client, secrets_arn, s3_bucket):
+    """Prime the secret cache and open pooled connections; nothing is audited"""
+    def keep_alive_inference():
+        nim_config = get_nim_credentials(secrets_client, secrets_arn)
+        if not nim_config:
+            raise RuntimeError('NIM credentials unavailable')
+        response = nim_transport.post(
+            nim_config['llama_endpoint'],
+            {'model': LLAMA_MODEL, 'messages': [{'role': 'user', 'content': 'ping'}], 'max_tokens': 1},
+            headers={'Authorization': f'Bearer {nim_config["api_key"]}'},
+            timeout=5
+        )
+        response.raise_for_status()
+    
+    result = run_warmup('lambda', {
+        'nim': keep_alive_inference,
+        's3': lambda: s3_client.head_bucket(Bucket=s3_bucket),
+        'ssm': lambda: ssm_client.list_documents(MaxResults=1)
+    })
+    return {'statusCode': 200, 'body': json.dumps(result)}
+
+def reuse_decision(event, alarm_data):
+    """
+    (decision, source) from the cheapest source that has one: the build-time
+    catalog, a re-validated pre-analysis, or a near-identical recent alarm;
+    (None, None) if the model has to be asked
+    """
+    decision = CATALOG.lookup(alarm_data)
+    if decision is not None:
+        return decision, 'catalog'
+    decision = get_cache().revalidate(event, alarm_data)
+    if decision is not None:
+        return decision, 'prefetch'
+    decision = near_duplicates().match(alarm_data)
+    if decision is not None:
+        return decision, 'near_duplicate'
+    return None, None
+
+def prefetch_alarm(event):
+    """Pre-analyse an alarm that lost its data as the ALARM it may turn into"""
+    alarm_name = event.get('detail', {}).get('alarmName')
+    alarm = described_alarm(alarm_name)
+    if alarm is not None and alarm['value'] is None:
+        alarm = dict(alarm, value=breaching_value(event))
+    if alarm is None or alarm['value'] is None:
+        # The ALARM could not be checked against a decision made without a value
+        print(f"No threshold or recent value for {alarm_name}, not pre-analysing")
+        return {'prefetch': True, 'analysed': 0, 'skipped': 1}
+    return run_prefetch([predicted_alarm_data(alarm)])
+
+def prefetch_near_threshold():
+    """Pre-analyse every watched alarm whose metric is close to its threshold"""
+    alarms = [predicted_alarm_data(alarm) for alarm in watched_alarms()
+              if near_threshold(alarm['value'], alarm['threshold'], alarm['operator'])]
+    return {'statusCode': 200, 'body': json.dumps(run_prefetch(alarms))}
+
+def run_prefetch(alarms):
+    # Speculative work never competes with real alarms for model capacity
+    alarms = [alarm_data for alarm_data in alarms if not CATALOG.covers(alarm_data)]
+    if not alarms or get_shedder().overloaded:
+        return {'prefetch': True, 'analysed': 0, 'skipped': len(alarms)}
+    nim_config = get_nim_credentials(get_client('secretsmanager'), os.environ['SECRETS_ARN'])
+    return pre_analyse('lambda', alarms, lambda alarm_data: process_with_nim(alarm_data, nim_config))
+
 def extract_alarm_data(event):
     """Extract relevant alarm information from EventBridge event"""
     detail = event.get('detail', {})
@@ -74,12 +245,11 @@ def extract_alarm_data(event):
 def get_nim_credentials(secrets_client, secrets_arn):
     """Retrieve NVIDIA NIM credentials from Secrets Manager"""
     try:
-        response = secrets_client.get_secret_value(SecretId=secrets_arn)
-        secrets = json.loads(response['SecretString'])
+        secrets = get_secret(secrets_client, secrets_arn)
         return {
             'api_key': secrets['nvidia_api_key'],
-            'llama_endpoint': 'https://integrate-api.nvidia.com/v1/chat/completions',
-            'embedding_endpoint': 'https://integrate-api.nvidia.com/v1/embeddings'
+            'llama_endpoint': LLAMA_ENDPOINT,
+            'embedding_endpoint': EMBEDDING_ENDPOINT
         }
     except Exception as e:
         print(f"Error retrieving NIM credentials: {str(e)}")
@@ -91,21 +261,7 @@ def process_with_nim(alarm_data, nim_config):
         return {'reasoning': 'Unable to access NIM services', 'confidence': 0}
     
     # Prepare context for reasoning
-    context_prompt = f"""
-    You are an expert SRE analyzing a CloudWatch alarm. Provide concise root cause analysis and recommended action.
-    
-    Alarm Details:
-    - Name: {alarm_data['alarm_name']}
-    - State: {alarm_data['state']}
-    - Reason: {alarm_data['reason']}
-    - Metric: {alarm_data['metric_name']}
-    - Namespace: {alarm_data['namespace']}
-    
-    Provide:
-    1. Root cause analysis (2-3 sentences)
-    2. Recommended action (specific and actionable)
-    3. Confidence level (1-10)
-    """
+    context_prompt = REASONING_PROMPT.format(**alarm_data, log_context=log_context(alarm_data))
     
     try:
         headers = {
@@ -114,16 +270,19 @@ def process_with_nim(alarm_data, nim_config):
         }
         
         payload = {
-            'model': 'meta/llama-3.1-nemotron-70b-instruct',
+            'model': LLAMA_MODEL,
             'messages': [{'role': 'user', 'content': context_prompt}],
             'max_tokens': 500,
             'temperature': 0.1
         }
         
-        response = requests.post(nim_config['llama_endpoint'], 
-                               headers=headers, 
-                               json=payload, 
-                               timeout=30)
+        # Identical concurrent alarms share one in-flight NIM request, which
+        # holds one of this namespace's fair-share model slots
+        def call_nim():
+            with model_slot(alarm_data['namespace']):
+                return nim_transport.post(nim_config['llama_endpoint'], payload, headers=headers, timeout=30)
+        
+        response = coalesce(nim_config['llama_endpoint'], payload, call_nim)
         
         if response.status_code == 200:
             result = response.json()
@@ -184,13 +343,17 @@ def generate_action(reasoning_result, alarm_data):
     
     return action
 
-def log_to_s3(s3_client, bucket, alarm_data, reasoning_result, action):
+def log_to_s3(s3_client, bucket, alarm_data, reasoning_result, action, degraded=False, reanalysis=False,
+              flapping=None):
     """Log processing results to S3 for audit and analysis"""
     log_data = {
         'timestamp': datetime.utcnow().isoformat(),
         'alarm': alarm_data,
         'reasoning': reasoning_result,
-        'action': action
+        'action': action,
+        'degraded': degraded,
+        'reanalysis': reanalysis,
+        'flapping': flapping
     }
     
     key = f"logs/{datetime.utcnow().strftime('%Y/%m/%d')}/{alarm_data['alarm_name']}-{int(datetime.utcnow().timestamp())}.json"
@@ -206,7 +369,7 @@ def log_to_s3(s3_client, bucket, alarm_data, reasoning_result, action):
     except Exception as e:
         print(f"Error logging to S3: {str(e)}")
 
-def execute_action(ssm_client, action):
+def execute_action(ssm_client, action, alarm_name=None):
     """Execute remediation action using Systems Manager"""
     if action['confidence'] < 7:
         print(f"Action confidence too low ({action['confidence']}), skipping execution")
@@ -237,6 +400,10 @@ def execute_action(ssm_client, action):
         
         execution_id = response.get('Command', {}).get('CommandId') or response.get('AutomationExecutionId')
         print(f"Executed remediation: {execution_id}")
+        if alarm_name:
+            # An ALARM->OK transition can still stop it
+            register(alarm_name, automation_id=response.get('AutomationExecutionId'),
+                     command_id=response.get('Command', {}).get('CommandId'))
         
     except Exception as e:
         print(f"Error executing action: {str(e)}")
\ No newline at end of file
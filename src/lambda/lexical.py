@@ -0,0 +1,273 @@
+import json
+import math
+import mmap
+import os
+import re
+import struct
+import threading
+from array import array
+
+# BM25 over an inverted index that takes adds and deletes without a
+# rebuild, in the style of a log-structured index: new documents go to an
+# in-memory buffer, flush() seals the buffer into an immutable segment file
+# and deletes are tombstones until merge() rewrites the segments without
+# them. Segment files are memory-mapped, so a cold start reads the term
+# dictionary and leaves the postings in the page cache.
+#
+# Terms keep identifiers whole as well as split: DatabaseConnections is
+# indexed as databaseconnections, database and connections, and 4XXError
+# as 4xxerror, 4xx and error, so exact metric names score highest.
+
+BM25_K1 = float(os.environ.get('BM25_K1', '1.2'))
+BM25_B = float(os.environ.get('BM25_B', '0.75'))
+MAGIC = b'LEX1'
+HEADER = struct.Struct('<4sIII')
+MANIFEST = 'manifest.json'
+
+_WORD = re.compile(r'[A-Za-z0-9_]+')
+_PART = re.compile(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+[A-Z]*(?![a-z])|\d+[a-z]*')
+
+def terms(text):
+    """Lower-cased words plus the camel-case and digit parts of identifiers"""
+    out = []
+    for word in _WORD.findall(text):
+        lowered = word.lower()
+        out.append(lowered)
+        parts = _PART.findall(word)
+        if len(parts) > 1 or '_' in word:
+            out.extend(part.lower() for part in parts)
+    return out
+
+def term_counts(text):
+    counts = {}
+    for term in terms(text):
+        counts[term] = counts.get(term, 0) + 1
+    return counts
+
+def write_manifest(directory, segments, next_segment):
+    """Atomically record the segment list and their tombstones"""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, MANIFEST)
+    with open(f"{path}.tmp", 'w') as f:
+        json.dump({'segments': segments, 'next_segment': next_segment}, f)
+    os.replace(f"{path}.tmp", path)
+
+class Segment:
+    """Immutable, memory-mapped postings for a fixed set of documents"""
+
+    def __init__(self, path):
+        self.path = path
+        self.name = os.path.basename(path)
+        self.deleted = set()
+        with open(path, 'rb') as f:
+            self._mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = view = memoryview(self._mapping)
+        magic, docs, term_count, postings = HEADER.unpack_from(view)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a lexical index segment")
+        lengths_start = HEADER.size
+        doc_start = lengths_start + docs * 4
+        tf_start = doc_start + postings * 4
+        meta_start = tf_start + postings * 4
+        self.lengths = view[lengths_start:doc_start].cast('I')
+        self._docs = view[doc_start:tf_start].cast('I')
+        self._tfs = view[tf_start:meta_start].cast('I')
+        meta = json.loads(bytes(view[meta_start:]))
+        self.doc_ids = meta['docs']
+        self.terms = meta['terms']
+
+    @staticmethod
+    def write(path, docs):
+        """Seal [(doc_id, term counts, length)] into a segment file at path"""
+        postings = {}
+        for ordinal, (_, counts, _) in enumerate(docs):
+            for term, tf in counts.items():
+                postings.setdefault(term, []).append((ordinal, tf))
+        lengths = array('I', [length for _, _, length in docs])
+        doc_column, tf_column, dictionary = array('I'), array('I'), {}
+        for term in sorted(postings):
+            dictionary[term] = [len(doc_column), len(postings[term])]
+            for ordinal, tf in postings[term]:
+                doc_column.append(ordinal)
+                tf_column.append(tf)
+        meta = json.dumps({'docs': [doc_id for doc_id, _, _ in docs], 'terms': dictionary},
+                          separators=(',', ':')).encode()
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, len(docs), len(dictionary), len(doc_column)))
+            f.write(lengths.tobytes())
+            f.write(doc_column.tobytes())
+            f.write(tf_column.tobytes())
+            f.write(meta)
+        os.replace(temp_path, path)
+        return path
+
+    def postings(self, term):
+        """(doc ordinal, term frequency) pairs for a term"""
+        entry = self.terms.get(term)
+        if entry is None:
+            return []
+        start, count = entry
+        return zip(self._docs[start:start + count], self._tfs[start:start + count])
+
+    def df(self, term):
+        entry = self.terms.get(term)
+        return entry[1] if entry else 0
+
+    def live(self):
+        """(ordinal, doc_id, length) of documents without a tombstone"""
+        return [(ordinal, doc_id, self.lengths[ordinal]) for ordinal, doc_id in enumerate(self.doc_ids)
+                if ordinal not in self.deleted]
+
+    def close(self):
+        for view in (self.lengths, self._docs, self._tfs, self._view):
+            view.release()
+        self._mapping.close()
+
+class LexicalIndex:
+    """BM25 index of an in-memory buffer plus sealed segments, with tombstone deletes"""
+
+    def __init__(self, directory=None):
+        self.directory = directory
+        self.segments = []
+        self._buffer = {}
+        self._buffer_df = {}
+        self._sealed = {}
+        self._lengths = {}
+        self._next_segment = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, directory):
+        """Map the segments listed in a directory's manifest"""
+        with open(os.path.join(directory, MANIFEST)) as f:
+            manifest = json.load(f)
+        index = cls(directory)
+        index._next_segment = manifest['next_segment']
+        for entry in manifest['segments']:
+            segment = Segment(os.path.join(directory, entry['name']))
+            segment.deleted = set(entry['deleted'])
+            index._attach(segment)
+        return index
+
+    def _attach(self, segment):
+        self.segments.append(segment)
+        for ordinal, doc_id, length in segment.live():
+            self._sealed[doc_id] = (segment, ordinal)
+            self._lengths[doc_id] = length
+
+    def __len__(self):
+        return len(self._lengths)
+
+    def __contains__(self, doc_id):
+        return doc_id in self._lengths
+
+    def add(self, doc_id, text):
+        """Index a document, replacing any earlier version with the same id"""
+        counts = term_counts(text)
+        with self._lock:
+            self._remove(doc_id)
+            self._buffer[doc_id] = counts
+            self._lengths[doc_id] = sum(counts.values())
+            for term in counts:
+                self._buffer_df[term] = self._buffer_df.get(term, 0) + 1
+
+    def delete(self, doc_id):
+        with self._lock:
+            self._remove(doc_id)
+
+    def _remove(self, doc_id):
+        if self._lengths.pop(doc_id, None) is None:
+            return
+        counts = self._buffer.pop(doc_id, None)
+        if counts is not None:
+            for term in counts:
+                self._buffer_df[term] -= 1
+            return
+        segment, ordinal = self._sealed.pop(doc_id)
+        segment.deleted.add(ordinal)
+
+    def search(self, query, k=10):
+        """Top-k (doc_id, BM25 score); deleted documents count toward df until merge()"""
+        with self._lock:
+            n = len(self._lengths)
+            if not n:
+                return []
+            avgdl = sum(self._lengths.values()) / n
+            scores = {}
+            for term in set(terms(query)):
+                df = sum(segment.df(term) for segment in self.segments) + self._buffer_df.get(term, 0)
+                if not df:
+                    continue
+                idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+                for segment in self.segments:
+                    for ordinal, tf in segment.postings(term):
+                        if ordinal in segment.deleted:
+                            continue
+                        doc_id = segment.doc_ids[ordinal]
+                        scores[doc_id] = scores.get(doc_id, 0.0) + \
+                            self._term_score(idf, tf, segment.lengths[ordinal], avgdl)
+                if self._buffer_df.get(term):
+                    for doc_id, counts in self._buffer.items():
+                        if term in counts:
+                            scores[doc_id] = scores.get(doc_id, 0.0) + \
+                                self._term_score(idf, counts[term], self._lengths[doc_id], avgdl)
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)[:k]
+
+    @staticmethod
+    def _term_score(idf, tf, length, avgdl):
+        return idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * (1 - BM25_B + BM25_B * length / avgdl))
+
+    def _new_segment(self, docs):
+        name = f"segment-{self._next_segment:06d}.lex"
+        self._next_segment += 1
+        os.makedirs(self.directory, exist_ok=True)
+        return Segment(Segment.write(os.path.join(self.directory, name), docs))
+
+    def flush(self):
+        """Seal the buffer into a new segment and persist the manifest"""
+        with self._lock:
+            if self._buffer:
+                docs = [(doc_id, counts, self._lengths[doc_id]) for doc_id, counts in self._buffer.items()]
+                self._attach(self._new_segment(docs))
+                self._buffer, self._buffer_df = {}, {}
+            self._write_manifest()
+
+    def _live_docs(self):
+        """(doc_id, term counts, length) of every live document, sealed or buffered"""
+        docs = []
+        for segment in self.segments:
+            counts = {ordinal: {} for ordinal, _, _ in segment.live()}
+            for term in segment.terms:
+                for ordinal, tf in segment.postings(term):
+                    if ordinal in counts:
+                        counts[ordinal][term] = tf
+            docs.extend((doc_id, counts[ordinal], length) for ordinal, doc_id, length in segment.live())
+        docs.extend((doc_id, counts, self._lengths[doc_id]) for doc_id, counts in self._buffer.items())
+        return docs
+
+    def merge(self):
+        """Rewrite every live document into one segment, dropping tombstones"""
+        self.flush()
+        with self._lock:
+            segment = self._new_segment(self._live_docs())
+            old = self.segments
+            self.segments, self._sealed = [], {}
+            self._attach(segment)
+            self._write_manifest()
+        for segment in old:
+            segment.close()
+            os.remove(segment.path)
+
+    def save(self, directory):
+        """Write the live documents as a single-segment index in another directory"""
+        with self._lock:
+            docs = self._live_docs()
+        os.makedirs(directory, exist_ok=True)
+        Segment.write(os.path.join(directory, 'segment-000000.lex'), docs)
+        write_manifest(directory, [{'name': 'segment-000000.lex', 'deleted': []}], 1)
+        return directory
+
+    def _write_manifest(self):
+        write_manifest(self.directory, [{'name': segment.name, 'deleted': sorted(segment.deleted)}
+                                        for segment in self.segments], self._next_segment)
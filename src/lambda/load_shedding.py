@@ -0,0 +1,171 @@
+import json
+import os
+import threading
+import time
+import uuid
+from collections import deque
+
+import pending
+from clients import get_client
+from scheduler import alarm_priority, load_policy
+
+# Graceful degradation when model capacity is the bottleneck. Once the
+# local queue depth or model call latency passes its threshold, alarms in
+# the shed priority classes skip reasoning and get the rule-based action;
+# their events are deferred for re-analysis once load drops. Overload is
+# left only when both signals fall below recover_ratio of their
+# thresholds, so the shedder does not flap at the boundary. A latency
+# sample older than stale_seconds is forgotten, since with every alarm
+# shed nothing else would bring the average back down.
+#
+# Deferred events go to REANALYSIS_QUEUE_URL, whose messages come back to
+# the handler as an SQS batch. The in-memory backlog is drained only by
+# agent_worker, so inside Lambda without the queue there is nowhere to
+# keep a shed alarm and it is analysed in full instead. A re-analysis is
+# never shed again, so every shed alarm gets exactly one full analysis.
+
+SHED_QUEUE_DEPTH = int(os.environ.get('SHED_QUEUE_DEPTH', '50'))
+SHED_LATENCY_MS = float(os.environ.get('SHED_LATENCY_MS', '8000'))
+SHED_PRIORITY_CLASSES = os.environ.get('SHED_PRIORITY_CLASSES', 'low')
+REANALYSIS_QUEUE_URL = os.environ.get('REANALYSIS_QUEUE_URL')
+REANALYSIS_DELAY_SECONDS = int(os.environ.get('REANALYSIS_DELAY_SECONDS', '300'))
+IN_LAMBDA = bool(os.environ.get('AWS_LAMBDA_FUNCTION_NAME'))
+
+class LoadShedder:
+    """Overload detection with hysteresis and a bounded re-analysis backlog"""
+
+    def __init__(self, queue_depth=SHED_QUEUE_DEPTH, latency_ms=SHED_LATENCY_MS, classes=SHED_PRIORITY_CLASSES,
+                 recover_ratio=0.5, smoothing=0.2, stale_seconds=30.0, max_deferred=1000, policy=None):
+        self.queue_depth_limit = queue_depth
+        self.latency_limit = latency_ms
+        self.classes = {c.strip() for c in classes.split(',') if c.strip()} if isinstance(classes, str) else set(classes)
+        self.recover_ratio = recover_ratio
+        self.smoothing = smoothing
+        self.stale_seconds = stale_seconds
+        self.policy = policy or load_policy()
+        self.queue_depth = 0
+        self.latency_ms = 0.0
+        self.latency_at = 0.0
+        self.overloaded = False
+        self.deferred = deque(maxlen=max_deferred)
+        self.stats = {'shed': 0, 'deferred': 0, 'reanalysed': 0, 'overload_periods': 0, 'not_deferrable': 0}
+        self._lock = threading.Lock()
+
+    def _update(self):
+        if self.latency_ms and time.monotonic() - self.latency_at > self.stale_seconds:
+            self.latency_ms = 0.0
+        if self.overloaded:
+            if self.queue_depth < self.queue_depth_limit * self.recover_ratio and \
+                    self.latency_ms < self.latency_limit * self.recover_ratio:
+                self.overloaded = False
+                print(f"Load shedding off: depth {self.queue_depth}, model latency {self.latency_ms:.0f}ms")
+        elif self.queue_depth >= self.queue_depth_limit or self.latency_ms >= self.latency_limit:
+            self.overloaded = True
+            self.stats['overload_periods'] += 1
+            print(f"Load shedding on: depth {self.queue_depth}, model latency {self.latency_ms:.0f}ms")
+
+    def observe_queue_depth(self, depth):
+        with self._lock:
+            self.queue_depth = depth
+            self._update()
+
+    def observe_latency(self, elapsed_ms):
+        """Fold one model call's latency (queueing included) into the moving average"""
+        with self._lock:
+            if self.latency_ms:
+                self.latency_ms += self.smoothing * (elapsed_ms - self.latency_ms)
+            else:
+                self.latency_ms = elapsed_ms
+            self.latency_at = time.monotonic()
+            self._update()
+
+    def can_defer(self):
+        """False inside Lambda without a re-analysis queue, where nothing would drain the backlog"""
+        return bool(REANALYSIS_QUEUE_URL) or not IN_LAMBDA
+
+    def should_shed(self, event):
+        """True when overloaded, the alarm's priority class is sheddable and it can be deferred"""
+        if isinstance(event, dict) and event.get('reanalysis'):
+            # Shed once already; deferring it again could go on forever
+            return False
+        with self._lock:
+            self._update()
+            if not self.overloaded:
+                return False
+        priority_class, _ = alarm_priority(event, self.policy)
+        if priority_class not in self.classes:
+            return False
+        if not self.can_defer():
+            with self._lock:
+                self.stats['not_deferrable'] += 1
+                first = self.stats['not_deferrable'] == 1
+            if first:
+                print("Load shedding needs REANALYSIS_QUEUE_URL in Lambda; analysing shed alarms in full")
+            return False
+        with self._lock:
+            self.stats['shed'] += 1
+        return True
+
+    def defer(self, event):
+        """
+        Keep a shed event for re-analysis, on SQS if configured else in
+        memory; False when it could not be kept and must be analysed now
+        """
+        # Each deferral is its own delivery as far as idempotency goes
+        event = dict(event, reanalysis=True, deferral_id=uuid.uuid4().hex)
+        if REANALYSIS_QUEUE_URL:
+            try:
+                get_client('sqs').send_message(QueueUrl=REANALYSIS_QUEUE_URL, MessageBody=json.dumps(event),
+                                               DelaySeconds=REANALYSIS_DELAY_SECONDS)
+                with self._lock:
+                    self.stats['deferred'] += 1
+                return True
+            except Exception as e:
+                print(f"Error queueing re-analysis: {str(e)}")
+        if IN_LAMBDA:
+            # Nothing drains this container's memory
+            return False
+        with self._lock:
+            self.stats['deferred'] += 1
+            self.deferred.append(event)
+        return True
+
+    def cancel(self, alarm_name):
+        """Drop deferred re-analyses of an alarm that has recovered"""
+        with self._lock:
+            kept = [e for e in self.deferred if e.get('detail', {}).get('alarmName') != alarm_name]
+            dropped = len(self.deferred) - len(kept)
+            self.deferred.clear()
+            self.deferred.extend(kept)
+        return dropped
+
+    def take_deferred(self, limit):
+        """
+        Deferred events to re-analyse now: none while still overloaded, and
+        only as many as keep the queue below the recovery depth
+        """
+        events = []
+        with self._lock:
+            self._update()
+            limit = min(limit, int(self.queue_depth_limit * self.recover_ratio) - self.queue_depth)
+            while self.deferred and not self.overloaded and len(events) < limit:
+                events.append(self.deferred.popleft())
+            self.stats['reanalysed'] += len(events)
+        return events
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self.stats, overloaded=self.overloaded, queue_depth=self.queue_depth,
+                        model_latency_ms=round(self.latency_ms, 1), deferred_backlog=len(self.deferred))
+
+_shedder = LoadShedder()
+pending.add_cancel_hook('deferred', _shedder.cancel)
+
+def get_shedder():
+    return _shedder
+
+def observe_model_latency(elapsed_ms):
+    _shedder.observe_latency(elapsed_ms)
+
+def shedding_stats():
+    return _shedder.snapshot()
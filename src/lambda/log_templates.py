@@ -0,0 +1,206 @@
+import calendar
+import json
+import os
+import re
+import time
+from collections import OrderedDict, deque
+
+from clients import get_client
+
+# Recent log lines for an alarm, compressed into prompt context by an
+# online Drain-style template miner: lines are masked (ids, addresses,
+# numbers), routed through a fixed-depth tree by token count and leading
+# tokens, and merged into the most similar template in the leaf, with
+# differing tokens becoming <*>. Templates are capped and the least
+# recently matched is evicted, so memory stays bounded however many lines
+# are streamed. The top templates with counts and one example each give
+# the model the shape of the logs in a few hundred tokens.
+#
+# Lines come from LOG_CONTEXT_FILE when set (a local stand-in), otherwise
+# from the CloudWatch Logs group LOG_GROUPS maps the alarm name or
+# namespace to, over the LOG_WINDOW seconds up to the alarm's state
+# change. FilterLogEvents only pages forward, so the window is read in
+# LOG_SLICE slices from the alarm backwards to mine the newest lines, and
+# reading stops at LOG_CONTEXT_TIMEOUT with whatever has arrived.
+
+LOG_GROUPS = json.loads(os.environ.get('LOG_GROUPS', '{}'))
+LOG_CONTEXT_FILE = os.environ.get('LOG_CONTEXT_FILE')
+LOG_WINDOW = int(os.environ.get('LOG_WINDOW', '900'))
+LOG_MAX_LINES = int(os.environ.get('LOG_MAX_LINES', '5000'))
+LOG_SLICE = int(os.environ.get('LOG_SLICE', '60'))
+LOG_CONTEXT_TIMEOUT = float(os.environ.get('LOG_CONTEXT_TIMEOUT', '2'))
+LOG_TOP_TEMPLATES = int(os.environ.get('LOG_TOP_TEMPLATES', '5'))
+LOG_CONTEXT_CHARS = int(os.environ.get('LOG_CONTEXT_CHARS', '1200'))
+DRAIN_MAX_CLUSTERS = int(os.environ.get('DRAIN_MAX_CLUSTERS', '512'))
+DRAIN_SIMILARITY = float(os.environ.get('DRAIN_SIMILARITY', '0.5'))
+DRAIN_DEPTH = 2
+DRAIN_MAX_CHILDREN = 64
+DRAIN_MAX_TOKENS = 48
+EXAMPLE_CHARS = 160
+WILDCARD = '<*>'
+
+_MASKS = [
+    re.compile(r'\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?(?:Z|[+-]\d{2}:?\d{2})?'),
+    re.compile(r'\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b', re.IGNORECASE),
+    re.compile(r'\b\d{1,3}(?:\.\d{1,3}){3}(?::\d+)?\b'),
+    re.compile(r'\b(?:0x)?[0-9a-f]*\d[0-9a-f]*\b', re.IGNORECASE),
+    re.compile(r'(?<![A-Za-z])[-+]?\d+(?:\.\d+)?(?:ms|s|%|[kKMG]i?B)?\b')
+]
+
+def mask(line):
+    for pattern in _MASKS:
+        line = pattern.sub(WILDCARD, line)
+    return line
+
+class TemplateMiner:
+    """Online Drain log clustering with at most max_clusters templates"""
+
+    def __init__(self, max_clusters=DRAIN_MAX_CLUSTERS, similarity=DRAIN_SIMILARITY):
+        self.max_clusters = max_clusters
+        self.similarity = similarity
+        self._tree = {}
+        self._clusters = OrderedDict()
+        self._next_id = 0
+        self.stats = {'lines': 0, 'clusters': 0, 'evicted': 0}
+
+    def _leaf_key(self, tokens):
+        """Token count plus the first DRAIN_DEPTH tokens; numeric-looking ones collapse to <*>"""
+        key = [len(tokens)]
+        for token in tokens[:DRAIN_DEPTH]:
+            key.append(WILDCARD if any(c.isdigit() for c in token) else token)
+        return tuple(key)
+
+    def _leaf(self, tokens):
+        key = self._leaf_key(tokens)
+        leaf = self._tree.get(key)
+        if leaf is None:
+            # A full level sends new leading tokens to the wildcard branch
+            siblings = sum(1 for other in self._tree if other[:-1] == key[:-1]) if len(key) > 1 else 0
+            if siblings >= DRAIN_MAX_CHILDREN:
+                key = key[:-1] + (WILDCARD,)
+            leaf = self._tree.setdefault(key, [])
+        return key, leaf
+
+    def add(self, line):
+        """Cluster one raw log line and return its template's id"""
+        tokens = mask(line.strip()).split()[:DRAIN_MAX_TOKENS]
+        if not tokens:
+            return None
+        self.stats['lines'] += 1
+        key, leaf = self._leaf(tokens)
+
+        best, best_similarity = None, -1.0
+        for cluster_id in leaf:
+            template = self._clusters[cluster_id]['template']
+            similarity = sum(1 for a, b in zip(template, tokens) if a == b) / len(tokens)
+            if similarity > best_similarity:
+                best, best_similarity = cluster_id, similarity
+
+        if best is not None and best_similarity >= self.similarity:
+            cluster = self._clusters[best]
+            cluster['template'] = [a if a == b else WILDCARD for a, b in zip(cluster['template'], tokens)]
+            cluster['count'] += 1
+            self._clusters.move_to_end(best)
+            return best
+
+        cluster_id = self._next_id
+        self._next_id += 1
+        self._clusters[cluster_id] = {'template': tokens, 'count': 1, 'example': line.strip()[:EXAMPLE_CHARS],
+                                      'key': key}
+        leaf.append(cluster_id)
+        self.stats['clusters'] += 1
+        while len(self._clusters) > self.max_clusters:
+            self._evict()
+        return cluster_id
+
+    def _evict(self):
+        cluster_id, cluster = self._clusters.popitem(last=False)
+        leaf = self._tree[cluster['key']]
+        leaf.remove(cluster_id)
+        if not leaf:
+            del self._tree[cluster['key']]
+        self.stats['evicted'] += 1
+
+    def top(self, n=LOG_TOP_TEMPLATES):
+        """The n most frequent templates as {template, count, example}"""
+        clusters = sorted(self._clusters.values(), key=lambda c: c['count'], reverse=True)[:n]
+        return [{'template': ' '.join(c['template']), 'count': c['count'], 'example': c['example']}
+                for c in clusters]
+
+    def summary(self, n=LOG_TOP_TEMPLATES, max_chars=LOG_CONTEXT_CHARS):
+        """Prompt block of the top templates, cut to max_chars; empty when nothing was mined"""
+        templates = self.top(n)
+        if not templates:
+            return ''
+        lines = [f"Recent logs ({self.stats['lines']} lines, top templates with counts):"]
+        used = len(lines[0])
+        for entry in templates:
+            line = f"- {entry['count']}x {entry['template']}"
+            example = f"\n  e.g. {entry['example']}" if entry['example'] != entry['template'] else ''
+            # The example is dropped before the template is
+            if used + len(line) + len(example) + 1 <= max_chars:
+                line += example
+            elif used + len(line) + 1 > max_chars:
+                break
+            lines.append(line)
+            used += len(line) + 1
+        return '\n'.join(lines)
+
+def tail_file(path, limit=LOG_MAX_LINES):
+    """The last limit lines of a local log file"""
+    with open(path, errors='replace') as f:
+        return deque(f, maxlen=limit)
+
+def filter_log_events(logs_client, log_group, start_ms, end_ms, limit=LOG_MAX_LINES, deadline=None):
+    """The newest limit messages of a CloudWatch Logs group in [start_ms, end_ms], oldest first"""
+    slices, seen, slice_end = [], 0, end_ms
+    while slice_end >= start_ms and seen < limit:
+        slice_start = max(start_ms, slice_end - LOG_SLICE * 1000 + 1)
+        kwargs = {'logGroupName': log_group, 'startTime': slice_start, 'endTime': slice_end}
+        # Each slice comes back oldest first; only its newest lines still fit
+        newest = deque(maxlen=limit - seen)
+        slices.append(newest)
+        while True:
+            if deadline is not None and time.monotonic() >= deadline:
+                print(f"Log read of {log_group} hit its deadline after {seen + len(newest)} lines")
+                return [message for chunk in reversed(slices) for message in chunk]
+            response = logs_client.filter_log_events(**kwargs)
+            newest.extend(event['message'] for event in response.get('events', []))
+            if not response.get('nextToken'):
+                break
+            kwargs['nextToken'] = response['nextToken']
+        seen += len(newest)
+        slice_end = slice_start - 1
+    return [message for chunk in reversed(slices) for message in chunk]
+
+def alarm_time_ms(alarm_data):
+    """Epoch ms of the alarm's state change, capped at now; now if it carries none"""
+    now = time.time()
+    try:
+        timestamp = calendar.timegm(time.strptime(str(alarm_data.get('timestamp'))[:19], '%Y-%m-%dT%H:%M:%S'))
+    except (TypeError, ValueError):
+        timestamp = now
+    return int(min(timestamp, now) * 1000)
+
+def log_group_for(alarm_data):
+    return LOG_GROUPS.get(alarm_data['alarm_name']) or LOG_GROUPS.get(alarm_data['namespace'])
+
+def log_context(alarm_data, logs_client=None):
+    """Mined template summary of the alarm's recent logs, or '' when no source is configured or readable"""
+    try:
+        if LOG_CONTEXT_FILE:
+            lines = tail_file(LOG_CONTEXT_FILE)
+        else:
+            log_group = log_group_for(alarm_data)
+            if not log_group:
+                return ''
+            end_ms = alarm_time_ms(alarm_data)
+            lines = filter_log_events(logs_client or get_client('logs'), log_group, end_ms - LOG_WINDOW * 1000,
+                                      end_ms, deadline=time.monotonic() + LOG_CONTEXT_TIMEOUT)
+        miner = TemplateMiner()
+        for line in lines:
+            miner.add(line)
+        return miner.summary()
+    except Exception as e:
+        print(f"Log context unavailable for {alarm_data['alarm_name']}: {str(e)}")
+        return ''
@@ -0,0 +1,34 @@
+import json
+import os
+import time
+
+# CloudWatch Embedded Metric Format: one JSON line on stdout is turned into
+# metrics by CloudWatch Logs, with no PutMetricData call on the hot path
+
+NAMESPACE = os.environ.get('METRICS_NAMESPACE', 'IntelliNemo/Agent')
+
+def metric_unit(name):
+    if name.endswith('Ms'):
+        return 'Milliseconds'
+    if name.endswith('Bytes'):
+        return 'Bytes'
+    return 'Count'
+
+def emit_metrics(values, dimensions=None, properties=None):
+    """Print one EMF record with the given metric values and dimensions"""
+    dimensions = dimensions or {}
+    record = {
+        '_aws': {
+            'Timestamp': int(time.time() * 1000),
+            'CloudWatchMetrics': [{
+                'Namespace': NAMESPACE,
+                'Dimensions': [sorted(dimensions)],
+                'Metrics': [{'Name': name, 'Unit': metric_unit(name)} for name in values]
+            }]
+        }
+    }
+    record.update(properties or {})
+    record.update(dimensions)
+    record.update(values)
+    print(json.dumps(record, default=str))
+    return record
@@ -0,0 +1,153 @@
+import hashlib
+import os
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+
+# Recent decisions indexed by MinHash signatures of the alarm's name and
+# reason tokens, so an alarm that differs from one decided moments ago
+# only in host ids, percentages or word order reuses that decision
+# instead of a model call. Numbers and id-like tokens are folded before
+# hashing; candidates come from LSH bands within the same namespace and
+# metric and are confirmed by exact Jaccard similarity of the token sets.
+
+NEAR_DUP_THRESHOLD = float(os.environ.get('NEAR_DUP_THRESHOLD', '0.8'))
+NEAR_DUP_TTL = float(os.environ.get('NEAR_DUP_TTL', '900'))
+NEAR_DUP_MAX_ENTRIES = int(os.environ.get('NEAR_DUP_MAX_ENTRIES', '2048'))
+PERMUTATIONS = 64
+BANDS = 16
+
+# Each "permutation" XORs the 32-bit token hash with a fixed random mask;
+# small ints keep a signature to about 0.15ms in CPython
+_MASKS = [random.Random(0x5EED + i).getrandbits(32) for i in range(PERMUTATIONS)]
+
+_SPLIT = re.compile(r'[^a-z0-9%]+')
+_NUMBER = re.compile(r'^\d+%?$')
+
+def _fold(token):
+    if _NUMBER.match(token):
+        return '<pct>' if token.endswith('%') else '<num>'
+    # Host, instance and request ids: long tokens mixing letters and digits
+    if len(token) >= 6 and any(c.isdigit() for c in token) and any(c.isalpha() for c in token):
+        return '<id>'
+    return token
+
+def alarm_tokens(alarm_data):
+    """Folded token set of an alarm's name and reason"""
+    tokens = set()
+    for field in ('alarm_name', 'reason'):
+        for token in _SPLIT.split(str(alarm_data.get(field, '')).lower()):
+            if token:
+                tokens.add(f"{field[0]}:{_fold(token)}")
+    return frozenset(tokens)
+
+def signature(tokens):
+    """MinHash signature: the minimum of each permuted token hash"""
+    hashes = [int.from_bytes(hashlib.blake2b(token.encode(), digest_size=4).digest(), 'little')
+              for token in tokens] or [0]
+    return tuple(min(map(mask.__xor__, hashes)) for mask in _MASKS)
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+class NearDuplicateIndex:
+    """Bounded LSH index of recent decisions, partitioned by namespace and metric"""
+
+    def __init__(self, threshold=NEAR_DUP_THRESHOLD, ttl=NEAR_DUP_TTL, max_entries=NEAR_DUP_MAX_ENTRIES):
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.rows = PERMUTATIONS // BANDS
+        self._entries = OrderedDict()
+        self._buckets = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+        self.stats = {'stored': 0, 'hits': 0, 'misses': 0, 'evicted': 0}
+
+    def _bands(self, partition, sig):
+        return [(partition, band, sig[band * self.rows:(band + 1) * self.rows]) for band in range(BANDS)]
+
+    def _remove(self, entry_id):
+        entry = self._entries.pop(entry_id)
+        for key in entry['bands']:
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(entry_id)
+                if not bucket:
+                    del self._buckets[key]
+
+    def add(self, alarm_data, decision):
+        """Index a model decision under the alarm it was made for"""
+        self.expire()
+        tokens = alarm_tokens(alarm_data)
+        partition = (alarm_data['namespace'], alarm_data['metric_name'])
+        bands = self._bands(partition, signature(tokens))
+        with self._lock:
+            entry_id = self._next_id
+            self._next_id += 1
+            self._entries[entry_id] = {'alarm_name': alarm_data['alarm_name'], 'tokens': tokens, 'bands': bands,
+                                       'decision': dict(decision), 'stored_at': time.monotonic()}
+            for key in bands:
+                self._buckets.setdefault(key, set()).add(entry_id)
+            self.stats['stored'] += 1
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.stats['evicted'] += 1
+
+    def match(self, alarm_data):
+        """The decision of the most similar recent alarm at or above the threshold, or None"""
+        tokens = alarm_tokens(alarm_data)
+        partition = (alarm_data['namespace'], alarm_data['metric_name'])
+        bands = self._bands(partition, signature(tokens))
+        now = time.monotonic()
+        with self._lock:
+            candidates = set()
+            for key in bands:
+                candidates.update(self._buckets.get(key, ()))
+            best, best_similarity = None, 0.0
+            for entry_id in candidates:
+                entry = self._entries[entry_id]
+                if now - entry['stored_at'] > self.ttl:
+                    continue
+                similarity = jaccard(tokens, entry['tokens'])
+                if similarity > best_similarity:
+                    best, best_similarity = entry, similarity
+            if best is None or best_similarity < self.threshold:
+                self.stats['misses'] += 1
+                if best is not None:
+                    print(f"Nearest recent alarm {best['alarm_name']} at distance {1 - best_similarity:.3f}, "
+                          f"not reused")
+                return None
+            self.stats['hits'] += 1
+
+        distance = round(1 - best_similarity, 3)
+        print(f"Near-duplicate of {best['alarm_name']} (distance {distance}), reusing its decision")
+        decision = dict(best['decision'])
+        decision['near_duplicate'] = {'alarm': best['alarm_name'], 'distance': distance,
+                                      'age_s': round(now - best['stored_at'], 1)}
+        return decision
+
+    def expire(self):
+        """Drop entries older than the TTL"""
+        now = time.monotonic()
+        with self._lock:
+            # Entries are kept in insertion order, so the oldest come first
+            while self._entries:
+                entry_id = next(iter(self._entries))
+                if now - self._entries[entry_id]['stored_at'] <= self.ttl:
+                    break
+                self._remove(entry_id)
+                self.stats['evicted'] += 1
+
+_index = None
+_index_lock = threading.Lock()
+
+def get_index():
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = NearDuplicateIndex()
+    return _index
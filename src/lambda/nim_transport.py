@@ -0,0 +1,351 @@
+import json
+import os
+import socket
+import ssl
+import threading
+import time
+from urllib.parse import urlsplit
+
+from adaptive_limiter import get_limiter
+from clients import get_session
+from single_flight import SingleFlight
+
+# Opt-in HTTP/2 transport for NIM calls. Concurrent requests to the same
+# endpoint share one connection as multiplexed streams; endpoints that do
+# not negotiate h2, or a deployment without the h2 package, use the pooled
+# HTTP/1.1 session instead. h2 is imported only when HTTP/2 is enabled.
+# Connections are dialled outside the module lock, one dial per endpoint
+# at a time, so a slow handshake never stalls calls to other endpoints.
+
+CONNECT_TIMEOUT = 5
+
+_connections = {}
+_fallback = set()
+_stats = {}
+_lock = threading.Lock()
+_dials = SingleFlight()
+
+class HTTP2Unavailable(Exception):
+    """The endpoint cannot be spoken to over HTTP/2"""
+
+class NIMResponse:
+    """The subset of requests.Response the handlers use"""
+
+    def __init__(self, status_code, headers, content):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            import requests
+            raise requests.HTTPError(f"{self.status_code} error from NIM endpoint", response=self)
+
+class _Stream:
+    def __init__(self):
+        self.done = threading.Event()
+        self.status_code = None
+        self.headers = {}
+        self.data = bytearray()
+        self.error = None
+
+class HTTP2Connection:
+    """One HTTP/2 connection shared by every thread talking to an endpoint"""
+
+    def __init__(self, scheme, host, port, connect_timeout=CONNECT_TIMEOUT):
+        try:
+            import h2.config
+            import h2.connection
+            import h2.events
+        except ImportError as e:
+            raise HTTP2Unavailable(f"h2 package not available: {e}")
+        self.h2_events = h2.events
+        self.scheme = scheme
+        self.authority = f"{host}:{port}"
+
+        sock = socket.create_connection((host, port), timeout=connect_timeout)
+        if scheme == 'https':
+            context = ssl.create_default_context()
+            context.set_alpn_protocols(['h2', 'http/1.1'])
+            sock = context.wrap_socket(sock, server_hostname=host)
+            if sock.selected_alpn_protocol() != 'h2':
+                sock.close()
+                raise HTTP2Unavailable(f"{self.authority} did not negotiate h2")
+        self.sock = sock
+
+        self.conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=True, header_encoding='utf-8'))
+        self.cond = threading.Condition()
+        self.streams = {}
+        self.closed = False
+        self.settings_received = False
+
+        # Plain-text endpoints are tried with prior knowledge; waiting for the
+        # server's SETTINGS frame tells an h2 server apart from an HTTP/1.1 one
+        self.conn.initiate_connection()
+        self.sock.sendall(self.conn.data_to_send())
+        self._await_settings(connect_timeout)
+        self.sock.settimeout(None)
+        threading.Thread(target=self._read_loop, daemon=True).start()
+
+    def _await_settings(self, timeout):
+        deadline = time.monotonic() + timeout
+        try:
+            while not self.settings_received:
+                self.sock.settimeout(max(deadline - time.monotonic(), 0.001))
+                data = self.sock.recv(65535)
+                if not data:
+                    raise HTTP2Unavailable(f"{self.authority} closed the connection during the h2 preface")
+                with self.cond:
+                    self._handle(self.conn.receive_data(data))
+                    self._flush()
+        except HTTP2Unavailable:
+            self.sock.close()
+            raise
+        except Exception as e:
+            self.sock.close()
+            raise HTTP2Unavailable(f"{self.authority} did not complete the h2 preface: {e}")
+
+    def _read_loop(self):
+        while True:
+            try:
+                data = self.sock.recv(65535)
+            except OSError:
+                data = b''
+            with self.cond:
+                if not data:
+                    self._fail(ConnectionError(f"HTTP/2 connection to {self.authority} closed"))
+                    return
+                try:
+                    self._handle(self.conn.receive_data(data))
+                    self._flush()
+                except Exception as e:
+                    self._fail(e)
+                    return
+                self.cond.notify_all()
+
+    def _handle(self, events):
+        """Apply h2 events to the waiting streams; called with the condition held"""
+        for event in events:
+            stream = self.streams.get(getattr(event, 'stream_id', None))
+            if isinstance(event, self.h2_events.RemoteSettingsChanged):
+                self.settings_received = True
+            elif isinstance(event, self.h2_events.ResponseReceived) and stream:
+                stream.headers = dict(event.headers)
+                stream.status_code = int(stream.headers[':status'])
+            elif isinstance(event, self.h2_events.DataReceived):
+                self.conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                if stream:
+                    stream.data.extend(event.data)
+            elif isinstance(event, self.h2_events.StreamEnded) and stream:
+                stream.done.set()
+            elif isinstance(event, self.h2_events.StreamReset) and stream:
+                stream.error = ConnectionError(f"stream reset by {self.authority} (error {event.error_code})")
+                stream.done.set()
+            elif isinstance(event, self.h2_events.ConnectionTerminated):
+                self._fail(ConnectionError(f"{self.authority} sent GOAWAY (error {event.error_code})"))
+
+    def _flush(self):
+        data = self.conn.data_to_send()
+        if data:
+            self.sock.sendall(data)
+
+    def _fail(self, error):
+        self.closed = True
+        for stream in self.streams.values():
+            if not stream.done.is_set():
+                stream.error = error
+                stream.done.set()
+        self.cond.notify_all()
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+
+    def _wait(self, deadline, waiting_for):
+        """Wait for the read loop to make progress; called with the condition held"""
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"No {waiting_for} from {self.authority} within the request timeout")
+        self.cond.wait(remaining)
+
+    def request(self, method, path, headers, body, timeout):
+        """Send one request as a new stream and wait for its response, all within timeout"""
+        deadline = time.monotonic() + timeout
+        stream = _Stream()
+        stream_id = None
+        try:
+            with self.cond:
+                while not self.closed and \
+                        self.conn.open_outbound_streams >= self.conn.remote_settings.max_concurrent_streams:
+                    self._wait(deadline, 'stream capacity')
+                if self.closed:
+                    raise ConnectionError(f"HTTP/2 connection to {self.authority} closed")
+
+                stream_id = self.conn.get_next_available_stream_id()
+                self.streams[stream_id] = stream
+                request_headers = [(':method', method), (':scheme', self.scheme),
+                                   (':authority', self.authority), (':path', path),
+                                   ('content-length', str(len(body)))]
+                request_headers += [(name.lower(), value) for name, value in headers.items()]
+                self.conn.send_headers(stream_id, request_headers, end_stream=not body)
+
+                offset = 0
+                while offset < len(body):
+                    window = min(self.conn.local_flow_control_window(stream_id), self.conn.max_outbound_frame_size)
+                    if window <= 0:
+                        self._flush()
+                        self._wait(deadline, 'flow control window')
+                        if self.closed:
+                            raise ConnectionError(f"HTTP/2 connection to {self.authority} closed")
+                        continue
+                    chunk = body[offset:offset + window]
+                    offset += len(chunk)
+                    self.conn.send_data(stream_id, chunk, end_stream=offset >= len(body))
+                self._flush()
+
+            if not stream.done.wait(max(deadline - time.monotonic(), 0)):
+                raise TimeoutError(f"No response from {self.authority} within {timeout}s")
+            if stream.error:
+                raise stream.error
+            return NIMResponse(stream.status_code, stream.headers, bytes(stream.data))
+        finally:
+            with self.cond:
+                # A stream abandoned mid-request is reset so the server stops work on it
+                if stream_id is not None and not stream.done.is_set() and not self.closed:
+                    try:
+                        self.conn.reset_stream(stream_id)
+                        self._flush()
+                    except Exception:
+                        pass
+                self.streams.pop(stream_id, None)
+                self.cond.notify_all()
+
+    def close(self):
+        with self.cond:
+            if not self.closed:
+                try:
+                    self.conn.close_connection()
+                    self._flush()
+                except Exception:
+                    pass
+                self._fail(ConnectionError('closed by client'))
+
+def http2_enabled():
+    return os.environ.get('NIM_HTTP2', 'false').lower() == 'true'
+
+def _endpoint_stats(origin):
+    with _lock:
+        return _stats.setdefault(origin, {
+            'mode': 'http/1.1',
+            'requests': 0,
+            'errors': 0,
+            'in_flight': 0,
+            'peak_concurrency': 0,
+            'http2_connections': 0,
+            'fallbacks': 0
+        })
+
+def _live_connection(origin):
+    with _lock:
+        connection = _connections.get(origin)
+        return connection if connection is not None and not connection.closed else None
+
+def _dial(origin, parts, stats):
+    """Connect to the endpoint outside the lock and publish the connection under it"""
+    connection = _live_connection(origin)
+    if connection is not None:
+        return connection
+    port = parts.port or (443 if parts.scheme == 'https' else 80)
+    try:
+        connection = HTTP2Connection(parts.scheme, parts.hostname, port)
+    except HTTP2Unavailable as e:
+        print(f"HTTP/2 unavailable for {origin}, using HTTP/1.1: {str(e)}")
+        with _lock:
+            _fallback.add(origin)
+            stats['fallbacks'] += 1
+            stats['mode'] = 'http/1.1'
+        return None
+    except OSError as e:
+        # Unreachable rather than unsupported: let the HTTP/1.1 path
+        # surface the error and try h2 again next time
+        print(f"HTTP/2 connect to {origin} failed: {str(e)}")
+        return None
+    with _lock:
+        _connections[origin] = connection
+        stats['http2_connections'] += 1
+        stats['mode'] = 'h2'
+    return connection
+
+def _http2_connection(origin, parts, stats):
+    """Open or reuse the endpoint's HTTP/2 connection; None means use HTTP/1.1"""
+    connection = _live_connection(origin)
+    if connection is not None:
+        return connection
+    # Callers arriving during a handshake wait for it rather than dialling again
+    return _dials.do(origin, lambda: _dial(origin, parts, stats))
+
+def post(url, payload, headers=None, timeout=30):
+    """
+    POST a JSON payload to a NIM endpoint and return a response-like object;
+    calls per endpoint are capped by its adaptive concurrency limit
+    """
+    headers = dict(headers or {})
+    parts = urlsplit(url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+    stats = _endpoint_stats(origin)
+
+    connection = None
+    if http2_enabled() and origin not in _fallback:
+        connection = _http2_connection(origin, parts, stats)
+
+    with get_limiter(origin).track(timeout) as sample:
+        with _lock:
+            stats['requests'] += 1
+            stats['in_flight'] += 1
+            stats['peak_concurrency'] = max(stats['peak_concurrency'], stats['in_flight'])
+        try:
+            if connection is not None:
+                headers.setdefault('Content-Type', 'application/json')
+                path = parts.path + (f"?{parts.query}" if parts.query else '')
+                response = connection.request('POST', path or '/', headers, json.dumps(payload).encode(), timeout)
+            else:
+                response = get_session().post(url, headers=headers, json=payload, timeout=timeout)
+            sample.status(response.status_code)
+            return response
+        except Exception:
+            with _lock:
+                stats['errors'] += 1
+            raise
+        finally:
+            with _lock:
+                stats['in_flight'] -= 1
+
+def transport_stats():
+    """Per-endpoint request, stream concurrency and connection counts"""
+    with _lock:
+        snapshot = {origin: dict(stats) for origin, stats in _stats.items()}
+    for origin, stats in snapshot.items():
+        if stats['mode'] == 'http/1.1':
+            try:
+                pool = get_session().get_adapter(origin).poolmanager.connection_from_url(origin)
+                stats['http1_connections'] = pool.num_connections
+            except Exception:
+                stats['http1_connections'] = None
+    return snapshot
+
+def reset():
+    """Close HTTP/2 connections and clear fallbacks and stats"""
+    with _lock:
+        for connection in _connections.values():
+            connection.close()
+        _connections.clear()
+        _fallback.clear()
+        _stats.clear()
@@ -0,0 +1,60 @@
+import os
+import shutil
+import tempfile
+
+import runbooks
+
+# CPU-bound steps (runbook similarity search, output parsing, decision
+# validation) go through call(). In a single process they run inline; in
+# worker process-pool mode they run in child processes that memory-map the
+# parent's runbook index and BM25 segments instead of building their own
+# copies.
+
+_executor = None
+_index_path = None
+
+def _attach(index_path):
+    """Process pool initializer: map the shared runbook index and its BM25 segments"""
+    os.environ['RUNBOOK_INDEX_PATH'] = index_path
+    os.environ['RUNBOOK_LEXICAL_DIR'] = lexical_dir(index_path)
+    runbooks.use_index(runbooks.RunbookIndex.open(index_path))
+    runbooks.use_lexical_index(None)
+
+def lexical_dir(index_path):
+    return f"{index_path}.lex"
+
+def default_index_path():
+    directory = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+    return os.path.join(directory, f"intellinemo-runbooks-{os.getpid()}.idx")
+
+def start_process_pool(processes, index_path=None, index=None):
+    """Build the runbook index once, save it for mapping and start the pool"""
+    global _executor, _index_path
+    from concurrent.futures import ProcessPoolExecutor
+    import multiprocessing
+
+    index_path = index_path or default_index_path()
+    (index or runbooks.get_index()).save(index_path)
+    runbooks.get_lexical_index().save(lexical_dir(index_path))
+    # spawn: the parent already runs worker threads, which fork does not copy safely
+    _executor = ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context('spawn'),
+                                    initializer=_attach, initargs=(index_path,))
+    runbooks.use_index(runbooks.RunbookIndex.open(index_path))
+    _index_path = index_path
+    return index_path
+
+def call(func, *args):
+    """Run a module-level function inline, or in the process pool when one is running"""
+    if _executor is None:
+        return func(*args)
+    return _executor.submit(func, *args).result()
+
+def shutdown():
+    global _executor, _index_path
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
+    if _index_path and os.path.exists(_index_path):
+        os.remove(_index_path)
+        shutil.rmtree(lexical_dir(_index_path), ignore_errors=True)
+    _index_path = None
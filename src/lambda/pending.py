@@ -0,0 +1,184 @@
+import os
+import threading
+import time
+
+from clients import get_client
+
+# Remediation that is queued or running for an alarm, so an ALARM->OK
+# transition can call it off: SSM executions started for the alarm are
+# stopped, queued or deferred work is dropped through cancel hooks, and
+# the recovery time is remembered so an ALARM still being reasoned about
+# does not execute afterwards.
+#
+# In Lambda the OK usually lands in a different container from the one
+# that started the remediation, so with a table configured (PENDING_TABLE,
+# by default the idempotency table) executions and recoveries are kept
+# there as 'pending#' and 'recovered#' items any container can read.
+# Without one they live in this process only, which suits agent_worker
+# and local runs. Cancel hooks always act on the receiving process.
+
+PENDING_TABLE = os.environ.get('PENDING_TABLE', os.environ.get('IDEMPOTENCY_TABLE'))
+PENDING_TTL = int(os.environ.get('PENDING_TTL', '3600'))
+
+class MemoryRegistry:
+    """Executions and recoveries known to this process"""
+
+    def __init__(self, ttl=PENDING_TTL):
+        self.ttl = ttl
+        self._executions = {}
+        self._recovered = {}
+        self._lock = threading.Lock()
+
+    def _expire(self, now):
+        for registry in (self._executions, self._recovered):
+            for alarm_name in [name for name, entry in registry.items() if now - entry[0] > self.ttl]:
+                del registry[alarm_name]
+
+    def add(self, alarm_name, started):
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            _, known = self._executions.get(alarm_name, (now, []))
+            self._executions[alarm_name] = (now, known + started)
+
+    def take(self, alarm_name):
+        with self._lock:
+            self._expire(time.monotonic())
+            return self._executions.pop(alarm_name, (0, []))[1]
+
+    def mark_recovered(self, alarm_name, recovered_at):
+        with self._lock:
+            self._recovered[alarm_name] = (time.monotonic(), recovered_at)
+
+    def recovered_at(self, alarm_name):
+        with self._lock:
+            self._expire(time.monotonic())
+            entry = self._recovered.get(alarm_name)
+        return entry[1] if entry else None
+
+class DynamoDBRegistry:
+    """Executions and recoveries as items in the shared table; expired items count as absent"""
+
+    def __init__(self, table, client=None, ttl=PENDING_TTL):
+        self.table = table
+        self.client = client
+        self.ttl = ttl
+
+    def _client(self):
+        return self.client or get_client('dynamodb')
+
+    def _key(self, kind, alarm_name):
+        return {'idempotency_key': {'S': f"{kind}#{alarm_name}"}}
+
+    def _live(self, item):
+        return item if item and float(item['expires_at']['N']) >= time.time() else None
+
+    def add(self, alarm_name, started):
+        self._client().update_item(
+            TableName=self.table,
+            Key=self._key('pending', alarm_name),
+            UpdateExpression='SET executions = list_append(if_not_exists(executions, :empty), :started), '
+                             'expires_at = :expires',
+            ExpressionAttributeValues={
+                ':empty': {'L': []},
+                ':started': {'L': [{'S': f"{kind}:{ident}"} for kind, ident in started]},
+                ':expires': {'N': str(int(time.time() + self.ttl))}
+            }
+        )
+
+    def take(self, alarm_name):
+        # Deleting with ALL_OLD hands the executions to exactly one canceller
+        response = self._client().delete_item(TableName=self.table, Key=self._key('pending', alarm_name),
+                                               ReturnValues='ALL_OLD')
+        item = self._live(response.get('Attributes'))
+        if item is None:
+            return []
+        return [tuple(value['S'].split(':', 1)) for value in item.get('executions', {}).get('L', [])]
+
+    def mark_recovered(self, alarm_name, recovered_at):
+        self._client().put_item(TableName=self.table, Item=dict(
+            self._key('recovered', alarm_name),
+            recovered_at={'S': recovered_at},
+            expires_at={'N': str(int(time.time() + self.ttl))}
+        ))
+
+    def recovered_at(self, alarm_name):
+        response = self._client().get_item(TableName=self.table, Key=self._key('recovered', alarm_name),
+                                           ConsistentRead=True)
+        item = self._live(response.get('Item'))
+        return item['recovered_at']['S'] if item else None
+
+_registry = None
+_hooks = {}
+_lock = threading.Lock()
+
+def get_registry():
+    global _registry
+    if _registry is None:
+        with _lock:
+            if _registry is None:
+                _registry = DynamoDBRegistry(PENDING_TABLE) if PENDING_TABLE else MemoryRegistry()
+    return _registry
+
+def register(alarm_name, automation_id=None, command_id=None):
+    """Remember an SSM automation or command started to remediate alarm_name"""
+    started = [(kind, ident) for kind, ident in (('automation', automation_id), ('command', command_id)) if ident]
+    if not started:
+        return
+    try:
+        get_registry().add(alarm_name, started)
+    except Exception as e:
+        print(f"Error recording pending remediation for {alarm_name}: {str(e)}")
+
+def add_cancel_hook(name, hook):
+    """hook(alarm_name) drops queued work for the alarm and returns how much it dropped"""
+    with _lock:
+        _hooks[name] = hook
+
+def superseded(alarm_name, alarm_timestamp):
+    """True if the alarm recovered after the state change being handled"""
+    if not alarm_timestamp:
+        return False
+    try:
+        recovered_at = get_registry().recovered_at(alarm_name)
+    except Exception as e:
+        # Fail open: the remediation goes ahead as it would without recovery tracking
+        print(f"Error reading recovery of {alarm_name}: {str(e)}")
+        return False
+    # CloudWatch and isoformat timestamps agree to the second
+    return recovered_at is not None and recovered_at[:19] > str(alarm_timestamp)[:19]
+
+def cancel(alarm_name, recovered_at):
+    """Call off pending remediation for a recovered alarm; returns what was cancelled"""
+    registry = get_registry()
+    started = []
+    try:
+        registry.mark_recovered(alarm_name, str(recovered_at or ''))
+        started = registry.take(alarm_name)
+    except Exception as e:
+        print(f"Error reading pending remediation for {alarm_name}: {str(e)}")
+    with _lock:
+        hooks = dict(_hooks)
+
+    cancelled = {'executions': 0}
+    for kind, ident in started:
+        try:
+            if kind == 'automation':
+                get_client('ssm').stop_automation_execution(AutomationExecutionId=ident, Type='Cancel')
+            else:
+                get_client('ssm').cancel_command(CommandId=ident)
+            cancelled['executions'] += 1
+        except Exception as e:
+            print(f"Error cancelling {kind} {ident}: {str(e)}")
+    for name, hook in hooks.items():
+        try:
+            cancelled[name] = hook(alarm_name)
+        except Exception as e:
+            print(f"Error cancelling {name} work for {alarm_name}: {str(e)}")
+    return cancelled
+
+def reset():
+    """Forget this process's registry; the next call builds a fresh one"""
+    global _registry
+    with _lock:
+        _registry = None
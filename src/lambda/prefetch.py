@@ -0,0 +1,257 @@
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+
+from clients import get_client
+from metrics import emit_metrics
+
+# Speculative pre-analysis: alarms that lost their data, or whose metric
+# sits just short of its threshold, are reasoned about before they fire.
+# The decision is cached per alarm (in memory, and in S3 so another
+# container can use it); when the ALARM arrives the handler only
+# re-validates it - still fresh, same metric, breaching value close to
+# the one that was analysed - instead of waiting on the model. Either way
+# the model sees the ALARM the alarm would raise, and a decision without
+# a value to compare against is never reused.
+# Watched alarms come from CloudWatch or, for local runs, from the JSON
+# stand-in at PREFETCH_METRICS_FILE.
+
+PREFETCH_TTL = float(os.environ.get('PREFETCH_TTL', '600'))
+PREFETCH_MARGIN = float(os.environ.get('PREFETCH_MARGIN', '0.1'))
+PREFETCH_DRIFT = float(os.environ.get('PREFETCH_DRIFT', '0.25'))
+PREFETCH_BUCKET = os.environ.get('PREFETCH_BUCKET', os.environ.get('S3_BUCKET'))
+PREFETCH_METRICS_FILE = os.environ.get('PREFETCH_METRICS_FILE')
+PREFETCH_PREFIX = 'prefetch/'
+
+# +1: breaches upwards, -1: breaches downwards
+COMPARISONS = {
+    'GreaterThanThreshold': 1,
+    'GreaterThanOrEqualToThreshold': 1,
+    'LessThanThreshold': -1,
+    'LessThanOrEqualToThreshold': -1
+}
+
+def is_prefetch_event(event):
+    """True for the scheduled {"prefetch": true} poll"""
+    return isinstance(event, dict) and event.get('prefetch') is True
+
+def near_threshold(value, threshold, operator, margin=PREFETCH_MARGIN):
+    """True if value has not breached yet but is within margin of the threshold"""
+    direction = COMPARISONS.get(operator)
+    if direction is None or value is None or threshold is None:
+        return False
+    gap = (threshold - value) * direction
+    return 0 < gap <= (abs(threshold) * margin or margin)
+
+def _latest_value(cloudwatch, alarm):
+    period = alarm.get('Period', 60)
+    end = datetime.utcnow()
+    response = cloudwatch.get_metric_statistics(
+        Namespace=alarm['Namespace'],
+        MetricName=alarm['MetricName'],
+        Dimensions=alarm.get('Dimensions', []),
+        StartTime=end - timedelta(seconds=period * 3),
+        EndTime=end,
+        Period=period,
+        Statistics=[alarm.get('Statistic', 'Average')]
+    )
+    datapoints = sorted(response.get('Datapoints', []), key=lambda d: d['Timestamp'])
+    if not datapoints:
+        return None
+    return datapoints[-1][alarm.get('Statistic', 'Average')]
+
+def _watched(cloudwatch, alarm):
+    return {
+        'alarm_name': alarm['AlarmName'],
+        'metric_name': alarm['MetricName'],
+        'namespace': alarm['Namespace'],
+        'threshold': alarm.get('Threshold'),
+        'operator': alarm.get('ComparisonOperator'),
+        'value': _latest_value(cloudwatch, alarm)
+    }
+
+def watched_alarms(cloudwatch=None, path=None):
+    """[{alarm_name, metric_name, namespace, threshold, operator, value}, ...] for alarms in OK"""
+    path = path or PREFETCH_METRICS_FILE
+    if path:
+        with open(path) as f:
+            return json.load(f)
+
+    cloudwatch = cloudwatch or get_client('cloudwatch')
+    watched = []
+    for page in cloudwatch.get_paginator('describe_alarms').paginate(StateValue='OK', AlarmTypes=['MetricAlarm']):
+        for alarm in page.get('MetricAlarms', []):
+            # Metric-math alarms have no single metric to read
+            if not alarm.get('MetricName'):
+                continue
+            try:
+                watched.append(_watched(cloudwatch, alarm))
+            except Exception as e:
+                print(f"Error reading {alarm['AlarmName']} metric: {str(e)}")
+    return watched
+
+def described_alarm(alarm_name, cloudwatch=None, path=None):
+    """One alarm shaped like a watched_alarms entry, in any state; None if it cannot be read"""
+    path = path or PREFETCH_METRICS_FILE
+    try:
+        if path:
+            with open(path) as f:
+                return next((alarm for alarm in json.load(f) if alarm['alarm_name'] == alarm_name), None)
+        cloudwatch = cloudwatch or get_client('cloudwatch')
+        alarms = cloudwatch.describe_alarms(AlarmNames=[alarm_name], AlarmTypes=['MetricAlarm'])['MetricAlarms']
+        return _watched(cloudwatch, alarms[0]) if alarms and alarms[0].get('MetricName') else None
+    except Exception as e:
+        print(f"Error describing alarm {alarm_name}: {str(e)}")
+        return None
+
+def predicted_alarm_data(alarm):
+    """alarm_data for an alarm that has not fired yet, shaped like extract_alarm_data's"""
+    return {
+        'alarm_name': alarm['alarm_name'],
+        'state': 'ALARM',
+        'reason': f"Predicted: {alarm['metric_name']} at {alarm['value']} approaching threshold {alarm['threshold']} "
+                  f"({alarm['operator']})",
+        'metric_name': alarm['metric_name'],
+        'namespace': alarm['namespace'],
+        'timestamp': datetime.utcnow().isoformat(),
+        'value': alarm['value']
+    }
+
+def breaching_value(event):
+    """Newest datapoint from an ALARM event's reasonData, if it carries one"""
+    reason_data = event.get('detail', {}).get('state', {}).get('reasonData')
+    try:
+        datapoints = json.loads(reason_data).get('recentDatapoints') if isinstance(reason_data, str) else None
+        return float(datapoints[-1]) if datapoints else None
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+class S3Store:
+    """Decisions as one small JSON object per alarm"""
+
+    def __init__(self, bucket, client=None):
+        self.bucket = bucket
+        self.client = client
+
+    def get(self, alarm_name):
+        client = self.client or get_client('s3')
+        try:
+            response = client.get_object(Bucket=self.bucket, Key=f"{PREFETCH_PREFIX}{alarm_name}.json")
+        except client.exceptions.NoSuchKey:
+            return None
+        return json.loads(response['Body'].read())
+
+    def put(self, alarm_name, entry):
+        client = self.client or get_client('s3')
+        client.put_object(Bucket=self.bucket, Key=f"{PREFETCH_PREFIX}{alarm_name}.json",
+                          Body=json.dumps(entry), ContentType='application/json')
+
+class DecisionCache:
+    """Pre-computed decisions per alarm, re-validated before use"""
+
+    def __init__(self, store=None, ttl=PREFETCH_TTL, drift=PREFETCH_DRIFT):
+        self.store = store
+        self.ttl = ttl
+        self.drift = drift
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.stats = {'stored': 0, 'hits': 0, 'misses': 0, 'stale': 0, 'drifted': 0, 'unverified': 0,
+                      'store_errors': 0}
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def fresh(self, alarm_name):
+        """A cached entry younger than the TTL, or None"""
+        with self._lock:
+            entry = self._entries.get(alarm_name)
+        if entry is None and self.store is not None:
+            try:
+                entry = self.store.get(alarm_name)
+            except Exception as e:
+                print(f"Error reading pre-analysis for {alarm_name}: {str(e)}")
+                self._count('store_errors')
+        if entry is None or time.time() - entry['computed_at'] > self.ttl:
+            return None
+        return entry
+
+    def put(self, alarm_data, decision):
+        entry = {
+            'decision': decision,
+            'metric_name': alarm_data['metric_name'],
+            'namespace': alarm_data['namespace'],
+            'value': alarm_data.get('value'),
+            'computed_at': time.time()
+        }
+        with self._lock:
+            self._entries[alarm_data['alarm_name']] = entry
+            self.stats['stored'] += 1
+        if self.store is not None:
+            try:
+                self.store.put(alarm_data['alarm_name'], entry)
+            except Exception as e:
+                print(f"Error storing pre-analysis for {alarm_data['alarm_name']}: {str(e)}")
+                self._count('store_errors')
+
+    def revalidate(self, event, alarm_data):
+        """The pre-computed decision if it still holds for this ALARM, else None"""
+        entry = self.fresh(alarm_data['alarm_name'])
+        if entry is None:
+            self._count('misses')
+            return None
+        if (entry['metric_name'], entry['namespace']) != (alarm_data['metric_name'], alarm_data['namespace']):
+            self._count('stale')
+            return None
+        value = breaching_value(event)
+        if value is None or entry['value'] is None:
+            # Nothing to tell whether the decision still fits this ALARM
+            self._count('unverified')
+            return None
+        if abs(value - entry['value']) > abs(entry['value']) * self.drift:
+            # The metric moved well past what was analysed
+            self._count('drifted')
+            return None
+        with self._lock:
+            self._entries.pop(alarm_data['alarm_name'], None)
+            self.stats['hits'] += 1
+        decision = dict(entry['decision'])
+        decision['prefetched'] = {'age_s': round(time.time() - entry['computed_at'], 1), 'value': entry['value']}
+        return decision
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_cache():
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = DecisionCache(S3Store(PREFETCH_BUCKET) if PREFETCH_BUCKET else None)
+    return _cache
+
+def pre_analyse(handler_name, alarms, analyse):
+    """
+    Run analyse(alarm_data) for each alarm without a fresh decision and
+    cache the answers that came from a model
+    """
+    cache = get_cache()
+    analysed = skipped = 0
+    for alarm_data in alarms:
+        if cache.fresh(alarm_data['alarm_name']) is not None:
+            skipped += 1
+            continue
+        try:
+            decision = analyse(alarm_data)
+        except Exception as e:
+            print(f"Pre-analysis failed for {alarm_data['alarm_name']}: {str(e)}")
+            continue
+        # Fallback answers would only stand in for a real decision
+        if decision.get('model_used'):
+            cache.put(alarm_data, decision)
+            analysed += 1
+    emit_metrics({'PrefetchAnalyses': analysed, 'PrefetchSkipped': skipped},
+                 dimensions={'Handler': handler_name, 'InvocationType': 'Prefetch'})
+    return {'prefetch': True, 'analysed': analysed, 'skipped': skipped}
@@ -0,0 +1,409 @@
+import hashlib
+import json
+import math
+import mmap
+import operator
+import os
+import re
+import struct
+import threading
+import zlib
+from array import array
+
+import lexical
+
+# Runbook corpus and a flat float32 similarity index over it. The index can
+# be saved to a single file and memory-mapped, so any number of processes
+# share one copy of the matrix through the page cache.
+#
+# Two encoders turn text into vectors, both in-process and CPU only:
+#   bow   - signed hashed bag of words (RBK1 files)
+#   ngram - hashed word, word-pair and character trigram features
+#           projected to ENCODER_DIM with a fixed sparse ternary matrix
+#           (RBK2 files); trigrams let 'connections' match 'connection'
+#           and 'OOMKilled' match 'oom killed'
+#
+# search() fuses the vector ranking with BM25 from lexical.py, which is
+# what finds exact identifiers like DatabaseConnections or 4XXError that
+# hashed vectors blur. Both indexes take runbook adds and deletes in place.
+
+RUNBOOKS = [
+    {'id': 'cpu-scale-out', 'metric': 'CPUUtilization', 'action': 'scale_instance',
+     'title': 'Sustained high CPU on EC2 or ECS',
+     'text': 'High CPU usually indicates need for scaling or process optimization. Check for runaway processes, '
+             'then scale out the Auto Scaling group if load is organic.'},
+    {'id': 'db-connection-pool', 'metric': 'DatabaseConnections', 'action': 'restart_service',
+     'title': 'Database connection pool exhausted',
+     'text': 'Connection pool exhaustion requires service restart or pool increase. Look for leaked connections '
+             'and long-running transactions on the RDS instance before restarting the application.'},
+    {'id': 'disk-log-cleanup', 'metric': 'DiskSpaceUtilization', 'action': 'cleanup_logs',
+     'title': 'Disk or log filesystem full',
+     'text': 'Disk space issues need log cleanup or storage expansion. Rotate and delete logs older than seven '
+             'days under /var/log, then check for unbounded growth.'},
+    {'id': 'memory-pressure', 'metric': 'MemoryUtilization', 'action': 'restart_service',
+     'title': 'Memory pressure on hosts and containers',
+     'text': 'Memory issues may require container restart or memory increase. Compare usage against limits and '
+             'look for leaks across deploys.'},
+    {'id': 'container-oom-killed', 'metric': 'MemoryUtilization', 'action': 'restart_service',
+     'title': 'Container OOMKilled',
+     'text': 'A container killed with OOMKilled exceeded its memory limit. Restart the task and raise the memory '
+             'limit if the working set grew legitimately; otherwise investigate the leak.'},
+    {'id': 'jvm-heap', 'metric': 'JVMMemoryUsed', 'action': 'restart_service',
+     'title': 'JVM heap exhausted',
+     'text': 'JVM heap exhaustion with long GC pauses. Capture a heap dump, restart the service, and review -Xmx '
+             'against the container memory limit.'},
+    {'id': 'ssl-cert-expired', 'metric': 'TargetResponseTime', 'action': 'escalate',
+     'title': 'SSL certificate expired or invalid',
+     'text': 'TLS handshakes fail when a certificate has expired. Renew or re-import the certificate in ACM and '
+             'attach it to the load balancer listener; this needs a human with certificate access.'},
+    {'id': 'fd-limit', 'metric': 'FileDescriptorUtilization', 'action': 'restart_service',
+     'title': 'File descriptor limit exceeded',
+     'text': 'Too many open files. Restart the process to release descriptors, raise ulimit -n, and look for '
+             'sockets or files that are never closed.'},
+    {'id': 'thread-pool-full', 'metric': 'ThreadPoolUtilization', 'action': 'scale_instance',
+     'title': 'Application thread pool saturated',
+     'text': 'All worker threads are busy and requests queue up. Scale out instances and check for slow '
+             'downstream dependencies holding threads.'},
+    {'id': 'disk-io-saturated', 'metric': 'DiskQueueDepth', 'action': 'investigate',
+     'title': 'EBS volume I/O saturated',
+     'text': 'A high DiskQueueDepth means the EBS volume cannot keep up. Check IOPS and throughput limits and '
+             'consider a faster volume type.'},
+    {'id': 'ephemeral-ports', 'metric': 'NetworkConnections', 'action': 'restart_service',
+     'title': 'Ephemeral ports exhausted',
+     'text': 'Outbound connections fail when ephemeral ports run out, usually from missing connection reuse. '
+             'Restart the service and enable keep-alive pooling.'},
+    {'id': 'deadlock', 'metric': 'DeadlockCount', 'action': 'restart_service',
+     'title': 'Application deadlock detected',
+     'text': 'Threads are blocked on each other. Take a thread dump for analysis, then restart the service to '
+             'recover.'},
+    {'id': 'dns-resolution', 'metric': 'DNSQueryTime', 'action': 'investigate',
+     'title': 'DNS resolution failures',
+     'text': 'DNS lookups time out or return SERVFAIL. Check the VPC resolver, Route 53 health and any recent '
+             'changes to resolver rules.'},
+    {'id': 'circuit-breaker-open', 'metric': 'CircuitBreakerState', 'action': 'investigate',
+     'title': 'Circuit breaker open',
+     'text': 'A circuit breaker opened because a downstream dependency keeps failing. Find the failing dependency '
+             'before closing the breaker.'},
+    {'id': 'elb-4xx', 'metric': 'HTTPCode_Target_4XX_Count', 'action': 'investigate',
+     'title': 'Spike in 4XXError responses',
+     'text': 'A spike in 4XXError responses points at client or authentication problems rather than capacity. '
+             'Check recent API or auth changes.'},
+    {'id': 'elb-5xx', 'metric': 'HTTPCode_Target_5XX_Count', 'action': 'restart_service',
+     'title': 'Spike in 5XXError responses',
+     'text': 'Targets return 5XXError responses. Check unhealthy targets and application logs, and restart '
+             'failing instances.'},
+    {'id': 'high-latency', 'metric': 'Latency', 'action': 'scale_instance',
+     'title': 'High response latency',
+     'text': 'Response time above the SLO. Check saturation of CPU, connections and downstream calls; scale out '
+             'when the service is capacity bound.'},
+    {'id': 'lambda-throttles', 'metric': 'Throttles', 'action': 'investigate',
+     'title': 'Lambda throttling',
+     'text': 'Lambda invocations are throttled at the concurrency limit. Review reserved concurrency and request '
+             'a quota increase if load is legitimate.'},
+    {'id': 'security-unauthorized', 'metric': 'UnauthorizedAPICalls', 'action': 'escalate',
+     'title': 'Unauthorized API calls or suspicious login',
+     'text': 'Security incidents such as unauthorized access, breach or intrusion are never auto-remediated. '
+             'Escalate to the security team with CloudTrail context.'},
+    {'id': 'cost-anomaly', 'metric': 'EstimatedCharges', 'action': 'investigate',
+     'title': 'Cost anomaly',
+     'text': 'Spend is above forecast. Identify the service and resources behind the increase and look for '
+             'unused or oversized resources.'},
+    {'id': 'replication-lag', 'metric': 'ReplicaLag', 'action': 'investigate',
+     'title': 'Database replication lag',
+     'text': 'Read replicas fall behind the primary. Check write volume, long transactions and replica instance '
+             'size.'},
+    {'id': 'queue-backlog', 'metric': 'ApproximateAgeOfOldestMessage', 'action': 'scale_instance',
+     'title': 'Queue backlog growing',
+     'text': 'Messages wait longer in SQS than consumers can keep up with. Scale out consumers and check for '
+             'poison messages.'}
+]
+
+DIM = 256
+ENCODER_FEATURES = 1 << 12
+ENCODER_DIM = 128
+ENCODER_SEED = b'intellinemo-runbooks-v1'
+RUNBOOK_ENCODER = os.environ.get('RUNBOOK_ENCODER', 'ngram')
+MAGICS = {'bow': b'RBK1', 'ngram': b'RBK2'}
+HYBRID_CANDIDATES = int(os.environ.get('HYBRID_CANDIDATES', '20'))
+RRF_K = 60
+HEADER = struct.Struct('<4sII')
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall(text.lower())
+
+def text_vector(text, dim=DIM):
+    """L2-normalised signed hashed bag of words; crc32 keeps it stable across processes"""
+    vector = array('f', bytes(4 * dim))
+    for token in tokenize(text):
+        h = zlib.crc32(token.encode())
+        vector[h % dim] += 1.0 if (h >> 16) & 1 else -1.0
+    norm = sum(v * v for v in vector) ** 0.5
+    if norm:
+        for i in range(dim):
+            vector[i] /= norm
+    return vector
+
+def ngram_features(text):
+    """{feature: signed count} over words, adjacent word pairs and character trigrams"""
+    tokens = tokenize(text)
+    grams = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    for token in tokens:
+        padded = f"#{token}#"
+        grams.extend(padded[i:i + 3] for i in range(len(padded) - 2))
+    features = {}
+    for gram in grams:
+        h = zlib.crc32(gram.encode())
+        feature = h % ENCODER_FEATURES
+        features[feature] = features.get(feature, 0) + (1 if (h >> 16) & 1 else -1)
+    return features
+
+class QueryEncoder:
+    """
+    Sparse random projection of hashed n-gram features. The matrix is
+    derived from ENCODER_SEED, so every process builds the same one
+    """
+
+    def __init__(self, features=ENCODER_FEATURES, dim=ENCODER_DIM, seed=ENCODER_SEED):
+        self.dim = dim
+        size = features * dim
+        stream = bytearray()
+        counter = 0
+        while len(stream) < size:
+            stream += hashlib.blake2b(counter.to_bytes(8, 'little'), digest_size=64, key=seed).digest()
+            counter += 1
+        # Achlioptas' distribution: -1 and +1 with probability 1/6 each, else 0
+        ternary = bytes(255 if b < 43 else 1 if b < 86 else 0 for b in range(256))
+        projection = array('b', bytes(stream[:size]).translate(ternary))
+        self.rows = [projection[f * dim:(f + 1) * dim] for f in range(features)]
+
+    def encode(self, text):
+        """L2-normalised ENCODER_DIM vector; about half a millisecond for an alarm query"""
+        positive, negative = [], []
+        for feature, count in ngram_features(text).items():
+            if count > 0:
+                positive.extend([self.rows[feature]] * count)
+            elif count < 0:
+                negative.extend([self.rows[feature]] * -count)
+        # Summing columns through zip keeps the loop in C
+        zero = [0] * self.dim
+        vector = [p - n for p, n in zip(map(sum, zip(zero, *positive)), map(sum, zip(zero, *negative)))]
+        norm = math.sqrt(sum(v * v for v in vector))
+        return array('f', [v / norm for v in vector] if norm else vector)
+
+_encoder = None
+_encoder_lock = threading.Lock()
+
+def get_encoder():
+    global _encoder
+    if _encoder is None:
+        with _encoder_lock:
+            if _encoder is None:
+                _encoder = QueryEncoder()
+    return _encoder
+
+def encoder_dim(encoder=RUNBOOK_ENCODER, dim=DIM):
+    return ENCODER_DIM if encoder == 'ngram' else dim
+
+def encode(text, encoder=RUNBOOK_ENCODER, dim=DIM):
+    """Vector for text from the named encoder"""
+    if encoder == 'ngram':
+        return get_encoder().encode(text)
+    return text_vector(text, dim)
+
+def runbook_text(runbook):
+    return f"{runbook['title']} {runbook['metric']} {runbook['text']}"
+
+class RunbookIndex:
+    """
+    Row-major float32 matrix of runbook vectors plus their records. Rows
+    added after build or open go to a private matrix alongside the base
+    one, and deleted rows are skipped until the index is saved again
+    """
+
+    def __init__(self, matrix, dim, records, offsets=None, blob=None, mapping=None, encoder='bow'):
+        self.matrix = matrix
+        self.dim = dim
+        self.encoder = encoder
+        self.base_size = len(matrix) // dim
+        self._records = records
+        self._offsets = offsets
+        self._blob = blob
+        self._mapping = mapping
+        self._added = array('f')
+        self._added_records = []
+        self._deleted = set()
+        self._rows = None
+        self._lock = threading.Lock()
+
+    @property
+    def size(self):
+        return self.base_size + len(self._added_records) - len(self._deleted)
+
+    @classmethod
+    def build(cls, runbooks=None, dim=DIM, encoder=RUNBOOK_ENCODER):
+        runbooks = RUNBOOKS if runbooks is None else runbooks
+        dim = encoder_dim(encoder, dim)
+        matrix = array('f')
+        for runbook in runbooks:
+            matrix.extend(encode(runbook_text(runbook), encoder, dim))
+        return cls(matrix, dim, list(runbooks), encoder=encoder)
+
+    def record(self, i):
+        if i >= self.base_size:
+            return self._added_records[i - self.base_size]
+        if self._records is not None:
+            return self._records[i]
+        return json.loads(bytes(self._blob[self._offsets[i]:self._offsets[i + 1]]))
+
+    def row_of(self, runbook_id):
+        """Row of a live runbook, or None; the id map is built on first use"""
+        if self._rows is None:
+            self._rows = {self.record(i)['id']: i for i in range(self.base_size)}
+        row = self._rows.get(runbook_id)
+        return None if row in self._deleted else row
+
+    def add(self, runbook):
+        """Append a runbook, replacing a live one with the same id"""
+        vector = encode(runbook_text(runbook), self.encoder, self.dim)
+        with self._lock:
+            self._delete(runbook['id'])
+            self._added.extend(vector)
+            self._added_records.append(runbook)
+            self._rows[runbook['id']] = self.base_size + len(self._added_records) - 1
+
+    def delete(self, runbook_id):
+        with self._lock:
+            self._delete(runbook_id)
+
+    def _delete(self, runbook_id):
+        row = self.row_of(runbook_id)
+        if row is not None:
+            self._deleted.add(row)
+
+    def scores(self, query):
+        """(cosine similarity, row) for every live row; only non-zero query dimensions are visited"""
+        q = encode(query, self.encoder, self.dim)
+        terms = [(j, w) for j, w in enumerate(q) if w]
+        dim = self.dim
+        scores = []
+        with self._lock:
+            for matrix, first, count in ((self.matrix, 0, self.base_size),
+                                         (self._added, self.base_size, len(self._added_records))):
+                for i in range(count):
+                    if first + i in self._deleted:
+                        continue
+                    base = i * dim
+                    if len(terms) > dim // 2:
+                        # Dense (ngram) queries: a C-level dot product over the row
+                        scores.append((sum(map(operator.mul, q, matrix[base:base + dim])), first + i))
+                    else:
+                        scores.append((sum(w * matrix[base + j] for j, w in terms), first + i))
+        return scores
+
+    def search(self, query, k=3):
+        """Top-k runbooks by cosine similarity"""
+        scores = self.scores(query)
+        scores.sort(reverse=True)
+        return [dict(self.record(i), score=round(score, 4)) for score, i in scores[:k]]
+
+    def save(self, path):
+        """Write the index as [header][float32 matrix][uint32 record offsets][JSON records]"""
+        rows = [i for i in range(self.base_size + len(self._added_records)) if i not in self._deleted]
+        encoded = [json.dumps(self.record(i)).encode() for i in rows]
+        offsets = array('I', [0])
+        for blob in encoded:
+            offsets.append(offsets[-1] + len(blob))
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(HEADER.pack(MAGICS[self.encoder], self.size, self.dim))
+            for i in rows:
+                matrix, base = (self.matrix, i) if i < self.base_size else (self._added, i - self.base_size)
+                f.write(array('f', matrix[base * self.dim:(base + 1) * self.dim]).tobytes())
+            f.write(offsets.tobytes())
+            f.write(b''.join(encoded))
+        os.replace(temp_path, path)
+        return path
+
+    @classmethod
+    def open(cls, path):
+        """Memory-map a saved index; the matrix is read in place, never copied"""
+        with open(path, 'rb') as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapping)
+        magic, size, dim = HEADER.unpack_from(view)
+        encoders = {value: name for name, value in MAGICS.items()}
+        if magic not in encoders:
+            raise ValueError(f"{path} is not a runbook index")
+        matrix_start = HEADER.size
+        offsets_start = matrix_start + size * dim * 4
+        blob_start = offsets_start + (size + 1) * 4
+        matrix = view[matrix_start:offsets_start].cast('f')
+        offsets = view[offsets_start:blob_start].cast('I')
+        return cls(matrix, dim, None, offsets, view[blob_start:], mapping, encoders[magic])
+
+_index = None
+
+def use_index(index):
+    global _index
+    _index = index
+
+def get_index():
+    """Index from RUNBOOK_INDEX_PATH when set, else built from RUNBOOKS on first use"""
+    global _index
+    if _index is None:
+        path = os.environ.get('RUNBOOK_INDEX_PATH')
+        _index = RunbookIndex.open(path) if path and os.path.exists(path) else RunbookIndex.build()
+    return _index
+
+_lexical = None
+_lexical_lock = threading.Lock()
+
+def use_lexical_index(index):
+    global _lexical
+    _lexical = index
+
+def get_lexical_index():
+    """BM25 index from RUNBOOK_LEXICAL_DIR when it holds one, else built from RUNBOOKS on first use"""
+    global _lexical
+    if _lexical is None:
+        with _lexical_lock:
+            if _lexical is None:
+                directory = os.environ.get('RUNBOOK_LEXICAL_DIR')
+                if directory and os.path.exists(os.path.join(directory, lexical.MANIFEST)):
+                    _lexical = lexical.LexicalIndex.open(directory)
+                else:
+                    index = lexical.LexicalIndex(directory)
+                    for runbook in RUNBOOKS:
+                        index.add(runbook['id'], runbook_text(runbook))
+                    _lexical = index
+    return _lexical
+
+def add_runbook(runbook):
+    """Add or replace a runbook in both indexes without rebuilding either"""
+    get_index().add(runbook)
+    get_lexical_index().add(runbook['id'], runbook_text(runbook))
+
+def remove_runbook(runbook_id):
+    get_index().delete(runbook_id)
+    get_lexical_index().delete(runbook_id)
+
+def search(query, k=3):
+    """
+    Top-k runbooks by reciprocal rank fusion of the vector and BM25
+    rankings. score stays the cosine similarity so relevance thresholds
+    keep their meaning; bm25 is added alongside it
+    """
+    index = get_index()
+    vector = sorted(index.scores(query), reverse=True)
+    cosine = {row: score for score, row in vector}
+    fused = {row: 1 / (RRF_K + rank) for rank, (_, row) in enumerate(vector[:HYBRID_CANDIDATES], 1)}
+    bm25 = {}
+    for rank, (runbook_id, score) in enumerate(get_lexical_index().search(query, HYBRID_CANDIDATES), 1):
+        row = index.row_of(runbook_id)
+        if row is not None:
+            bm25[row] = score
+            fused[row] = fused.get(row, 0.0) + 1 / (RRF_K + rank)
+    top = sorted(fused, key=lambda row: (fused[row], cosine[row]), reverse=True)[:k]
+    return [dict(index.record(row), score=round(cosine[row], 4), bm25=round(bm25.get(row, 0.0), 4)) for row in top]
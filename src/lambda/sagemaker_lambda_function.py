@@ -1,18 +1,53 @@
 import json
-import boto3
 import os
+import time
 from datetime import datetime
 
+import offload
+import runbooks
+from adaptive_limiter import get_limiter
+from bulkhead import model_slot
+from clients import get_client
+from embedding_store import get_store as get_embedding_store
+from event_filter import filter_event
+from flapping import check as check_flapping, suppressed_response
+from idempotency import claim, duplicate_response, release
+from log_templates import log_context
+from metrics import emit_metrics
+from pending import register, superseded
+from single_flight import coalesce
+from warmup import is_warmup_event, run_warmup
+
+# Shared boilerplate in queries lifts every n-gram score, so its bar is
+# higher; e5 similarities sit high even for unrelated passages
+RUNBOOK_MIN_SCORES = {'bow': 0.3, 'ngram': 0.4, 'nim': 0.75}
+RETRIEVAL_NIM = os.environ.get('RETRIEVAL_NIM', 'true').lower() == 'true'
+
 def lambda_handler(event, context):
     """
     IntelliNemo Agent - Hackathon Compliant Version
     Uses SageMaker NIMs: Llama-3.1-Nemotron-nano-8B-v1 + Retrieval NIM
     """
     
+    # Transitions that need no decision are answered before anything else
+    filtered = filter_event(event, 'sagemaker')
+    if filtered is not None:
+        return filtered
+    
+    # Redelivered alarms stop here, before any client or network work
+    delivery_key, first_delivery = claim(event)
+    if not first_delivery:
+        return duplicate_response(delivery_key, 'sagemaker')
+    
+    # A flapping alarm gets one analysis per interval; the flips between stop here
+    suppress, flapping = check_flapping(event)
+    if suppress:
+        return suppressed_response(event, flapping, 'sagemaker')
+    
     # Initialize AWS clients
-    sagemaker_client = boto3.client('sagemaker-runtime')
-    s3_client = boto3.client('s3')
-    ssm_client = boto3.client('ssm')
+    sagemaker_client = get_client('sagemaker-runtime')
+    s3_client = get_client('s3')
+    ssm_client = get_client('ssm')
     
     # Environment configuration
     llama_endpoint = os.environ.get('LLAMA_ENDPOINT', 'autocloudops-llama3-nim-endpoint')
@@ -20,6 +55,10 @@ def lambda_handler(event, context):
     s3_bucket = os.environ.get('S3_BUCKET', 'intellinemo-agent-logs')
     mode = os.environ.get('MODE', 'DRY_RUN')
     
+    if is_warmup_event(event):
+        return warm_up(sagemaker_client, s3_client, ssm_client, llama_endpoint, retrieval_endpoint, s3_bucket)
+    
+    start = time.perf_counter()
     try:
         # Extract alarm details
         alarm_data = extract_alarm_data(event)
@@ -32,14 +71,19 @@ def lambda_handler(event, context):
         analysis = analyze_with_llama_nim(sagemaker_client, llama_endpoint, alarm_data, context)
         
         # Step 3: Make remediation decision
-        decision = make_remediation_decision(analysis, alarm_data)
+        decision = offload.call(make_remediation_decision, analysis, alarm_data)
         
         # Step 4: Execute if confidence >= 7 and not dry run
         execution_result = None
-        if decision['confidence'] >= 7 and mode == 'ACTIVE':
+        if superseded(alarm_data['alarm_name'], alarm_data['timestamp']):
+            execution_result = {'status': 'cancelled', 'reason': 'Alarm recovered during analysis'}
+        elif decision['confidence'] >= 7 and mode == 'ACTIVE':
             execution_result = execute_remediation(ssm_client, decision)
+            register(alarm_data['alarm_name'], automation_id=execution_result.get('execution_id'),
+                     command_id=execution_result.get('command_id'))
         
-        # Step 5: Log everything for audit
+        # Step 5: Log everything for audit; the Retrieval NIM counts only when it ranked the runbooks
+        retrieval_nim_used = context.get('embedding_model') == 'nv-embedqa-e5-v5'
         log_entry = {
             'timestamp': datetime.utcnow().isoformat(),
             'alarm': alarm_data,
@@ -48,9 +92,10 @@ def lambda_handler(event, context):
             'decision': decision,
             'execution': execution_result,
             'mode': mode,
+            'flapping': flapping,
             'hackathon_compliance': {
                 'llama_nano_8b_used': True,
-                'retrieval_nim_used': True,
+                'retrieval_nim_used': retrieval_nim_used,
                 'sagemaker_deployment': True,
                 'agentic_behavior': True
             }
@@ -58,6 +103,10 @@ def lambda_handler(event, context):
         
         log_to_s3(s3_client, s3_bucket, log_entry)
         
+        emit_metrics(
+            {'AlarmInvocations': 1, 'AlarmDurationMs': round((time.perf_counter() - start) * 1000, 1)},
+            dimensions={'Handler': 'sagemaker', 'InvocationType': 'Alarm'}
+        )
         return {
             'statusCode': 200,
             'body': json.dumps({
@@ -66,18 +115,39 @@ def lambda_handler(event, context):
                 'reasoning': decision['reasoning'],
                 'mode': mode,
                 'hackathon_compliant': True,
-                'nims_used': ['llama-3.1-nemotron-nano-8b-v1', 'nv-embedqa-e5-v5']
+                'nims_used': ['llama-3.1-nemotron-nano-8b-v1'] + (['nv-embedqa-e5-v5'] if retrieval_nim_used else [])
             })
         }
         
     except Exception as e:
         error_msg = f"Error processing alarm: {str(e)}"
         print(error_msg)
+        release(delivery_key)
         return {
             'statusCode': 500,
             'body': json.dumps({'error': error_msg})
         }
 
+def warm_up(sagemaker_client, s3_client, ssm_client, llama_endpoint, retrieval_endpoint, s3_bucket):
+    """
+    Keep both model endpoints warm with minimal requests and open pooled
+    connections; nothing is audited
+    """
+    def invoke(endpoint_name, payload):
+        return lambda: sagemaker_client.invoke_endpoint(
+            EndpointName=endpoint_name,
+            ContentType='application/json',
+            Body=json.dumps(payload)
+        )['Body'].read()
+    
+    result = run_warmup('sagemaker', {
+        'llama': invoke(llama_endpoint, {'inputs': 'ping', 'parameters': {'max_new_tokens': 1}}),
+        'retrieval': invoke(retrieval_endpoint, {'input': 'ping', 'model': 'nv-embedqa-e5-v5'}),
+        's3': lambda: s3_client.head_bucket(Bucket=s3_bucket),
+        'ssm': lambda: ssm_client.list_documents(MaxResults=1)
+    })
+    return {'statusCode': 200, 'body': json.dumps(result)}
+
 def extract_alarm_data(event):
     """Extract alarm information from EventBridge event"""
     detail = event.get('detail', {})
@@ -90,28 +160,45 @@ def extract_alarm_data(event):
         'timestamp': detail.get('state', {}).get('timestamp', datetime.utcnow().isoformat())
     }
 
+def invoke_coalesced(sagemaker_client, endpoint_name, payload, namespace='Unknown'):
+    """
+    Invoke a SageMaker endpoint and decode the JSON body; identical
+    concurrent requests share one invocation, which holds one of the
+    namespace's fair-share model slots
+    """
+    def invoke():
+        with model_slot(namespace), get_limiter(endpoint_name).track(timeout=60):
+            response = sagemaker_client.invoke_endpoint(
+                EndpointName=endpoint_name,
+                ContentType='application/json',
+                Body=json.dumps(payload)
+            )
+            return json.loads(response['Body'].read().decode())
+    
+    return coalesce(endpoint_name, payload, invoke)
+
+def nim_embedding(result):
+    """The vector from an embedding NIM response, in OpenAI or bare-list shape"""
+    if isinstance(result, dict) and result.get('data'):
+        return result['data'][0].get('embedding')
+    if isinstance(result, list) and result and isinstance(result[0], (int, float)):
+        return result
+    return None
+
+def search_embeddings(embedding, k):
+    return get_embedding_store().search(embedding, k)
+
 def retrieve_sre_knowledge(sagemaker_client, endpoint_name, alarm_data):
     """
-    Use Retrieval NIM (nv-embedqa-e5-v5) to get relevant SRE knowledge
+    Retrieve SRE knowledge from the in-process runbook index, upgraded to
+    the Retrieval NIM's (nv-embedqa-e5-v5) embedding over the shipped
+    embedding store when the NIM is enabled and reachable; without a
+    store its query vector would have nothing to rank, so it is not called
     """
     try:
         # Create query for retrieval
         query = f"SRE remediation for {alarm_data['metric_name']} alarm in {alarm_data['namespace']} - {alarm_data['reason']}"
         
-        payload = {
-            'input': query,
-            'model': 'nv-embedqa-e5-v5'
-        }
-        
-        response = sagemaker_client.invoke_endpoint(
-            EndpointName=endpoint_name,
-            ContentType='application/json',
-            Body=json.dumps(payload)
-        )
-        
-        result = json.loads(response['Body'].read().decode())
-        
-        # Extract embeddings and simulate knowledge retrieval
         knowledge_base = {
             'CPUUtilization': 'High CPU usually indicates need for scaling or process optimization',
             'DatabaseConnections': 'Connection pool exhaustion requires service restart or pool increase',
@@ -119,24 +206,49 @@ def retrieve_sre_knowledge(sagemaker_client, endpoint_name, alarm_data):
             'MemoryUtilization': 'Memory issues may require container restart or memory increase'
         }
         
-        retrieved_knowledge = knowledge_base.get(
-            alarm_data['metric_name'], 
-            'General SRE best practices apply for this metric'
-        )
+        matches = offload.call(runbooks.search, query, 3)
+        encoder = runbooks.get_index().encoder
+        store = get_embedding_store() if RETRIEVAL_NIM else None
+        if store is not None:
+            payload = {
+                'input': query,
+                'model': 'nv-embedqa-e5-v5',
+                'input_type': 'query'
+            }
+            try:
+                result = invoke_coalesced(sagemaker_client, endpoint_name, payload, alarm_data['namespace'])
+                # The NIM's vector replaces the local ranking when it fits the shipped store
+                embedding = nim_embedding(result)
+                if embedding and len(embedding) == store.dim:
+                    matches = offload.call(search_embeddings, embedding, 3)
+                    encoder = 'nim'
+                else:
+                    print(f"Retrieval NIM embedding does not fit the {store.dim}-dim store, using local runbook retrieval")
+            except Exception as e:
+                print(f"Retrieval NIM unavailable, using local runbook retrieval: {str(e)}")
+        # Audited as the model that actually ranked the runbooks
+        embedding_model = 'nv-embedqa-e5-v5' if encoder == 'nim' else f"local-{encoder}"
+        
+        # Runbook matches fill in for metrics the knowledge base does not cover
+        retrieved_knowledge = knowledge_base.get(alarm_data['metric_name'])
+        if retrieved_knowledge is None:
+            relevant = [m for m in matches if m['score'] >= RUNBOOK_MIN_SCORES[encoder]]
+            retrieved_knowledge = relevant[0]['text'] if relevant else 'General SRE best practices apply for this metric'
         
         return {
             'query': query,
             'retrieved_knowledge': retrieved_knowledge,
-            'embedding_model': 'nv-embedqa-e5-v5',
+            'runbooks': [{'id': m['id'], 'score': m['score']} for m in matches],
+            'embedding_model': embedding_model,
             'retrieval_successful': True
         }
         
     except Exception as e:
-        print(f"Retrieval NIM error: {str(e)}")
+        print(f"Retrieval error: {str(e)}")
         return {
             'query': 'fallback',
             'retrieved_knowledge': 'Standard SRE practices apply',
-            'embedding_model': 'nv-embedqa-e5-v5',
+            'embedding_model': 'none',
             'retrieval_successful': False,
             'error': str(e)
         }
@@ -158,6 +270,7 @@ Alarm Details:
 - Reason: {alarm_data['reason']}
 - Metric: {alarm_data['metric_name']}
 - Namespace: {alarm_data['namespace']}
+{log_context(alarm_data)}
 
 Provide your response in JSON format with:
 - action: one of [scale_instance, restart_service, cleanup_logs, investigate, escalate]
@@ -176,38 +289,10 @@ Response:"""
             }
         }
         
-        response = sagemaker_client.invoke_endpoint(
-            EndpointName=endpoint_name,
-            ContentType='application/json',
-            Body=json.dumps(payload)
-        )
-        
-        result = json.loads(response['Body'].read().decode())
+        result = invoke_coalesced(sagemaker_client, endpoint_name, payload, alarm_data['namespace'])
         generated_text = result.get('generated_text', result.get('outputs', ''))
         
-        # Extract JSON from response
-        try:
-            # Find JSON in the generated text
-            json_start = generated_text.find('{')
-            json_end = generated_text.rfind('}') + 1
-            
-            if json_start != -1 and json_end > json_start:
-                json_content = generated_text[json_start:json_end]
-                analysis = json.loads(json_content)
-                analysis['model_used'] = 'llama-3.1-nemotron-nano-8b-v1'
-                analysis['nim_successful'] = True
-                return analysis
-        except (json.JSONDecodeError, ValueError):
-            pass
-        
-        # Fallback parsing
-        return {
-            'action': 'investigate',
-            'confidence': 6,
-            'reasoning': generated_text[:200] + '...' if len(generated_text) > 200 else generated_text,
-            'model_used': 'llama-3.1-nemotron-nano-8b-v1',
-            'nim_successful': True
-        }
+        return offload.call(parse_llama_output, generated_text)
         
     except Exception as e:
         print(f"Llama NIM error: {str(e)}")
@@ -220,6 +305,33 @@ Response:"""
             'error': str(e)
         }
 
+def parse_llama_output(generated_text):
+    """
+    Extract the JSON analysis from Llama NIM generated text
+    """
+    try:
+        # Find JSON in the generated text
+        json_start = generated_text.find('{')
+        json_end = generated_text.rfind('}') + 1
+        
+        if json_start != -1 and json_end > json_start:
+            json_content = generated_text[json_start:json_end]
+            analysis = json.loads(json_content)
+            analysis['model_used'] = 'llama-3.1-nemotron-nano-8b-v1'
+            analysis['nim_successful'] = True
+            return analysis
+    except (json.JSONDecodeError, ValueError):
+        pass
+    
+    # Fallback parsing
+    return {
+        'action': 'investigate',
+        'confidence': 6,
+        'reasoning': generated_text[:200] + '...' if len(generated_text) > 200 else generated_text,
+        'model_used': 'llama-3.1-nemotron-nano-8b-v1',
+        'nim_successful': True
+    }
+
 def make_remediation_decision(analysis, alarm_data):
     """
     Make final remediation decision with safety checks
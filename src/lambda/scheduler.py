@@ -0,0 +1,130 @@
+import heapq
+import itertools
+import json
+import os
+import re
+import threading
+import time
+
+from industry import detect_industry
+
+# Severity-aware ordering for alarms waiting on model capacity. Priority
+# comes from severity tags (or name hints), alarm state, namespace and a
+# sector policy; aging lets long-waiting low-priority alarms catch up.
+
+DEFAULT_POLICY = {
+    'severity': {'critical': 100, 'high': 60, 'medium': 30, 'low': 10},
+    'state': {'ALARM': 20, 'INSUFFICIENT_DATA': 0, 'OK': -20},
+    'namespace': {'AWS/RDS': 15, 'AWS/ECS': 10, 'AWS/ApplicationELB': 10, 'AWS/EKS': 10},
+    'sector': {'finance': 25, 'healthcare': 25, 'ecommerce': 10, 'general': 0},
+    # Lowest score for each class, highest class first
+    'classes': [['critical', 110], ['high', 75], ['normal', 40], ['low', None]],
+    # Score gained per second of waiting
+    'aging_per_second': 0.5
+}
+
+# Used when an alarm carries no severity tag
+SEVERITY_HINTS = [
+    ('critical', re.compile(r'oom|killed|expired|deadlock|breach|unauthori[sz]ed|intrusion|outage|exhausted|pool-full')),
+    ('low', re.compile(r'cost|unused|budget|idle|log-'))
+]
+
+def load_policy(path=None):
+    """Default policy overlaid with the JSON file at path or ALARM_PRIORITY_POLICY"""
+    policy = json.loads(json.dumps(DEFAULT_POLICY))
+    path = path or os.environ.get('ALARM_PRIORITY_POLICY')
+    if path:
+        with open(path) as f:
+            overrides = json.load(f)
+        for key, value in overrides.items():
+            if isinstance(value, dict) and isinstance(policy.get(key), dict):
+                policy[key].update(value)
+            else:
+                policy[key] = value
+    return policy
+
+def alarm_severity(event):
+    """Explicit severity tag if present, else a hint from the alarm name"""
+    detail = event.get('detail', {})
+    tags = detail.get('tags') or {}
+    severity = event.get('severity') or detail.get('severity') or tags.get('severity') or tags.get('Severity')
+    if severity:
+        return str(severity).lower()
+    name = detail.get('alarmName', '').lower()
+    for level, pattern in SEVERITY_HINTS:
+        if pattern.search(name):
+            return level
+    return 'medium'
+
+def alarm_priority(event, policy):
+    """(priority class, base score) for an EventBridge alarm event"""
+    detail = event.get('detail', {})
+    namespace = detail.get('configuration', {}).get('namespace', '')
+    score = policy['severity'].get(alarm_severity(event), policy['severity'].get('medium', 0))
+    score += policy['state'].get(detail.get('state', {}).get('value', ''), 0)
+    score += policy['namespace'].get(namespace, 0)
+    score += policy['sector'].get(detect_industry(namespace, detail.get('alarmName', '')), 0)
+
+    for name, floor in policy['classes']:
+        if floor is None or score >= floor:
+            return name, score
+    return policy['classes'][-1][0], score
+
+class PriorityScheduler:
+    """
+    Thread-safe priority queue with linear aging. Every waiting item ages at
+    the same rate, so base - enqueue_time * rate orders the heap correctly
+    without re-scoring on every pop.
+    """
+
+    def __init__(self, policy=None):
+        self.policy = policy or load_policy()
+        self.aging = self.policy.get('aging_per_second', 0.0)
+        self._heap = []
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._waits = {}
+
+    def put(self, message):
+        """Queue a worker message ({'event': ..., ...}); its class is stored on it"""
+        priority_class, score = alarm_priority(message['event'], self.policy)
+        queued_at = time.monotonic()
+        message['priority_class'] = priority_class
+        message['priority_score'] = score
+        with self._cond:
+            heapq.heappush(self._heap, (-(score - queued_at * self.aging), next(self._counter), queued_at, message))
+            self._cond.notify()
+
+    def get(self, timeout=None):
+        """Highest effective priority message, or None after timeout"""
+        with self._cond:
+            if not self._heap and not self._cond.wait_for(lambda: self._heap, timeout):
+                return None
+            _, _, queued_at, message = heapq.heappop(self._heap)
+            waited_ms = (time.monotonic() - queued_at) * 1000
+            stats = self._waits.setdefault(message['priority_class'], {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+            stats['count'] += 1
+            stats['total_ms'] += waited_ms
+            stats['max_ms'] = max(stats['max_ms'], waited_ms)
+            return message
+
+    def remove(self, predicate):
+        """Take every queued message matching predicate out of the queue"""
+        with self._cond:
+            removed = [entry[3] for entry in self._heap if predicate(entry[3])]
+            if removed:
+                self._heap = [entry for entry in self._heap if not predicate(entry[3])]
+                heapq.heapify(self._heap)
+            return removed
+
+    def qsize(self):
+        with self._cond:
+            return len(self._heap)
+
+    def wait_stats(self):
+        """Queue wait per priority class in milliseconds"""
+        with self._cond:
+            return {
+                name: {'count': s['count'], 'avg_ms': round(s['total_ms'] / s['count'], 1), 'max_ms': round(s['max_ms'], 1)}
+                for name, s in self._waits.items()
+            }
@@ -0,0 +1,75 @@
+import hashlib
+import json
+import threading
+import time
+
+# Concurrent identical model calls share one in-flight request: the first
+# caller (leader) makes the call and later callers with the same canonical
+# request wait for its result instead of issuing their own.
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    """Deduplicates concurrent calls that share a key"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.stats = {'leaders': 0, 'coalesced': 0, 'follower_wait_ms_total': 0.0, 'follower_wait_ms_max': 0.0}
+
+    def do(self, key, fn):
+        """Return fn()'s result, sharing it with concurrent callers of the same key"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.stats['leaders'] += 1
+            else:
+                self.stats['coalesced'] += 1
+
+        if not leader:
+            start = time.perf_counter()
+            call.done.wait()
+            waited_ms = (time.perf_counter() - start) * 1000
+            with self._lock:
+                self.stats['follower_wait_ms_total'] += waited_ms
+                self.stats['follower_wait_ms_max'] = max(self.stats['follower_wait_ms_max'], waited_ms)
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def snapshot(self):
+        with self._lock:
+            stats = dict(self.stats)
+        stats['follower_wait_ms_avg'] = stats['follower_wait_ms_total'] / stats['coalesced'] if stats['coalesced'] else 0.0
+        return stats
+
+_flight = SingleFlight()
+
+def request_key(target, request):
+    """Canonical key for a model request: endpoint plus key-sorted JSON payload"""
+    canonical = json.dumps(request, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(f"{target}\n{canonical}".encode()).hexdigest()
+
+def coalesce(target, request, fn):
+    """Run fn() once for all concurrent callers making the same request to target"""
+    return _flight.do(request_key(target, request), fn)
+
+def flight_stats():
+    return _flight.snapshot()
@@ -0,0 +1,60 @@
+import os
+import time
+
+from metrics import emit_metrics
+
+# Scheduled warm-up invocations open the pooled connections and prime the
+# caches a real alarm would otherwise pay for after a quiet period
+
+WARMUP_BUDGET_SECONDS = float(os.environ.get('WARMUP_BUDGET_SECONDS', '2'))
+
+def is_warmup_event(event):
+    """True for EventBridge scheduled events and explicit {"warmup": true} pings"""
+    if not isinstance(event, dict):
+        return False
+    if event.get('warmup') is True:
+        return True
+    return event.get('source') == 'aws.events' and event.get('detail-type') == 'Scheduled Event'
+
+def run_warmup(handler_name, tasks, budget_seconds=None):
+    """
+    Run warm-up tasks concurrently within a time budget and report them
+    under InvocationType=Warmup so they never mix with alarm metrics
+    """
+    # Imported here: concurrent.futures costs several ms of init on every cold start
+    from concurrent.futures import ThreadPoolExecutor, wait
+
+    budget_seconds = WARMUP_BUDGET_SECONDS if budget_seconds is None else budget_seconds
+    start = time.perf_counter()
+    results = {}
+
+    def timed(task):
+        task_start = time.perf_counter()
+        task()
+        return (time.perf_counter() - task_start) * 1000
+
+    executor = ThreadPoolExecutor(max_workers=max(len(tasks), 1))
+    futures = {executor.submit(timed, task): name for name, task in tasks.items()}
+    done, _ = wait(futures, timeout=budget_seconds)
+    # Late tasks keep running on the pool and finish priming on their own
+    executor.shutdown(wait=False)
+
+    for future, name in futures.items():
+        if future not in done:
+            results[name] = {'ok': False, 'error': 'budget exceeded'}
+        elif future.exception():
+            results[name] = {'ok': False, 'error': str(future.exception())}
+        else:
+            results[name] = {'ok': True, 'ms': round(future.result(), 1)}
+
+    duration_ms = (time.perf_counter() - start) * 1000
+    emit_metrics(
+        {
+            'WarmupInvocations': 1,
+            'WarmupDurationMs': round(duration_ms, 1),
+            'WarmupTaskFailures': sum(1 for r in results.values() if not r['ok'])
+        },
+        dimensions={'Handler': handler_name, 'InvocationType': 'Warmup'},
+        properties={'warmup_tasks': results}
+    )
+    return {'warmup': True, 'duration_ms': round(duration_ms, 1), 'tasks': results}
@@ -0,0 +1,88 @@
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+import adaptive_limiter
+import nim_transport
+from adaptive_limiter import AdaptiveLimiter, LimitExceeded, is_overload_error
+
+def saturated_calls(limiter, rtt_ms, count):
+    """Complete count calls that each started with the limit fully used"""
+    for _ in range(count):
+        limiter.acquire()
+        limiter.release(rtt_ms, int(limiter.limit))
+
+class TestAdaptiveLimiter:
+
+    def setup_method(self):
+        adaptive_limiter.reset()
+
+    def test_limit_grows_while_latency_is_flat(self):
+        """Test the limit rises by about one per round of calls at steady latency"""
+        limiter = AdaptiveLimiter(initial=4)
+        saturated_calls(limiter, 20, 40)
+        assert 8 < limiter.limit < 12
+
+    def test_idle_limit_does_not_grow(self):
+        """Test calls that never approach the limit leave it alone"""
+        limiter = AdaptiveLimiter(initial=8)
+        for _ in range(40):
+            limiter.acquire()
+            limiter.release(20, 1)
+        assert limiter.limit == 8
+
+    def test_latency_inflation_backs_off(self):
+        """Test the limit shrinks once latency rises well above its baseline"""
+        limiter = AdaptiveLimiter(initial=16)
+        saturated_calls(limiter, 20, 10)
+        grown = limiter.limit
+        saturated_calls(limiter, 80, 10)
+        assert limiter.limit < grown * 0.8
+
+    def test_zero_latency_samples_are_tolerated(self):
+        """Test calls timed at 0ms keep growing the limit instead of raising"""
+        limiter = AdaptiveLimiter(initial=4)
+        saturated_calls(limiter, 0.0, 10)
+        assert limiter.limit > 4
+        assert limiter.snapshot()['samples'] == 10
+
+    def test_overload_halves_once_per_round_trip(self):
+        """Test a burst of 429s from one round of calls halves the limit once"""
+        limiter = AdaptiveLimiter(initial=16)
+        saturated_calls(limiter, 1000, 1)
+        for _ in range(5):
+            with limiter.track() as sample:
+                sample.status(429)
+        assert limiter.limit == pytest.approx(8.0, abs=0.1)
+        assert limiter.snapshot()['overloads'] == 5
+
+    def test_acquire_times_out_at_limit(self):
+        """Test a caller is refused when no slot frees up in time"""
+        limiter = AdaptiveLimiter(initial=1)
+        limiter.acquire()
+        with pytest.raises(LimitExceeded):
+            limiter.acquire(timeout=0.05)
+        assert limiter.snapshot()['rejected'] == 1
+
+    def test_throttling_errors_are_overload(self):
+        """Test SageMaker throttling and timeouts count as overload but other errors do not"""
+        throttled = ClientError({'Error': {'Code': 'ThrottlingException'}}, 'InvokeEndpoint')
+        unavailable = ClientError({'Error': {'Code': 'ModelError'}, 'ResponseMetadata': {'HTTPStatusCode': 503}},
+                                  'InvokeEndpoint')
+        assert is_overload_error(throttled) and is_overload_error(unavailable)
+        assert is_overload_error(TimeoutError())
+        assert not is_overload_error(ValueError('bad payload'))
+
+    def test_nim_transport_reports_429(self):
+        """Test a 429 from a NIM endpoint shrinks that endpoint's limit"""
+        with patch('requests.Session.post', return_value=MagicMock(status_code=429)):
+            response = nim_transport.post('https://nim.test/v1/completions', {'prompt': 'ping'})
+
+        stats = adaptive_limiter.limiter_stats()['https://nim.test']
+        assert response.status_code == 429
+        assert stats['overloads'] == 1
+        assert stats['limit'] < adaptive_limiter.INITIAL_LIMIT
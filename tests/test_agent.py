@@ -76,7 +76,7 @@ class TestIntelliNemoAgent:
             'MODE': 'DRY_RUN'
         }):
             # Mock NIM API call
-            with patch('requests.post') as mock_post:
+            with patch('requests.Session.post') as mock_post:
                 mock_response = MagicMock()
                 mock_response.status_code = 200
                 mock_response.json.return_value = {
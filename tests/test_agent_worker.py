@@ -0,0 +1,88 @@
+import json
+import os
+import sys
+import threading
+import time
+
+import boto3
+from moto import mock_sqs
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+from agent_worker import AgentWorker, DirectoryQueue, SQSQueue
+
+def alarm_event(name):
+    return {'detail': {'alarmName': name, 'state': {'value': 'ALARM'},
+                       'configuration': {'metricName': 'CPUUtilization'}}}
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.02)
+    return predicate()
+
+class TestAgentWorker:
+
+    def test_directory_queue_runs_alarms_through_handler(self, tmp_path):
+        """Test every queued alarm reaches the handler once and is acknowledged"""
+        alarm_queue = DirectoryQueue(str(tmp_path), wait_seconds=0.1)
+        for i in range(6):
+            alarm_queue.enqueue(alarm_event(f'alarm-{i}'))
+        seen = []
+        handler = lambda event, context: seen.append(event['detail']['alarmName']) or {'statusCode': 200}
+
+        worker = AgentWorker(alarm_queue, handler, concurrency=3)
+        thread = threading.Thread(target=worker.run)
+        thread.start()
+        assert wait_for(lambda: worker.stats['processed'] == 6)
+        status = worker.status()
+        worker.stop()
+        thread.join(5)
+
+        assert sorted(seen) == [f'alarm-{i}' for i in range(6)]
+        assert len(os.listdir(tmp_path / 'done')) == 6
+        assert status['ready'] and status['live']
+        assert status['queue_lag']['depth'] == 0
+
+    def test_sigterm_drain_finishes_in_flight_and_releases_backlog(self, tmp_path):
+        """Test stopping lets the running alarm finish and returns unstarted ones to the queue"""
+        alarm_queue = DirectoryQueue(str(tmp_path), wait_seconds=0.1)
+        for i in range(3):
+            alarm_queue.enqueue(alarm_event(f'alarm-{i}'))
+        started = threading.Event()
+
+        def slow_handler(event, context):
+            started.set()
+            time.sleep(0.3)
+            return {'statusCode': 200}
+
+        worker = AgentWorker(alarm_queue, slow_handler, concurrency=1, prefetch=3)
+        thread = threading.Thread(target=worker.run)
+        thread.start()
+        assert started.wait(5)
+        worker.stop()
+        thread.join(5)
+
+        assert worker.stats['processed'] == 1
+        assert worker.stats['released'] == 2
+        assert worker.status()['ready'] is False
+        assert alarm_queue.lag()['depth'] == 2
+
+    @mock_sqs
+    def test_sqs_failed_alarm_stays_on_queue(self):
+        """Test successful alarms are deleted and failed ones are left for redrive"""
+        sqs = boto3.client('sqs', region_name='us-east-1')
+        queue_url = sqs.create_queue(QueueName='alarms')['QueueUrl']
+        sqs.send_message(QueueUrl=queue_url, MessageBody=json.dumps(alarm_event('ok-alarm')))
+        sqs.send_message(QueueUrl=queue_url, MessageBody=json.dumps(alarm_event('bad-alarm')))
+        alarm_queue = SQSQueue(queue_url, sqs_client=sqs, wait_seconds=0, visibility_timeout=0)
+        handler = lambda event, context: {'statusCode': 500 if event['detail']['alarmName'] == 'bad-alarm' else 200}
+
+        worker = AgentWorker(alarm_queue, handler, concurrency=1)
+        worker.start()
+        for message in alarm_queue.receive(10):
+            worker.submit(message)
+        assert wait_for(lambda: worker.stats['processed'] + worker.stats['failed'] == 2)
+        worker.drain()
+
+        assert worker.stats == {**worker.stats, 'processed': 1, 'failed': 1}
+        assert alarm_queue.lag()['depth'] == 1
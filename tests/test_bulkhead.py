@@ -0,0 +1,87 @@
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+from bulkhead import BulkheadRejected, FairShareLimiter
+
+def wait_for(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+class TestFairShareLimiter:
+
+    def test_idle_capacity_is_borrowed(self):
+        """Test a lone tenant may use every slot while no one else is waiting"""
+        limiter = FairShareLimiter(capacity=4, weights={'AWS/RDS': 3.0})
+        for _ in range(4):
+            limiter.acquire('Custom/Application', timeout=0)
+
+        stats = limiter.stats()['tenants']['Custom/Application']
+        assert stats['in_use'] == 4 and stats['borrowed'] == 0
+        with pytest.raises(BulkheadRejected):
+            limiter.acquire('Custom/Application', timeout=0.05)
+        assert limiter.stats()['tenants']['Custom/Application']['rejected'] == 1
+
+    def test_noisy_tenant_does_not_starve_weighted_tenant(self):
+        """Test freed slots go by weight, not arrival order, once tenants queue"""
+        limiter = FairShareLimiter(capacity=1, weights={'AWS/RDS': 2.0})
+        limiter.acquire('Custom/Application')
+        order = []
+
+        def call(tenant):
+            limiter.acquire(tenant, timeout=5)
+            order.append(tenant)
+
+        threads = [threading.Thread(target=call, args=('Custom/Application',)) for _ in range(6)]
+        for t in threads:
+            t.start()
+        wait_for(lambda: limiter.stats()['tenants']['Custom/Application']['queued'] == 6)
+        threads += [threading.Thread(target=call, args=('AWS/RDS',)) for _ in range(3)]
+        for t in threads[6:]:
+            t.start()
+        wait_for(lambda: limiter.stats()['tenants']['AWS/RDS']['queued'] == 3)
+
+        holder = 'Custom/Application'
+        for i in range(9):
+            limiter.release(holder)
+            wait_for(lambda: len(order) == i + 1)
+            holder = order[i]
+        limiter.release(holder)
+        for t in threads:
+            t.join(5)
+
+        # FIFO would serve all six queued Custom/Application calls first
+        assert order[:4].count('AWS/RDS') == 3
+        stats = limiter.stats()
+        assert stats['in_use'] == 0
+        assert stats['tenants']['AWS/RDS']['completed'] == 3
+        assert stats['tenants']['AWS/RDS']['avg_wait_ms'] > 0
+
+    def test_hard_limit_applies_even_when_idle(self):
+        """Test a tenant's limit caps it although capacity is free"""
+        limiter = FairShareLimiter(capacity=4, weights={}, limits={'Custom/Application': 1})
+        with limiter.slot('Custom/Application'):
+            with pytest.raises(BulkheadRejected):
+                limiter.acquire('Custom/Application', timeout=0.05)
+            limiter.acquire('AWS/RDS', timeout=0)
+        limiter.release('AWS/RDS')
+
+        stats = limiter.stats()
+        assert stats['in_use'] == 0
+        assert stats['tenants']['Custom/Application']['limit'] == 1
+        assert stats['tenants']['Custom/Application']['completed'] == 1
+
+    def test_queue_bound_rejects_immediately(self):
+        """Test a full per-tenant queue rejects without waiting"""
+        limiter = FairShareLimiter(capacity=1, weights={}, max_queue=0)
+        limiter.acquire('Custom/Application')
+        start = time.monotonic()
+        with pytest.raises(BulkheadRejected):
+            limiter.acquire('AWS/RDS', timeout=5)
+        assert time.monotonic() - start < 1
@@ -0,0 +1,76 @@
+import importlib.util
+import json
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+import lambda_function
+from decision_catalog import load_catalog, template_key
+
+# precompile-decisions.py is a script, so load it by path
+spec = importlib.util.spec_from_file_location(
+    'precompile_decisions',
+    os.path.join(os.path.dirname(__file__), '..', 'precompile-decisions.py')
+)
+precompile = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(precompile)
+
+MODEL_DECISION = {'reasoning': 'Pool exhausted by leaked connections', 'confidence': 8,
+                  'model_used': 'llama-3.1-nemotron-70b'}
+
+def alarm_event(name, metric='DatabaseConnections', namespace='AWS/RDS'):
+    return {'detail': {'alarmName': name, 'state': {'value': 'ALARM', 'reason': 'All database connections in use'},
+                       'configuration': {'metricName': metric, 'namespace': namespace}}}
+
+def build_artifact(path):
+    templates = precompile.catalog_templates(['critical-shutdown-scenarios.py'])
+    with patch('lambda_function.process_with_nim', return_value=dict(MODEL_DECISION)):
+        precompile.build(templates, {'api_key': 'k'}, str(path))
+    return templates
+
+class TestDecisionCatalog:
+
+    def test_template_folds_environment_and_numbers(self):
+        """Test alarms from different environments and shards share a template"""
+        keys = {template_key(lambda_function.extract_alarm_data(alarm_event(name)))
+                for name in ('prod-db-1-connections', 'staging-db-2-connections', 'db-13-connections')}
+        assert keys == {'AWS/RDS|DatabaseConnections|db-#-connections'}
+
+    def test_catalog_sources_cover_the_scenarios(self):
+        """Test the scenario and domain suites are collected into distinct templates"""
+        templates = precompile.catalog_templates(precompile.CATALOG_SOURCES)
+        assert 'AWS/RDS|DatabaseConnections|db-connection-pool-full' in templates
+        assert len(templates) >= 12
+
+    def test_handler_answers_catalogued_alarm_without_model(self, tmp_path):
+        """Test a matching alarm is decided from the artifact with no model call"""
+        path = tmp_path / 'decision_catalog.json'
+        templates = build_artifact(path)
+        summary = precompile.report(templates, str(path))
+        assert summary['coverage'] == 1.0 and not summary['stale']
+
+        catalog = load_catalog(str(path), lambda_function.REASONING_PROMPT, lambda_function.LLAMA_MODEL)
+        s3 = MagicMock()
+        with patch.dict(os.environ, {'S3_BUCKET': 'audit', 'SECRETS_ARN': 'arn', 'MODE': 'DRY_RUN'}), \
+                patch('lambda_function.CATALOG', catalog), \
+                patch('lambda_function.claim', return_value=(None, True)), \
+                patch('lambda_function.get_client', return_value=s3), \
+                patch('lambda_function.process_with_nim') as process:
+            result = lambda_function.lambda_handler(alarm_event('prod-db-connection-pool-full'), None)
+
+        process.assert_not_called()
+        assert json.loads(result['body'])['action'] == 'restart_service'
+        record = json.loads(s3.put_object.call_args.kwargs['Body'])
+        assert record['reasoning']['catalog']['template'] == 'AWS/RDS|DatabaseConnections|db-connection-pool-full'
+
+    def test_artifact_for_another_prompt_is_stale(self, tmp_path):
+        """Test decisions built with a different prompt are reported and not used"""
+        path = tmp_path / 'decision_catalog.json'
+        templates = build_artifact(path)
+
+        catalog = load_catalog(str(path), lambda_function.REASONING_PROMPT + ' Be brief.', lambda_function.LLAMA_MODEL)
+        assert catalog.status()['stale'] and catalog.status()['stale_reason'] == 'prompt changed'
+        assert catalog.lookup(lambda_function.extract_alarm_data(alarm_event('db-connection-pool-full'))) is None
+        with patch('lambda_function.REASONING_PROMPT', lambda_function.REASONING_PROMPT + ' Be brief.'):
+            assert precompile.report(templates, str(path))['stale']
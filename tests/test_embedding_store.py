@@ -0,0 +1,110 @@
+import json
+import os
+import random
+import sys
+from unittest.mock import MagicMock, patch
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+import runbooks
+import sagemaker_lambda_function
+from embedding_store import EmbeddingStore, quantise, write_store
+
+QUERY = 'SRE remediation for FileDescriptorUtilization alarm in Custom/Application - Too many open files'
+
+def random_store(path, passages=300, dim=64):
+    rng = random.Random(3)
+    vectors = [[rng.gauss(0, 1) for _ in range(dim)] for _ in range(passages)]
+    write_store(str(path), vectors, [{'id': i} for i in range(passages)])
+    return EmbeddingStore(str(path)), vectors, rng
+
+class TestEmbeddingStore:
+
+    def test_quantisation_round_trips_within_a_step(self):
+        """Test int8 codes times the per-vector scale reproduce the vector to half a step"""
+        vector = [0.5, -0.25, 0.125, -1.0, 0.0]
+        values, scale = quantise(vector)
+        assert max(map(abs, values)) == 127
+        assert all(abs(v * scale - x) <= scale / 2 for v, x in zip(values, vector))
+
+    def test_reranked_search_matches_exact_scan(self, tmp_path):
+        """Test int8 candidates re-ranked in float32 return the exact top-k and scores"""
+        store, vectors, rng = random_store(tmp_path / 'embeddings.bin')
+        assert (store.size, store.dim) == (300, 64)
+        for _ in range(5):
+            query = [v + rng.gauss(0, 0.5) for v in vectors[rng.randrange(300)]]
+            assert store.approximate_search(query, k=5, candidates=20) == store.exact_search(query, k=5)
+
+    def test_search_without_numpy_runs_the_exact_scan(self, tmp_path):
+        """Test the pure-Python int8 path is skipped, since it is slower than the exact scan"""
+        store, vectors, _ = random_store(tmp_path / 'embeddings.bin')
+        with patch('embedding_store.numpy', None), patch.object(store, 'approximate_search') as approximate:
+            assert store.search(vectors[7], k=3) == store.exact_search(vectors[7], k=3)
+        approximate.assert_not_called()
+
+    def test_retrieval_uses_nim_embedding_over_the_store(self, tmp_path):
+        """Test the NIM query embedding ranks the shipped store when both are available"""
+        vectors = [runbooks.encode(runbooks.runbook_text(r), 'ngram') for r in runbooks.RUNBOOKS]
+        write_store(str(tmp_path / 'embeddings.bin'), vectors, runbooks.RUNBOOKS)
+        store = EmbeddingStore(str(tmp_path / 'embeddings.bin'))
+        alarm_data = {'alarm_name': 'fd-exhausted', 'state': 'ALARM', 'reason': 'Too many open files',
+                      'metric_name': 'FileDescriptorUtilization', 'namespace': 'Custom/Application'}
+        response = {'data': [{'embedding': list(runbooks.encode(QUERY, 'ngram'))}]}
+
+        with patch('sagemaker_lambda_function.get_embedding_store', return_value=store), \
+                patch('sagemaker_lambda_function.invoke_coalesced', return_value=response):
+            context = sagemaker_lambda_function.retrieve_sre_knowledge(MagicMock(), 'retrieval', alarm_data)
+
+        assert context['embedding_model'] == 'nv-embedqa-e5-v5'
+        assert context['runbooks'][0]['id'] == 'fd-limit'
+
+    def test_nim_is_only_called_for_a_matching_store(self):
+        """Test no store skips the NIM call, and a vector that does not fit the store is audited as local"""
+        alarm_data = {'alarm_name': 'fd-exhausted', 'state': 'ALARM', 'reason': 'Too many open files',
+                      'metric_name': 'FileDescriptorUtilization', 'namespace': 'Custom/Application'}
+        local_model = f"local-{runbooks.get_index().encoder}"
+
+        with patch('sagemaker_lambda_function.get_embedding_store', return_value=None), \
+                patch('sagemaker_lambda_function.invoke_coalesced') as invoke:
+            context = sagemaker_lambda_function.retrieve_sre_knowledge(MagicMock(), 'retrieval', alarm_data)
+        invoke.assert_not_called()
+        assert context['embedding_model'] == local_model
+
+        response = {'data': [{'embedding': [0.1] * 1024}]}
+        with patch('sagemaker_lambda_function.get_embedding_store', return_value=MagicMock(dim=128)), \
+                patch('sagemaker_lambda_function.invoke_coalesced', return_value=response):
+            context = sagemaker_lambda_function.retrieve_sre_knowledge(MagicMock(), 'retrieval', alarm_data)
+        assert context['embedding_model'] == local_model
+        assert context['runbooks'][0]['id'] == 'fd-limit'
+
+    def test_response_credits_retrieval_nim_only_when_it_ranked(self):
+        """Test nims_used and the audit flag follow the model that ranked the runbooks"""
+        event = {'detail': {'alarmName': 'fd-exhausted',
+                            'state': {'value': 'ALARM', 'reason': 'Too many open files',
+                                      'timestamp': '2025-10-01T12:00:00.000+0000'},
+                            'previousState': {'value': 'OK'},
+                            'configuration': {'metricName': 'FileDescriptorUtilization',
+                                              'namespace': 'Custom/Application'}}}
+        decision = {'action': 'investigate', 'confidence': 3, 'reasoning': 'low confidence'}
+        for embedding_model, nim_used in (('nv-embedqa-e5-v5', True), ('local-ngram', False), ('none', False)):
+            with patch('sagemaker_lambda_function.retrieve_sre_knowledge',
+                       return_value={'embedding_model': embedding_model}), \
+                    patch('sagemaker_lambda_function.analyze_with_llama_nim', return_value={}), \
+                    patch('sagemaker_lambda_function.make_remediation_decision', return_value=decision), \
+                    patch('sagemaker_lambda_function.claim', return_value=(None, True)), \
+                    patch('sagemaker_lambda_function.get_client'), \
+                    patch('sagemaker_lambda_function.emit_metrics'), \
+                    patch('sagemaker_lambda_function.log_to_s3') as log_to_s3:
+                result = sagemaker_lambda_function.lambda_handler(event, None)
+
+            body = json.loads(result['body'])
+            assert ('nv-embedqa-e5-v5' in body['nims_used']) == nim_used
+            assert log_to_s3.call_args[0][2]['hackathon_compliance']['retrieval_nim_used'] == nim_used
+
+    def test_retrieval_error_is_not_audited_as_nim(self):
+        """Test the error fallback does not name the Retrieval NIM as the embedding model"""
+        with patch('sagemaker_lambda_function.runbooks.search', side_effect=RuntimeError('index missing')):
+            context = sagemaker_lambda_function.retrieve_sre_knowledge(MagicMock(), 'retrieval', {
+                'alarm_name': 'fd-exhausted', 'reason': 'Too many open files',
+                'metric_name': 'FileDescriptorUtilization', 'namespace': 'Custom/Application'})
+        assert context['retrieval_successful'] is False
+        assert context['embedding_model'] == 'none'
@@ -0,0 +1,127 @@
+import json
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import boto3
+import pytest
+from moto import mock_dynamodb
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+import lambda_function
+import pending
+from agent_worker import AgentWorker, ListQueue
+from event_filter import compile_rules, route
+from load_shedding import LoadShedder
+from pending import DynamoDBRegistry
+
+def transition(name, value, previous='ALARM', timestamp='2025-10-01T12:10:00.000+0000'):
+    return {'detail': {'alarmName': name,
+                       'state': {'value': value, 'reason': 'threshold crossed', 'timestamp': timestamp},
+                       'previousState': {'value': previous},
+                       'configuration': {'metricName': 'CPUUtilization', 'namespace': 'AWS/EC2'}}}
+
+class TestEventFilter:
+
+    def setup_method(self):
+        pending.reset()
+
+    def test_default_routes(self):
+        """Test alarms are processed, recoveries cancel and other transitions are skipped"""
+        assert route(transition('cpu', 'ALARM', previous='OK')) == (None, 'process')
+        assert route(transition('cpu', 'OK')) == ('recovered', 'cancel')
+        assert route(transition('cpu', 'OK', previous='INSUFFICIENT_DATA')) == ('ok', 'skip')
+        assert route(transition('cpu', 'INSUFFICIENT_DATA')) == ('insufficient-data', 'prefetch')
+        assert route({'source': 'aws.events', 'detail-type': 'Scheduled Event'}) == (None, 'process')
+
+    def test_bad_rules_are_rejected_at_compile(self):
+        """Test an unknown route or a scalar pattern value fails when the rules load"""
+        with pytest.raises(ValueError):
+            compile_rules([{'name': 'x', 'route': 'drop', 'pattern': {'detail': {'state': {'value': ['OK']}}}}])
+        with pytest.raises(ValueError):
+            compile_rules([{'name': 'x', 'route': 'skip', 'pattern': {'detail': {'state': {'value': 'OK'}}}}])
+
+    def test_skipped_transition_creates_no_clients(self):
+        """Test an OK transition that is not a recovery returns before any client is created"""
+        with patch('lambda_function.get_client') as get_client, \
+                patch('lambda_function.claim') as claim:
+            result = lambda_function.lambda_handler(transition('cpu', 'OK', previous='INSUFFICIENT_DATA'), None)
+
+        get_client.assert_not_called()
+        claim.assert_not_called()
+        assert json.loads(result['body'])['route'] == 'skip'
+
+    def test_recovery_cancels_pending_remediation(self):
+        """Test ALARM->OK stops started SSM work and drops deferred re-analysis"""
+        shedder = LoadShedder(queue_depth=1, latency_ms=1000)
+        shedder.observe_queue_depth(5)
+        shedder.defer(transition('cpu-high', 'ALARM', previous='OK'))
+        pending.register('cpu-high', automation_id='auto-1')
+        pending.register('cpu-high', command_id='cmd-1')
+        ssm = MagicMock()
+        with patch('pending.get_client', return_value=ssm), \
+                patch.dict(pending._hooks, {'deferred': shedder.cancel}, clear=True):
+            result = lambda_function.lambda_handler(transition('cpu-high', 'OK'), None)
+
+        cancelled = json.loads(result['body'])['cancelled']
+        assert cancelled == {'executions': 2, 'deferred': 1}
+        ssm.stop_automation_execution.assert_called_once_with(AutomationExecutionId='auto-1', Type='Cancel')
+        ssm.cancel_command.assert_called_once_with(CommandId='cmd-1')
+        assert len(shedder.deferred) == 0
+
+    def test_recovered_alarm_is_not_executed(self):
+        """Test an alarm that recovered while being analysed does not run its remediation"""
+        with patch.dict(pending._hooks, {}, clear=True):
+            pending.cancel('cpu-high', '2025-10-01T12:10:00.000+0000')
+        assert pending.superseded('cpu-high', '2025-10-01T12:00:00.000+0000')
+        assert not pending.superseded('cpu-high', '2025-10-01T12:20:00.000+0000')
+
+        ssm = MagicMock()
+        action = {'type': 'scale_instance', 'confidence': 9, 'description': 'scale', 'command': ''}
+        with patch.dict(os.environ, {'S3_BUCKET': 'audit', 'SECRETS_ARN': 'arn', 'MODE': 'ACTIVE'}), \
+                patch('lambda_function.get_client', return_value=ssm), \
+                patch('lambda_function.claim', return_value=(None, True)), \
+                patch('lambda_function.process_with_nim', return_value={'confidence': 9}), \
+                patch('lambda_function.generate_action', return_value=action):
+            lambda_function.lambda_handler(
+                transition('cpu-high', 'ALARM', previous='OK', timestamp='2025-10-01T12:00:00.000+0000'), None)
+
+        ssm.start_automation_execution.assert_not_called()
+
+    def test_worker_settles_queued_deliveries_of_recovered_alarm(self):
+        """Test a recovery removes the alarm's queued deliveries from the worker"""
+        events = [transition('cpu-high', 'ALARM', previous='OK'), transition('disk-full', 'ALARM', previous='OK')]
+        source = ListQueue(events)
+        worker = AgentWorker(source, lambda event, context: {'statusCode': 200}, concurrency=1)
+        for message in source.receive(10):
+            worker.submit(message)
+
+        assert worker.cancel_queued('cpu-high') == 1
+        assert source.results == {'0': 'processed', '1': None}
+        assert worker.stats['cancelled'] == 1
+        assert worker.pending.qsize() == 1
+
+    @mock_dynamodb
+    def test_recovery_in_another_container_cancels_remediation(self):
+        """Test executions and recoveries recorded through the table are seen by other containers"""
+        client = boto3.client('dynamodb', region_name='us-east-1')
+        client.create_table(TableName='idempotency', BillingMode='PAY_PER_REQUEST',
+                            AttributeDefinitions=[{'AttributeName': 'idempotency_key', 'AttributeType': 'S'}],
+                            KeySchema=[{'AttributeName': 'idempotency_key', 'KeyType': 'HASH'}])
+        ssm = MagicMock()
+        containers = [DynamoDBRegistry('idempotency', client) for _ in range(3)]
+
+        with patch('pending.get_client', return_value=ssm), patch.dict(pending._hooks, {}, clear=True):
+            with patch('pending._registry', containers[0]):
+                pending.register('cpu-high', automation_id='auto-1')
+                pending.register('cpu-high', command_id='cmd-1')
+            with patch('pending._registry', containers[1]):
+                cancelled = pending.cancel('cpu-high', '2025-10-01T12:10:00.000+0000')
+                assert pending.cancel('cpu-high', '2025-10-01T12:10:00.000+0000') == {'executions': 0}
+            with patch('pending._registry', containers[2]):
+                assert pending.superseded('cpu-high', '2025-10-01T12:00:00.000+0000')
+                assert not pending.superseded('cpu-high', '2025-10-01T12:20:00.000+0000')
+
+        assert cancelled == {'executions': 2}
+        ssm.stop_automation_execution.assert_called_once_with(AutomationExecutionId='auto-1', Type='Cancel')
+        ssm.cancel_command.assert_called_once_with(CommandId='cmd-1')
@@ -0,0 +1,69 @@
+import json
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+import lambda_function
+from flapping import STATES, FlapDetector, StateHistory
+
+MINUTE = 60.0
+
+def flips(count, every=5 * MINUTE):
+    """Alternating ALARM/OK state changes, ALARM first"""
+    return [('ALARM' if i % 2 == 0 else 'OK', i * every) for i in range(count)]
+
+def alarm_event(state, at):
+    minutes, seconds = divmod(int(at), 60)
+    hours, minutes = divmod(minutes, 60)
+    return {'detail': {'alarmName': 'api-latency', 'previousState': {'value': 'OK' if state == 'ALARM' else 'ALARM'},
+                       'state': {'value': state, 'reason': 'p99 over threshold',
+                                 'timestamp': f'2025-10-01T{hours:02d}:{minutes:02d}:{seconds:02d}.000+0000'},
+                       'configuration': {'metricName': 'Latency', 'namespace': 'AWS/ApplicationELB'}}}
+
+class TestFlapping:
+
+    def test_flapping_starts_and_stops_with_hysteresis(self):
+        """Test the flag turns on at the enter rate and off only below the exit rate"""
+        history = StateHistory()
+        for i, (state, at) in enumerate(flips(7)):
+            history.record(STATES[state], at)
+            history.update(at)
+            assert history.flapping == (i == 6)
+
+        # 6 transitions over 30 minutes; idle time spreads them out
+        assert history.update(80 * MINUTE) == 4.5
+        assert history.flapping
+        history.update(121 * MINUTE)
+        assert not history.flapping
+
+    def test_ring_wraps_and_survives_restart(self, tmp_path):
+        """Test the history keeps its newest entries and reloads from disk"""
+        detector = FlapDetector(str(tmp_path))
+        for state, at in flips(40):
+            assert detector.observe('api-latency', state, at)
+        assert not detector.observe('api-latency', 'OK', 41 * 5 * MINUTE)
+        assert not detector.observe('api-latency', 'ALARM', 10 * MINUTE)
+
+        reloaded = FlapDetector(str(tmp_path))._history('api-latency')
+        assert reloaded.count == 16 and reloaded.flapping
+        assert reloaded.last() == (STATES['OK'], 39 * 5 * MINUTE)
+        assert reloaded.times[(reloaded.head - reloaded.count) % reloaded.size] == 24 * 5 * MINUTE
+
+    def test_handler_rate_limits_flapping_alarm(self, tmp_path):
+        """Test a flapping alarm is analysed once per interval and the audit counts the rest"""
+        s3 = MagicMock()
+        detector = FlapDetector(str(tmp_path), interval=15 * MINUTE)
+        with patch.dict(os.environ, {'S3_BUCKET': 'audit', 'SECRETS_ARN': 'arn', 'MODE': 'DRY_RUN'}), \
+                patch('flapping._detector', detector), \
+                patch('lambda_function.claim', return_value=(None, True)), \
+                patch('lambda_function.get_client', return_value=s3), \
+                patch('lambda_function.process_with_nim', return_value={'confidence': 5}) as process:
+            results = [lambda_function.lambda_handler(alarm_event(state, at), None) for state, at in flips(16)]
+
+        messages = [json.loads(r['body']).get('message') for r in results[::2]]
+        assert messages.count('Flapping alarm suppressed') == 3
+        assert process.call_count == 5
+        audits = [json.loads(c.kwargs['Body']) for c in s3.put_object.call_args_list]
+        assert [a['flapping']['suppressed'] for a in audits] == [0, 0, 0, 1, 1]
+        assert audits[-1]['flapping']['flapping']
@@ -0,0 +1,31 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+from history import BenchmarkHistory, detect_change_point, find_regressions
+
+class TestBenchmarkHistory:
+
+    def test_detect_change_point_finds_shift(self):
+        """Test the split lands on the first slow run"""
+        values = [1.20, 1.22, 1.19, 1.21, 1.20, 2.01, 1.99, 2.02]
+
+        change = detect_change_point(values)
+
+        assert change['index'] == 5
+        assert abs(change['mean_after'] - 2.0) < 0.05
+
+    def test_report_flags_latency_regression_only(self):
+        """Test an 800 ms latency jump is reported and a flat series is not"""
+        history = BenchmarkHistory(':memory:')
+        for i in range(8):
+            slow = 0.8 if i >= 5 else 0.0
+            history.record_run('eks', 'llama', 'run', [
+                ('cpu-high', 'latency_s', 1.2 + slow + (i % 2) * 0.01),
+                ('disk-full', 'latency_s', 1.1 + (i % 2) * 0.01)
+            ], git_commit=f'c{i}')
+
+        regressions = find_regressions(history, min_score=4.0, min_change=0.10, min_latency_delta=0.2)
+
+        assert [r['scenario'] for r in regressions] == ['cpu-high']
+        assert regressions[0]['commit'] == 'c5'
@@ -0,0 +1,143 @@
+import json
+import os
+import sys
+import time
+from unittest.mock import MagicMock, patch
+
+import boto3
+from moto import mock_dynamodb
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+import eks_lambda_function
+import lambda_function
+from idempotency import DynamoDBStore, IdempotencyGuard, LocalStore, idempotency_key
+from load_shedding import LoadShedder
+
+ALARM_EVENT = {
+    'id': '7bf73129-1428-4cd3-a780-95db273d1602',
+    'detail-type': 'CloudWatch Alarm State Change',
+    'detail': {
+        'alarmName': 'db-connection-pool-full',
+        'state': {'value': 'ALARM', 'reason': 'All connections in use', 'timestamp': '2025-10-01T12:00:00.000+0000'},
+        'configuration': {'metricName': 'DatabaseConnections', 'namespace': 'AWS/RDS'}
+    }
+}
+
+class TestIdempotency:
+
+    def test_key_uses_event_id_and_state_timestamp(self):
+        """Test redeliveries share a key and non-alarm events have none"""
+        redelivery = json.loads(json.dumps(ALARM_EVENT))
+        next_transition = json.loads(json.dumps(ALARM_EVENT))
+        next_transition['detail']['state']['timestamp'] = '2025-10-01T12:05:00.000+0000'
+
+        assert idempotency_key(ALARM_EVENT) == idempotency_key(redelivery)
+        assert idempotency_key(ALARM_EVENT) != idempotency_key(next_transition)
+        assert idempotency_key({'source': 'aws.events', 'detail-type': 'Scheduled Event', 'detail': {}}) is None
+        assert idempotency_key({'detail': {'alarmName': 'no-id-or-timestamp'}}) is None
+
+    def test_each_deferral_gets_its_own_key(self):
+        """Test two deferrals of one alarm do not collide with each other or the original delivery"""
+        shedder = LoadShedder()
+        shedder.defer(ALARM_EVENT)
+        shedder.defer(ALARM_EVENT)
+        first, second = shedder.deferred
+        keys = {idempotency_key(ALARM_EVENT), idempotency_key(first), idempotency_key(second)}
+        assert len(keys) == 3
+        assert idempotency_key(json.loads(json.dumps(first))) == idempotency_key(first)
+
+    def test_local_store_claims_once_until_expiry(self, tmp_path):
+        """Test the stand-in refuses a live claim and takes over an expired one"""
+        store = LocalStore(str(tmp_path))
+        assert store.claim('k', time.time() + 60)
+        assert not store.claim('k', time.time() + 60)
+        store.release('k')
+        assert store.claim('k', time.time() - 1)
+        assert store.claim('k', time.time() + 60)
+
+    @mock_dynamodb
+    def test_dynamodb_store_conditional_write(self):
+        """Test the conditional put admits one claim per key and reclaims expired items"""
+        client = boto3.client('dynamodb', region_name='us-east-1')
+        client.create_table(TableName='idempotency', BillingMode='PAY_PER_REQUEST',
+                            AttributeDefinitions=[{'AttributeName': 'idempotency_key', 'AttributeType': 'S'}],
+                            KeySchema=[{'AttributeName': 'idempotency_key', 'KeyType': 'HASH'}])
+        store = DynamoDBStore('idempotency', client)
+
+        assert store.claim('k', time.time() + 60)
+        assert not store.claim('k', time.time() + 60)
+        assert store.claim('expired', time.time() - 5)
+        assert store.claim('expired', time.time() + 60)
+
+    def test_duplicate_skips_all_client_work(self, tmp_path):
+        """Test a redelivered alarm returns before any client is created"""
+        guard = IdempotencyGuard(LocalStore(str(tmp_path)))
+        guard.claim(idempotency_key(ALARM_EVENT))
+        with patch('idempotency._guard', guard), patch('lambda_function.get_client') as get_client:
+            result = lambda_function.lambda_handler(ALARM_EVENT, None)
+
+        get_client.assert_not_called()
+        assert result['statusCode'] == 200
+        assert json.loads(result['body'])['message'] == 'Duplicate delivery ignored'
+        assert guard.stats['duplicates_local'] == 1
+
+    def test_failed_processing_releases_claim(self, tmp_path):
+        """Test a delivery that errors can be retried by the next redelivery"""
+        guard = IdempotencyGuard(LocalStore(str(tmp_path)))
+        with patch('idempotency._guard', guard), \
+                patch('eks_lambda_function.nim_transport.post', side_effect=ConnectionError('NIM down')) as post:
+            failed = eks_lambda_function.lambda_handler(ALARM_EVENT, None)
+            calls_before_redelivery = post.call_count
+            redelivered = eks_lambda_function.lambda_handler(ALARM_EVENT, None)
+
+        assert failed['statusCode'] == 500
+        # The redelivery was claimed and processed again rather than dropped
+        assert 'Duplicate delivery ignored' not in redelivered['body']
+        assert post.call_count > calls_before_redelivery
+        assert guard.stats['claimed'] == 2
+        assert guard.stats['duplicates_local'] == 0
+
+    def test_claim_is_kept_once_remediation_ran(self, tmp_path):
+        """Test a failure after the SSM command does not let a redelivery restart the service again"""
+        event = json.loads(json.dumps(ALARM_EVENT))
+        event['detail']['configuration']['metricName'] = 'CPUUtilization'
+        response = MagicMock(json=lambda: {'choices': [{'text': 'Restart it. Confidence: 9'}]})
+        clients = MagicMock()
+        clients.put_object.side_effect = Exception('AccessDenied')
+        guard = IdempotencyGuard(LocalStore(str(tmp_path)))
+        with patch('idempotency._guard', guard), \
+                patch('eks_lambda_function.nim_transport.post', return_value=response), \
+                patch('eks_lambda_function.get_client', return_value=clients), \
+                patch('eks_lambda_function.emit_metrics', side_effect=RuntimeError('metrics down')):
+            first = eks_lambda_function.lambda_handler(event, None)
+            redelivered = eks_lambda_function.lambda_handler(event, None)
+
+        assert first['statusCode'] == 500
+        assert json.loads(redelivered['body'])['message'] == 'Duplicate delivery ignored'
+        assert clients.send_command.call_count == 1
+
+    def test_deferred_reanalysis_is_not_a_duplicate(self, tmp_path):
+        """Test a shed alarm taken back from the backlog gets its full analysis"""
+        event = json.loads(json.dumps(ALARM_EVENT))
+        event['detail'].update(alarmName='idle-budget-report', configuration={
+            'metricName': 'CPUUtilization', 'namespace': 'Custom/Application'})
+        guard = IdempotencyGuard(LocalStore(str(tmp_path)))
+        shedder = LoadShedder(queue_depth=10, latency_ms=1000)
+        shedder.observe_queue_depth(12)
+
+        with patch.dict(os.environ, {'S3_BUCKET': 'audit', 'SECRETS_ARN': 'arn', 'MODE': 'DRY_RUN'}), \
+                patch('idempotency._guard', guard), \
+                patch('lambda_function.get_client', return_value=MagicMock()), \
+                patch('lambda_function.get_shedder', return_value=shedder), \
+                patch('lambda_function.get_nim_credentials', return_value={}), \
+                patch('lambda_function.process_with_nim', return_value={'reasoning': 'scale out', 'confidence': 8}) as process:
+            shed = lambda_function.lambda_handler(event, None)
+            shedder.observe_queue_depth(0)
+            [deferred] = shedder.take_deferred(10)
+            reanalysed = lambda_function.lambda_handler(deferred, None)
+            redelivered = lambda_function.lambda_handler(deferred, None)
+
+        assert json.loads(shed['body'])['degraded'] is True
+        assert json.loads(reanalysed['body'])['degraded'] is False
+        assert process.call_count == 1
+        assert json.loads(redelivered['body'])['message'] == 'Duplicate delivery ignored'
@@ -0,0 +1,70 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+import runbooks
+from lexical import LexicalIndex, terms
+
+DOCS = {
+    'db': 'DatabaseConnections pool exhausted, restart the service',
+    'oom': 'Container OOMKilled by the memory limit',
+    'elb': 'Spike in 4XXError responses from targets',
+    'cpu': 'Sustained high CPUUtilization, scale out'
+}
+
+def ids(results):
+    return [doc_id for doc_id, _ in results]
+
+class TestLexicalIndex:
+
+    def test_identifiers_are_indexed_whole_and_split(self):
+        """Test camel-case and digit identifiers yield the whole term and their parts"""
+        assert terms('DatabaseConnections') == ['databaseconnections', 'database', 'connections']
+        assert terms('4XXError') == ['4xxerror', '4xx', 'error']
+        assert terms('HTTPCode_Target_4XX_Count')[0] == 'httpcode_target_4xx_count'
+
+    def test_adds_and_deletes_survive_flush_reopen_and_merge(self, tmp_path):
+        """Test incremental changes give the same ranking before and after sealing segments"""
+        index = LexicalIndex(str(tmp_path))
+        for doc_id, text in DOCS.items():
+            index.add(doc_id, text)
+        index.flush()
+        index.delete('db')
+        index.add('pool', 'DatabaseConnections near max_connections on the replica')
+        index.add('oom', 'Pod OOMKilled, raise the memory limit')
+        expected = index.search('DatabaseConnections OOMKilled')
+        assert ids(expected) == ['pool', 'oom']
+
+        index.flush()
+        reopened = LexicalIndex.open(str(tmp_path))
+        assert len(reopened) == 4 and reopened.search('DatabaseConnections OOMKilled') == expected
+
+        reopened.merge()
+        assert len(reopened.segments) == 1 and 'db' not in reopened
+        assert ids(reopened.search('DatabaseConnections OOMKilled')) == ids(expected)
+        assert sorted(os.listdir(tmp_path)) == ['manifest.json', 'segment-000002.lex']
+
+    def test_hybrid_search_finds_exact_metric_names(self):
+        """Test BM25 lifts the runbook whose metric name the query quotes"""
+        query = 'SRE remediation for HTTPCode_Target_4XX_Count alarm in AWS/ApplicationELB - 4XXError spike'
+        matches = runbooks.search(query)
+        assert matches[0]['id'] == 'elb-4xx'
+        assert matches[0]['bm25'] > matches[1]['bm25']
+
+    def test_runbooks_are_added_and_removed_in_place(self, tmp_path):
+        """Test a new runbook is searchable at once and a removed one disappears from both indexes"""
+        mapped = runbooks.RunbookIndex.open(runbooks.RunbookIndex.build().save(str(tmp_path / 'runbooks.idx')))
+        runbooks.use_index(mapped)
+        runbooks.use_lexical_index(None)
+        try:
+            runbooks.add_runbook({'id': 'kafka-lag', 'metric': 'ConsumerLag', 'action': 'scale_instance',
+                                  'title': 'Kafka consumer group lagging',
+                                  'text': 'ConsumerLag grows when consumers fall behind. Add consumers.'})
+            assert runbooks.search('ConsumerLag alarm on MSK consumer group')[0]['id'] == 'kafka-lag'
+
+            runbooks.remove_runbook('fd-limit')
+            assert 'fd-limit' not in [m['id'] for m in runbooks.search('Too many open files', k=5)]
+            assert mapped.size == len(runbooks.RUNBOOKS)
+        finally:
+            runbooks.use_index(None)
+            runbooks.use_lexical_index(None)
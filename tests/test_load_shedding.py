@@ -0,0 +1,151 @@
+import json
+import os
+import sys
+import time
+from unittest.mock import MagicMock, patch
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+import lambda_function
+from agent_worker import AgentWorker, ListQueue
+from idempotency import IdempotencyGuard, LocalStore
+from load_shedding import LoadShedder
+
+def alarm_event(name, namespace='Custom/Application'):
+    return {'detail': {'alarmName': name, 'state': {'value': 'ALARM', 'reason': 'threshold crossed'},
+                       'configuration': {'metricName': 'CPUUtilization', 'namespace': namespace}}}
+
+LOW = alarm_event('idle-budget-report')
+CRITICAL = alarm_event('db-connection-pool-full', namespace='AWS/RDS')
+
+class TestLoadShedder:
+
+    def test_hysteresis_on_queue_depth(self):
+        """Test shedding starts at the threshold and stops only below the recovery level"""
+        shedder = LoadShedder(queue_depth=10, latency_ms=1000)
+        shedder.observe_queue_depth(12)
+        assert shedder.should_shed(LOW)
+        shedder.observe_queue_depth(6)
+        assert shedder.overloaded
+        shedder.observe_queue_depth(4)
+        assert not shedder.should_shed(LOW)
+        assert shedder.snapshot()['overload_periods'] == 1
+
+    def test_only_low_priority_alarms_are_shed(self):
+        """Test critical alarms keep full reasoning under overload"""
+        shedder = LoadShedder(queue_depth=10, latency_ms=1000)
+        shedder.observe_latency(5000)
+        assert shedder.should_shed(LOW)
+        assert not shedder.should_shed(CRITICAL)
+
+    def test_stale_latency_is_forgotten(self):
+        """Test a latency spike does not keep shedding once calls stop"""
+        shedder = LoadShedder(queue_depth=10, latency_ms=1000, stale_seconds=0.05)
+        shedder.observe_latency(5000)
+        shedder.defer(LOW)
+        assert shedder.take_deferred(10) == []
+        time.sleep(0.1)
+        events = shedder.take_deferred(10)
+        assert len(events) == 1 and events[0]['reanalysis']
+
+    def test_handler_answers_shed_alarm_with_rules(self):
+        """Test a shed alarm skips NIM and is audited as degraded"""
+        shedder = LoadShedder(queue_depth=1, latency_ms=1000)
+        shedder.observe_queue_depth(5)
+        s3 = MagicMock()
+        with patch.dict(os.environ, {'S3_BUCKET': 'audit', 'SECRETS_ARN': 'arn', 'MODE': 'DRY_RUN'}), \
+                patch('lambda_function.get_client', return_value=s3), \
+                patch('lambda_function.get_shedder', return_value=shedder), \
+                patch('lambda_function.process_with_nim') as process:
+            result = lambda_function.lambda_handler(LOW, None)
+
+        process.assert_not_called()
+        assert json.loads(result['body'])['degraded'] is True
+        record = json.loads(s3.put_object.call_args.kwargs['Body'])
+        assert record['degraded'] is True
+        assert record['action']['type'] == 'scale_instance'
+        assert len(shedder.deferred) == 1
+
+    def test_lambda_without_queue_analyses_in_full(self):
+        """Test a Lambda container with no re-analysis queue does not shed into memory it never drains"""
+        shedder = LoadShedder(queue_depth=1, latency_ms=1000)
+        shedder.observe_queue_depth(5)
+        with patch.dict(os.environ, {'S3_BUCKET': 'audit', 'SECRETS_ARN': 'arn', 'MODE': 'DRY_RUN'}), \
+                patch('load_shedding.IN_LAMBDA', True), \
+                patch('lambda_function.get_client', return_value=MagicMock()), \
+                patch('lambda_function.get_shedder', return_value=shedder), \
+                patch('lambda_function.get_nim_credentials', return_value={}), \
+                patch('lambda_function.process_with_nim', return_value={'reasoning': 'scale out', 'confidence': 8}) as process:
+            result = lambda_function.lambda_handler(LOW, None)
+
+        process.assert_called_once()
+        assert json.loads(result['body'])['degraded'] is False
+        assert len(shedder.deferred) == 0
+        assert shedder.snapshot()['not_deferrable'] == 1
+
+    def test_handler_unwraps_reanalysis_queue_batch(self):
+        """Test queued re-analyses are handled one by one and unreadable messages reported as failures"""
+        sqs = MagicMock()
+        shedder = LoadShedder(queue_depth=1, latency_ms=1000)
+        shedder.observe_queue_depth(5)
+        with patch('load_shedding.IN_LAMBDA', True), \
+                patch('load_shedding.REANALYSIS_QUEUE_URL', 'https://sqs.test/reanalysis'), \
+                patch('load_shedding.get_client', return_value=sqs):
+            assert shedder.should_shed(LOW) and shedder.defer(LOW)
+        queued = sqs.send_message.call_args.kwargs['MessageBody']
+        batch = {'Records': [{'messageId': 'm-1', 'body': queued}, {'messageId': 'm-2', 'body': 'not json'}]}
+
+        with patch.dict(os.environ, {'S3_BUCKET': 'audit', 'SECRETS_ARN': 'arn', 'MODE': 'DRY_RUN'}), \
+                patch('lambda_function.get_client', return_value=MagicMock()), \
+                patch('lambda_function.get_nim_credentials', return_value={}), \
+                patch('lambda_function.process_with_nim', return_value={'reasoning': 'scale out', 'confidence': 8}) as process:
+            result = lambda_function.lambda_handler(batch, None)
+
+        assert result == {'batchItemFailures': [{'itemIdentifier': 'm-2'}]}
+        assert process.call_count == 1
+
+    def test_reanalysis_is_not_shed_again(self, tmp_path):
+        """Test a re-analysis arriving while still overloaded is analysed in full, and only once"""
+        event = dict(LOW, id='3f1c9a7e', detail=dict(LOW['detail'], state=dict(
+            LOW['detail']['state'], timestamp='2026-10-19T10:00:00.000+0000')))
+        shedder = LoadShedder(queue_depth=1, latency_ms=1000)
+        shedder.observe_queue_depth(5)
+        with patch.dict(os.environ, {'S3_BUCKET': 'audit', 'SECRETS_ARN': 'arn', 'MODE': 'DRY_RUN'}), \
+                patch('idempotency._guard', IdempotencyGuard(LocalStore(str(tmp_path)))), \
+                patch('lambda_function.get_client', return_value=MagicMock()), \
+                patch('lambda_function.get_shedder', return_value=shedder), \
+                patch('lambda_function.get_nim_credentials', return_value={}), \
+                patch('lambda_function.process_with_nim', return_value={'reasoning': 'scale out', 'confidence': 8}) as process:
+            shed = lambda_function.lambda_handler(event, None)
+            deferred = shedder.deferred.popleft()
+            reanalysed = lambda_function.lambda_handler(deferred, None)
+            redelivered = lambda_function.lambda_handler(deferred, None)
+
+        assert shedder.overloaded
+        assert json.loads(shed['body'])['degraded'] is True
+        assert json.loads(reanalysed['body'])['degraded'] is False
+        assert json.loads(redelivered['body'])['message'] == 'Duplicate delivery ignored'
+        assert process.call_count == 1
+        assert len(shedder.deferred) == 0
+
+    def test_worker_reanalyses_shed_alarms_after_backlog_drains(self):
+        """Test every shed alarm in a batch is re-analysed once the queue is short"""
+        shedder = LoadShedder(queue_depth=4, latency_ms=60000)
+        outcomes = []
+
+        def handler(event, context):
+            if shedder.should_shed(event):
+                shedder.defer(event)
+                outcomes.append('shed')
+            else:
+                outcomes.append('reanalysed' if event.get('reanalysis') else 'full')
+            return {'statusCode': 200}
+
+        events = [alarm_event(f'idle-budget-{i}') for i in range(8)]
+        with patch('agent_worker.get_shedder', return_value=shedder):
+            worker = AgentWorker(ListQueue(events), handler, concurrency=2)
+            worker.run_batch()
+
+        assert outcomes.count('shed') > 0
+        assert outcomes.count('shed') == outcomes.count('reanalysed')
+        assert outcomes.count('full') + outcomes.count('reanalysed') == 8
+        assert len(shedder.deferred) == 0
@@ -0,0 +1,110 @@
+import os
+import sys
+import time
+from unittest.mock import MagicMock, patch
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+import lambda_function
+from log_templates import TemplateMiner, filter_log_events, log_context
+
+NIM_CONFIG = {'api_key': 'test-key', 'llama_endpoint': 'https://nim.test/v1/chat/completions'}
+ALARM = {'alarm_name': 'db-connection-pool-full', 'state': 'ALARM', 'reason': 'All connections in use',
+         'metric_name': 'DatabaseConnections', 'namespace': 'AWS/RDS'}
+
+class FakeLogs:
+    """FilterLogEvents over one event per second, oldest first, page_size events per page"""
+
+    def __init__(self, first_ms, last_ms, page_size=100, delay=0):
+        self.events = [{'timestamp': ms, 'message': f"line {ms // 1000}"} for ms in range(first_ms, last_ms + 1, 1000)]
+        self.page_size = page_size
+        self.delay = delay
+        self.calls = []
+
+    def filter_log_events(self, logGroupName, startTime, endTime, nextToken=0):
+        self.calls.append((startTime, endTime))
+        time.sleep(self.delay)
+        matching = [e for e in self.events if startTime <= e['timestamp'] <= endTime]
+        response = {'events': matching[nextToken:nextToken + self.page_size]}
+        if nextToken + self.page_size < len(matching):
+            response['nextToken'] = nextToken + self.page_size
+        return response
+
+def pool_timeout(i):
+    return f"2026-10-19T10:00:{i % 60:02d}Z ERROR HikariPool-1 - Connection is not available, timed out after {1000 + i}ms"
+
+class TestTemplateMiner:
+
+    def test_lines_differing_in_variables_share_a_template(self):
+        """Test timestamps, numbers and addresses fold into one counted template"""
+        miner = TemplateMiner()
+        for i in range(20):
+            miner.add(pool_timeout(i))
+        miner.add('WARN Retrying request to 10.0.3.17:5432 attempt 2')
+        miner.add('WARN Retrying request to 10.0.1.9:5432 attempt 3')
+
+        top = miner.top()
+        assert [entry['count'] for entry in top] == [20, 2]
+        assert top[0]['template'] == '<*> ERROR HikariPool-<*> - Connection is not available, timed out after <*>'
+        assert top[0]['example'] == pool_timeout(0)
+        assert top[1]['template'] == 'WARN Retrying request to <*> attempt <*>'
+
+    def test_memory_is_bounded(self):
+        """Test the least recently matched templates and their tree leaves are evicted past the cap"""
+        miner = TemplateMiner(max_clusters=3)
+        shapes = ['disk full on volume', 'cache miss storm', 'gc pause long', 'oom killer invoked', 'tls handshake failed']
+        for _ in range(3):
+            for shape in shapes:
+                miner.add(shape)
+
+        assert len(miner.top(10)) == 3 and miner.stats['evicted'] > 0
+        assert sum(len(leaf) for leaf in miner._tree.values()) == 3
+
+    def test_summary_fits_the_budget(self):
+        """Test examples, then the least frequent templates, are dropped to fit max_chars"""
+        miner = TemplateMiner()
+        for i in range(50):
+            miner.add(pool_timeout(i))
+        for i in range(10):
+            miner.add(f"INFO GET /api/orders/{i} 200 {i}ms")
+
+        summary = miner.summary(max_chars=200)
+        assert summary.startswith('Recent logs (60 lines')
+        assert '50x' in summary and '10x' in summary and 'e.g.' not in summary and len(summary) <= 200
+        assert '10x' not in miner.summary(max_chars=160)
+
+    def test_nim_prompt_carries_mined_log_context(self, tmp_path):
+        """Test process_with_nim sends the top templates from the configured log source"""
+        log_file = tmp_path / 'app.log'
+        log_file.write_text('\n'.join(pool_timeout(i) for i in range(200)))
+        response = MagicMock(status_code=200, json=lambda: {'choices': [{'message': {'content': 'restart db'}}]})
+
+        with patch('log_templates.LOG_CONTEXT_FILE', str(log_file)), \
+                patch('requests.Session.post', return_value=response) as post:
+            assert 'HikariPool' in log_context(ALARM)
+            lambda_function.process_with_nim(ALARM, NIM_CONFIG)
+
+        prompt = post.call_args.kwargs['json']['messages'][0]['content']
+        assert '200x <*> ERROR HikariPool-<*>' in prompt
+        assert log_context(ALARM) == ''
+
+    def test_newest_lines_up_to_the_alarm_are_read(self):
+        """Test the cap keeps the lines just before the alarm, in order, and nothing after it"""
+        logs = FakeLogs(0, 1000 * 1000)
+        alarm_ms = 600 * 1000
+        lines = filter_log_events(logs, 'app', alarm_ms - 900 * 1000, alarm_ms, limit=150)
+
+        assert lines == [f"line {s}" for s in range(451, 601)]
+        assert all(end <= alarm_ms for _, end in logs.calls)
+
+        alarm = dict(ALARM, timestamp='1970-01-01T00:10:00.000+0000')
+        with patch('log_templates.LOG_GROUPS', {'AWS/RDS': 'app'}):
+            assert log_context(alarm, FakeLogs(0, 1000 * 1000)).startswith('Recent logs (601 lines')
+
+    def test_log_read_stops_at_the_deadline(self):
+        """Test a slow log group is read only until the deadline, keeping what arrived"""
+        logs = FakeLogs(0, 900 * 1000, page_size=10, delay=0.02)
+        start = time.monotonic()
+        lines = filter_log_events(logs, 'app', 0, 900 * 1000, deadline=start + 0.1)
+
+        assert time.monotonic() - start < 0.5
+        assert 0 < len(lines) < 900 and len(logs.calls) <= 6
@@ -0,0 +1,73 @@
+import json
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+import lambda_function
+from near_duplicate import NearDuplicateIndex, alarm_tokens
+
+DECISION = {'reasoning': 'Runaway worker process', 'confidence': 8, 'model_used': 'llama-3.1-nemotron-70b'}
+
+def alarm(name, reason, metric='CPUUtilization', namespace='AWS/EC2'):
+    return {'alarm_name': name, 'state': 'ALARM', 'reason': reason, 'metric_name': metric, 'namespace': namespace}
+
+def alarm_event(name, reason):
+    return {'detail': {'alarmName': name, 'state': {'value': 'ALARM', 'reason': reason},
+                       'configuration': {'metricName': 'CPUUtilization', 'namespace': 'AWS/EC2'}}}
+
+SEEN = alarm('web-cpu-high-i-0a1b2c3d4e', 'CPU 91% on host ip-10-0-1-17 for 5 minutes')
+
+class TestNearDuplicate:
+
+    def test_host_ids_percentages_and_order_are_ignored(self):
+        """Test alarms differing only in ids, numbers and word order share a token set"""
+        other = alarm('web-cpu-high-i-09f8e7d6c5', 'for 10 minutes CPU 97% on host ip-10-0-3-121')
+        assert alarm_tokens(SEEN) == alarm_tokens(other)
+
+        index = NearDuplicateIndex(threshold=0.8)
+        index.add(SEEN, DECISION)
+        decision = index.match(other)
+        assert decision['reasoning'] == DECISION['reasoning']
+        assert decision['near_duplicate']['distance'] == 0.0
+
+    def test_threshold_metric_and_reason_gate_reuse(self):
+        """Test a different metric, a different reason or a strict threshold means no reuse"""
+        index = NearDuplicateIndex(threshold=0.8)
+        index.add(SEEN, DECISION)
+        close = alarm('web-cpu-high-i-0a1b2c3d4e', 'CPU 91% on host ip-10-0-1-17 for 5 minutes after deploy')
+
+        assert index.match(alarm(SEEN['alarm_name'], SEEN['reason'], metric='MemoryUtilization')) is None
+        assert index.match(alarm('web-cpu-high', 'Disk queue depth above threshold')) is None
+        assert 0 < index.match(close)['near_duplicate']['distance'] <= 0.2
+        index.threshold = 1.0
+        assert index.match(close) is None
+        assert index.stats['misses'] == 3
+
+    def test_index_is_bounded(self):
+        """Test the oldest entries and their LSH buckets are dropped past the limit"""
+        index = NearDuplicateIndex(max_entries=3, ttl=60)
+        for i, reason in enumerate(['disk full', 'memory leak in cache', 'connection storm', 'gc pause']):
+            index.add(alarm(f'alarm-{i}', reason), DECISION)
+
+        assert index.stats['evicted'] == 1
+        assert index.match(alarm('alarm-0', 'disk full')) is None
+        assert index.match(alarm('alarm-3', 'gc pause')) is not None
+        assert all(entry_id in index._entries for bucket in index._buckets.values() for entry_id in bucket)
+
+    def test_handler_reuses_near_identical_decision(self):
+        """Test the second of two near-identical alarms is decided without a model call"""
+        s3 = MagicMock()
+        with patch.dict(os.environ, {'S3_BUCKET': 'audit', 'SECRETS_ARN': 'arn', 'MODE': 'DRY_RUN'}), \
+                patch('near_duplicate._index', NearDuplicateIndex()), \
+                patch('lambda_function.claim', return_value=(None, True)), \
+                patch('lambda_function.get_client', return_value=s3), \
+                patch('lambda_function.get_nim_credentials', return_value={'api_key': 'k'}), \
+                patch('lambda_function.process_with_nim', return_value=dict(DECISION)) as process:
+            lambda_function.lambda_handler(alarm_event('api-7-cpu-high', 'CPU 88% on i-0a1b2c3d4e'), None)
+            lambda_function.lambda_handler(alarm_event('api-12-cpu-high', 'CPU 93% on i-0f9e8d7c6b'), None)
+
+        assert process.call_count == 1
+        record = json.loads(s3.put_object.call_args.kwargs['Body'])
+        match = record['reasoning']['near_duplicate']
+        assert match['alarm'] == 'api-7-cpu-high' and match['distance'] == 0.0
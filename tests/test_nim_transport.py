@@ -0,0 +1,100 @@
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import PropertyMock, patch
+from urllib.parse import urlsplit
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+import nim_transport
+from transport_modes import HTTP1Endpoint, H2CEndpoint
+
+PAYLOAD = {'model': 'meta/llama-3.1-nemotron-nano-8b-v1', 'prompt': 'ping', 'max_tokens': 1}
+
+class TestNIMTransport:
+
+    def setup_method(self):
+        nim_transport.reset()
+
+    def test_http2_falls_back_to_http1_pool(self):
+        """Test an HTTP/1.1-only endpoint is used through the pooled session when HTTP/2 is on"""
+        endpoint = HTTP1Endpoint(0)
+        try:
+            with patch.dict(os.environ, {'NIM_HTTP2': 'true'}):
+                first = nim_transport.post(endpoint.url, PAYLOAD, timeout=5)
+                second = nim_transport.post(endpoint.url, PAYLOAD, timeout=5)
+        finally:
+            endpoint.close()
+
+        stats = next(iter(nim_transport.transport_stats().values()))
+        assert first.status_code == second.status_code == 200
+        assert stats['mode'] == 'http/1.1'
+        assert stats['fallbacks'] == 1
+        assert stats['requests'] == 2
+
+    def test_concurrent_requests_multiplex_over_one_connection(self):
+        """Test concurrent requests become streams on a single HTTP/2 connection"""
+        pytest.importorskip('h2')
+        endpoint = H2CEndpoint(0.3)
+        try:
+            with patch.dict(os.environ, {'NIM_HTTP2': 'true'}):
+                start = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    responses = list(executor.map(
+                        lambda _: nim_transport.post(endpoint.url, PAYLOAD, timeout=5), range(8)))
+                elapsed = time.perf_counter() - start
+        finally:
+            endpoint.close()
+
+        stats = next(iter(nim_transport.transport_stats().values()))
+        assert all(r.status_code == 200 and r.json()['choices'] for r in responses)
+        assert stats['mode'] == 'h2'
+        assert stats['http2_connections'] == 1
+        assert endpoint.connections == 1
+        assert stats['peak_concurrency'] > 1
+        assert elapsed < 8 * 0.3
+
+    def test_dial_runs_outside_the_lock_once_per_endpoint(self):
+        """Test concurrent callers share one handshake and other endpoints are not blocked by it"""
+        dials = []
+
+        class SlowConnection:
+            closed = False
+
+            def __init__(self, scheme, host, port):
+                dials.append(nim_transport._lock.locked())
+                time.sleep(0.2)
+
+            def close(self):
+                pass
+
+        url = 'http://nim.test:8000/v1/completions'
+        stats = nim_transport._endpoint_stats('http://nim.test:8000')
+        with patch('nim_transport.HTTP2Connection', SlowConnection):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                connections = list(executor.map(
+                    lambda _: nim_transport._http2_connection('http://nim.test:8000', urlsplit(url), stats), range(4)))
+
+        assert dials == [False]
+        assert len({id(c) for c in connections}) == 1
+        assert stats['http2_connections'] == 1
+
+    def test_exhausted_stream_capacity_times_out(self):
+        """Test a request waiting for a free stream gives up at its deadline"""
+        h2 = pytest.importorskip('h2.connection')
+        endpoint = H2CEndpoint(0)
+        parts = urlsplit(endpoint.url)
+        connection = nim_transport.HTTP2Connection(parts.scheme, parts.hostname, parts.port)
+        try:
+            with patch.object(h2.H2Connection, 'open_outbound_streams', new_callable=PropertyMock,
+                              return_value=10 ** 6):
+                start = time.perf_counter()
+                with pytest.raises(TimeoutError):
+                    connection.request('POST', parts.path, {}, b'{}', 0.3)
+            assert time.perf_counter() - start < 2
+        finally:
+            connection.close()
+            endpoint.close()
@@ -0,0 +1,115 @@
+import json
+import os
+import sys
+from contextlib import ExitStack
+from unittest.mock import MagicMock, patch
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+import lambda_function
+from flapping import FlapDetector
+from prefetch import DecisionCache, near_threshold
+
+MODEL_DECISION = {'reasoning': 'Connection pool nearly exhausted', 'confidence': 8, 'model_used': 'llama-3.1-nemotron-70b'}
+
+WATCHED = [
+    {'alarm_name': 'db-connections', 'metric_name': 'DatabaseConnections', 'namespace': 'AWS/RDS',
+     'threshold': 100, 'operator': 'GreaterThanThreshold', 'value': 95},
+    {'alarm_name': 'disk-free', 'metric_name': 'FreeStorageSpace', 'namespace': 'AWS/RDS',
+     'threshold': 10, 'operator': 'LessThanThreshold', 'value': 40}
+]
+
+def alarm_event(name, metric, value, state='ALARM'):
+    reason_data = json.dumps({'threshold': 100, 'recentDatapoints': [value]})
+    return {'detail': {'alarmName': name, 'previousState': {'value': 'OK'},
+                       'state': {'value': state, 'reason': 'Threshold Crossed', 'reasonData': reason_data},
+                       'configuration': {'metricName': metric, 'namespace': 'AWS/RDS'}}}
+
+def handler_patches(stack, cache, s3, tmp_path):
+    stack.enter_context(patch.dict(os.environ, {'S3_BUCKET': 'audit', 'SECRETS_ARN': 'arn', 'MODE': 'DRY_RUN'}))
+    stack.enter_context(patch('prefetch._cache', cache))
+    stack.enter_context(patch('flapping._detector', FlapDetector(str(tmp_path / 'flap'))))
+    stack.enter_context(patch('lambda_function.claim', return_value=(None, True)))
+    stack.enter_context(patch('lambda_function.get_client', return_value=s3))
+    stack.enter_context(patch('lambda_function.get_nim_credentials', return_value={'api_key': 'k'}))
+    return stack.enter_context(patch('lambda_function.process_with_nim', return_value=dict(MODEL_DECISION)))
+
+class TestPrefetch:
+
+    def test_near_threshold_in_both_directions(self):
+        """Test only values short of the threshold and within the margin qualify"""
+        assert near_threshold(95, 100, 'GreaterThanThreshold')
+        assert not near_threshold(85, 100, 'GreaterThanThreshold')
+        assert not near_threshold(105, 100, 'GreaterThanThreshold')
+        assert near_threshold(10.5, 10, 'LessThanOrEqualToThreshold')
+        assert not near_threshold(95, 100, 'GreaterThanUpperThreshold')
+
+    def test_alarm_uses_decision_made_near_threshold(self, tmp_path):
+        """Test the poll pre-analyses a trending alarm and its ALARM only re-validates"""
+        metrics_file = tmp_path / 'metrics.json'
+        metrics_file.write_text(json.dumps(WATCHED))
+        cache, s3 = DecisionCache(), MagicMock()
+        with ExitStack() as stack:
+            process = handler_patches(stack, cache, s3, tmp_path)
+            stack.enter_context(patch('prefetch.PREFETCH_METRICS_FILE', str(metrics_file)))
+            polled = lambda_function.lambda_handler({'prefetch': True}, None)
+            result = lambda_function.lambda_handler(alarm_event('db-connections', 'DatabaseConnections', 102), None)
+
+        assert json.loads(polled['body'])['analysed'] == 1
+        assert process.call_count == 1
+        assert 'approaching threshold' in process.call_args.args[0]['reason']
+        assert json.loads(result['body'])['action'] == 'restart_service'
+        record = json.loads(s3.put_object.call_args.kwargs['Body'])
+        assert record['reasoning']['prefetched']['value'] == 95
+        assert cache.stats['hits'] == 1
+
+    def test_drifted_or_expired_decision_is_recomputed(self):
+        """Test a decision is dropped when the metric moved too far or it aged out"""
+        cache = DecisionCache(ttl=600)
+        alarm_data = {'alarm_name': 'db-connections', 'metric_name': 'DatabaseConnections',
+                      'namespace': 'AWS/RDS', 'value': 95}
+        cache.put(alarm_data, MODEL_DECISION)
+        assert cache.revalidate(alarm_event('db-connections', 'DatabaseConnections', 190), alarm_data) is None
+
+        cache.ttl = 0
+        assert cache.revalidate(alarm_event('db-connections', 'DatabaseConnections', 101), alarm_data) is None
+        assert cache.stats == {'stored': 1, 'hits': 0, 'misses': 1, 'stale': 0, 'drifted': 1, 'unverified': 0,
+                               'store_errors': 0}
+
+    def test_insufficient_data_is_pre_analysed_as_alarm(self, tmp_path):
+        """Test an alarm that lost its data is analysed as the ALARM it would raise, with its threshold"""
+        metrics_file = tmp_path / 'metrics.json'
+        metrics_file.write_text(json.dumps([
+            {'alarm_name': 'replica-lag', 'metric_name': 'ReplicaLag', 'namespace': 'AWS/RDS',
+             'threshold': 30, 'operator': 'GreaterThanThreshold', 'value': 27}]))
+        cache, s3 = DecisionCache(), MagicMock()
+        with ExitStack() as stack:
+            process = handler_patches(stack, cache, s3, tmp_path)
+            stack.enter_context(patch('prefetch.PREFETCH_METRICS_FILE', str(metrics_file)))
+            lambda_function.lambda_handler(
+                alarm_event('replica-lag', 'ReplicaLag', 0, state='INSUFFICIENT_DATA'), None)
+            lambda_function.lambda_handler(alarm_event('replica-lag', 'ReplicaLag', 31), None)
+
+        predicted = process.call_args_list[0].args[0]
+        assert predicted['state'] == 'ALARM' and predicted['value'] == 27
+        assert 'threshold 30 (GreaterThanThreshold)' in predicted['reason']
+        assert process.call_count == 1
+        assert cache.stats['hits'] == 1
+
+    def test_decision_without_value_is_not_reused(self, tmp_path):
+        """Test an alarm with no known value is not pre-analysed and a value-less entry is never reused"""
+        cache, s3 = DecisionCache(), MagicMock()
+        event = alarm_event('replica-lag', 'ReplicaLag', 0, state='INSUFFICIENT_DATA')
+        event['detail']['state']['reasonData'] = json.dumps({'recentDatapoints': []})
+        with ExitStack() as stack:
+            process = handler_patches(stack, cache, s3, tmp_path)
+            stack.enter_context(patch('prefetch.PREFETCH_METRICS_FILE', str(tmp_path / 'missing.json')))
+            lambda_function.lambda_handler(event, None)
+            assert process.call_count == 0
+
+            cache.put({'alarm_name': 'replica-lag', 'metric_name': 'ReplicaLag', 'namespace': 'AWS/RDS',
+                       'value': None}, MODEL_DECISION)
+            lambda_function.lambda_handler(alarm_event('replica-lag', 'ReplicaLag', 31), None)
+
+        assert process.call_count == 1
+        assert process.call_args.args[0]['state'] == 'ALARM'
+        assert cache.stats['unverified'] == 1 and cache.stats['hits'] == 0
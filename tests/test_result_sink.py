@@ -0,0 +1,35 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from result_sink import NDJSONResultSink, render_report
+
+class TestResultSink:
+
+    def test_stream_report_matches_running_aggregates(self, tmp_path):
+        """Test the report rebuilt from the stream equals the incremental one"""
+        path = str(tmp_path / 'results.ndjson')
+
+        with NDJSONResultSink(path) as sink:
+            sink.write({'domain': 'Security', 'test': 'a', 'passed': True, 'execution_time': 0.2})
+            sink.write({'domain': 'Security', 'test': 'b', 'passed': False, 'execution_time': 4.0})
+            sink.write({'domain': 'Infrastructure', 'test': 'c', 'passed': True, 'execution_time': 45.0})
+            sink.write({'record_type': 'load_test', 'throughput': 3.0})
+
+        report = render_report(path)
+
+        assert report == sink.aggregates.summary()
+        assert report['overall_metrics']['total_tests'] == 3
+        assert report['domain_results']['Security']['success_rate'] == 50.0
+        assert report['domain_results']['Security']['latency_histogram']['<=5s'] == 1
+        assert report['domain_results']['Infrastructure']['latency_histogram']['>30s'] == 1
+
+    def test_truncated_trailing_line_is_skipped(self, tmp_path):
+        """Test a crash mid-write does not break report rendering"""
+        path = tmp_path / 'results.ndjson'
+        path.write_text('{"domain": "Security", "test": "a", "passed": true, "execution_time": 1.5}\n{"domain": "Sec')
+
+        report = render_report(str(path))
+
+        assert report['overall_metrics']['total_tests'] == 1
+        assert report['domain_results']['Security']['passed'] == 1
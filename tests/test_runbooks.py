@@ -0,0 +1,68 @@
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+import offload
+import runbooks
+import sagemaker_lambda_function
+from sagemaker_lambda_function import parse_llama_output
+
+QUERY = 'SRE remediation for FileDescriptorUtilization alarm in Custom/Application - Too many open files'
+
+class TestRunbookIndex:
+
+    def test_mapped_index_matches_in_memory_index(self, tmp_path):
+        """Test a saved and memory-mapped index returns the same ranking as the built one"""
+        index = runbooks.RunbookIndex.build()
+        mapped = runbooks.RunbookIndex.open(index.save(str(tmp_path / 'runbooks.idx')))
+
+        assert mapped.size == len(runbooks.RUNBOOKS)
+        assert mapped.search(QUERY) == index.search(QUERY)
+        assert mapped.search(QUERY)[0]['id'] == 'fd-limit'
+
+    def test_ngram_encoder_is_deterministic_and_normalised(self):
+        """Test query vectors are unit length and repeatable across encoder instances"""
+        vector = runbooks.encode(QUERY, 'ngram')
+        assert len(vector) == runbooks.ENCODER_DIM
+        assert abs(sum(v * v for v in vector) - 1.0) < 1e-4
+        assert runbooks.QueryEncoder().encode(QUERY) == vector
+
+    def test_mapped_ngram_index_keeps_its_encoder(self, tmp_path):
+        """Test an RBK2 index reopens with the ngram encoder and the same ranking"""
+        index = runbooks.RunbookIndex.build(encoder='ngram')
+        mapped = runbooks.RunbookIndex.open(index.save(str(tmp_path / 'runbooks.idx')))
+
+        assert (mapped.encoder, mapped.dim) == ('ngram', runbooks.ENCODER_DIM)
+        assert mapped.search(QUERY) == index.search(QUERY)
+        assert mapped.search(QUERY)[0]['id'] == 'fd-limit'
+
+    def test_retrieval_survives_embedding_nim_failure(self):
+        """Test runbook knowledge is still retrieved locally when the Retrieval NIM errors"""
+        alarm_data = {'alarm_name': 'fd-exhausted', 'state': 'ALARM', 'reason': 'Too many open files',
+                      'metric_name': 'FileDescriptorUtilization', 'namespace': 'Custom/Application'}
+        with patch('sagemaker_lambda_function.get_embedding_store', return_value=MagicMock(dim=1024)), \
+                patch('sagemaker_lambda_function.invoke_coalesced', side_effect=Exception('endpoint down')) as invoke:
+            context = sagemaker_lambda_function.retrieve_sre_knowledge(MagicMock(), 'retrieval', alarm_data)
+
+        invoke.assert_called_once()
+        assert context['retrieval_successful']
+        assert context['embedding_model'] == f"local-{runbooks.get_index().encoder}"
+        assert context['runbooks'][0]['id'] == 'fd-limit'
+        assert context['retrieved_knowledge'] != 'Standard SRE practices apply'
+
+    def test_process_pool_children_use_shared_index(self, tmp_path):
+        """Test CPU-bound steps give the same results in pool children as inline"""
+        inline_search = runbooks.search(QUERY)
+        inline_parse = parse_llama_output('{"action": "restart_service", "confidence": 8, "reasoning": "fd leak"}')
+
+        index_path = offload.start_process_pool(2, index_path=str(tmp_path / 'runbooks.idx'))
+        try:
+            assert offload.call(runbooks.search, QUERY) == inline_search
+            assert offload.call(parse_llama_output,
+                                '{"action": "restart_service", "confidence": 8, "reasoning": "fd leak"}') == inline_parse
+        finally:
+            offload.shutdown()
+            runbooks.use_index(None)
+
+        assert not os.path.exists(index_path)
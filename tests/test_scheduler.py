@@ -0,0 +1,60 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+from agent_worker import AgentWorker, ListQueue
+from scheduler import PriorityScheduler, alarm_priority, load_policy
+
+def alarm_event(name, namespace='AWS/EC2', state='ALARM', **extra):
+    return dict({'detail': {'alarmName': name, 'state': {'value': state},
+                            'configuration': {'metricName': 'Test', 'namespace': namespace}}}, **extra)
+
+class TestPriorityScheduler:
+
+    def test_priority_from_severity_state_and_sector(self):
+        """Test severity hints, tags, state and sector policy all move the score"""
+        policy = load_policy()
+
+        assert alarm_priority(alarm_event('container-oom-killed', 'AWS/ECS'), policy)[0] == 'critical'
+        assert alarm_priority(alarm_event('disk-usage-warning'), policy)[0] == 'normal'
+        assert alarm_priority(alarm_event('disk-usage-warning', severity='LOW'), policy)[0] == 'low'
+        assert alarm_priority(alarm_event('settlement-latency', 'Finance/Trading'), policy)[1] > \
+            alarm_priority(alarm_event('settlement-latency', 'Custom/Application'), policy)[1]
+        assert alarm_priority(alarm_event('disk-usage-warning', state='OK'), policy)[1] < \
+            alarm_priority(alarm_event('disk-usage-warning'), policy)[1]
+
+    def test_critical_alarm_jumps_the_storm(self):
+        """Test an OOM alarm is served before fifty earlier disk warnings"""
+        scheduler = PriorityScheduler()
+        for i in range(50):
+            scheduler.put({'event': alarm_event(f'disk-warning-{i}', severity='low')})
+        scheduler.put({'event': alarm_event('container-oom-killed', 'AWS/ECS')})
+
+        first = scheduler.get(timeout=0)
+        assert first['event']['detail']['alarmName'] == 'container-oom-killed'
+        assert scheduler.get(timeout=0)['event']['detail']['alarmName'] == 'disk-warning-0'
+        assert set(scheduler.wait_stats()) == {'critical', 'low'}
+
+    def test_aging_prevents_starvation(self):
+        """Test a long-waiting low alarm overtakes a newer high one"""
+        scheduler = PriorityScheduler(dict(load_policy(), aging_per_second=2000))
+        scheduler.put({'event': alarm_event('cost-anomaly', severity='low')})
+        time.sleep(0.1)
+        scheduler.put({'event': alarm_event('thread-pool-full', severity='high')})
+
+        assert scheduler.get(timeout=0)['event']['detail']['alarmName'] == 'cost-anomaly'
+
+    def test_batch_mode_processes_by_priority(self):
+        """Test batch mode runs the whole batch in priority order and reports waits per class"""
+        events = [alarm_event(f'disk-warning-{i}', severity='low') for i in range(5)]
+        events.append(alarm_event('ssl-cert-expired', 'AWS/ApplicationELB'))
+        order = []
+        handler = lambda event, context: order.append(event['detail']['alarmName']) or {'statusCode': 200}
+
+        worker = AgentWorker(ListQueue(events), handler, concurrency=1)
+        worker.run_batch()
+
+        assert order[0] == 'ssl-cert-expired'
+        assert len(order) == 6
+        assert worker.status()['queue_wait_by_priority']['low']['count'] == 5
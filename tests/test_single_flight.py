@@ -0,0 +1,80 @@
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+import lambda_function
+from single_flight import SingleFlight, request_key
+
+NIM_CONFIG = {'api_key': 'test-key', 'llama_endpoint': 'https://nim.test/v1/chat/completions'}
+ALARM = {'alarm_name': 'db-connection-pool-full', 'state': 'ALARM', 'reason': 'All connections in use',
+         'metric_name': 'DatabaseConnections', 'namespace': 'AWS/RDS'}
+
+class TestSingleFlight:
+
+    def test_concurrent_duplicates_share_one_call(self):
+        """Test followers wait for the leader's result instead of calling again"""
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def slow_call():
+            calls.append(1)
+            release.wait(5)
+            return {'reasoning': 'restart'}
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(flight.do, 'same', slow_call) for _ in range(4)]
+            while flight.stats['coalesced'] < 3:
+                time.sleep(0.01)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert len(calls) == 1
+        assert all(r == {'reasoning': 'restart'} for r in results)
+        stats = flight.snapshot()
+        assert stats['leaders'] == 1 and stats['coalesced'] == 3
+        assert stats['follower_wait_ms_max'] > 0
+
+    def test_leader_error_reaches_followers_and_key_is_released(self):
+        """Test a failed call fails its followers and the next call runs afresh"""
+        flight = SingleFlight()
+        started = threading.Event()
+
+        def failing_call():
+            started.set()
+            time.sleep(0.1)
+            raise RuntimeError('endpoint down')
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(flight.do, 'k', failing_call)
+            started.wait(5)
+            follower = executor.submit(flight.do, 'k', lambda: 'unused')
+            for future in (leader, follower):
+                with pytest.raises(RuntimeError):
+                    future.result()
+
+        assert flight.do('k', lambda: 'fresh') == 'fresh'
+
+    def test_request_key_is_canonical(self):
+        """Test key order does not change the key but the endpoint does"""
+        assert request_key('a', {'x': 1, 'y': 2}) == request_key('a', {'y': 2, 'x': 1})
+        assert request_key('a', {'x': 1}) != request_key('b', {'x': 1})
+
+    def test_identical_alarms_make_one_nim_request(self):
+        """Test process_with_nim coalesces concurrent identical alarms"""
+        def slow_post(*args, **kwargs):
+            time.sleep(0.2)
+            return MagicMock(status_code=200, json=lambda: {'choices': [{'message': {'content': 'restart db'}}]})
+
+        with patch('requests.Session.post', side_effect=slow_post) as mock_post:
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                results = list(executor.map(lambda _: lambda_function.process_with_nim(ALARM, NIM_CONFIG), range(3)))
+
+        assert mock_post.call_count == 1
+        assert all(r['reasoning'] == 'restart db' for r in results)
@@ -0,0 +1,117 @@
+import io
+import json
+import importlib.util
+import os
+import sys
+from unittest.mock import MagicMock
+
+# Scripts import shared modules from the repository root
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# domain-specific-validators.py is a script, so load it by path
+spec = importlib.util.spec_from_file_location(
+    'domain_specific_validators',
+    os.path.join(os.path.dirname(__file__), '..', 'domain-specific-validators.py')
+)
+validators = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(validators)
+from result_sink import NDJSONResultSink
+
+def make_case(name, alarm_name, reason, metric_name):
+    return {
+        'name': name,
+        'alarm': {
+            'detail': {
+                'alarmName': alarm_name,
+                'state': {'value': 'ALARM', 'reason': reason},
+                'configuration': {'metricName': metric_name, 'namespace': 'AWS/EC2'}
+            }
+        }
+    }
+
+def make_response(action, status_code=200):
+    return {'statusCode': status_code, 'body': json.dumps({'action': action, 'reasoning': 'test'})}
+
+class TestDomainValidators:
+
+    def test_parse_response_is_shared_and_immutable(self):
+        """Test a parsed response passes through parse_response unchanged"""
+        parsed = validators.parse_response(make_response('investigate'))
+
+        assert parsed.is_valid
+        assert parsed.action == 'investigate'
+        assert validators.parse_response(parsed) is parsed
+
+        try:
+            parsed.body['action'] = 'scale_instance'
+            assert False, 'parsed body should be read-only'
+        except TypeError:
+            pass
+
+    def test_parse_response_rejects_errors(self):
+        """Test structural failures keep the original messages"""
+        assert validators.parse_response({'statusCode': 200}).message == 'Missing required field: body'
+        assert validators.parse_response(make_response('investigate', 500)).message == 'Non-200 status code: 500'
+        assert validators.parse_response({'statusCode': 200, 'body': 'not json'}).message == 'Invalid JSON in response body'
+
+    def test_evaluate_batch_matches_row_validators(self):
+        """Test column-wise batch scoring agrees with the per-case validators"""
+        cases = [
+            make_case('cpu', 'web-cpu-high', 'CPU > 85%', 'CPUUtilization'),
+            make_case('disk', 'disk-space-critical', 'Disk usage > 95%', 'DiskSpaceUtilization'),
+            make_case('login', 'suspicious-logins', 'Failed logins > 50/min', 'FailedLogins'),
+            make_case('broken', 'db-connections-high', 'Connection pool full', 'DatabaseConnections')
+        ]
+        responses = [
+            make_response('scale_instance'),
+            make_response('investigate'),
+            make_response('restart_service'),
+            make_response('restart_service', 500)
+        ]
+
+        batch = validators.evaluate_batch(cases, responses)
+
+        ai = validators.AIReasoningValidator(None)
+        infra = validators.InfrastructureValidator(None)
+        security = validators.SecurityValidator(None)
+        for i, (case, response) in enumerate(zip(cases, responses)):
+            expected = {}
+            expected.update(ai.validate_reasoning_quality(case, response)['validations'])
+            expected.update(infra.validate_infrastructure_actions(case, response)['validations'])
+            expected.update(security.validate_security_response(case, response)['validations'])
+            for column, values in batch['columns'].items():
+                assert values[i] == expected.get(column, {'passed': False})['passed'], (case['name'], column)
+
+        assert batch['total'] == 4
+        assert batch['pass_counts']['structure'] == 3
+
+    def test_validation_stream_replays(self, tmp_path):
+        """Test a results stream written by the tester replays, skipping failed invocations and a truncated tail"""
+        cases = [
+            make_case('cpu', 'web-cpu-high', 'CPU > 85%', 'CPUUtilization'),
+            make_case('timeout', 'db-connections-high', 'Connection pool full', 'DatabaseConnections'),
+            make_case('disk', 'disk-space-critical', 'Disk usage > 95%', 'DiskSpaceUtilization')
+        ]
+        tester = validators.ComprehensiveDomainTester.__new__(validators.ComprehensiveDomainTester)
+        tester.lambda_client = MagicMock()
+        tester.validators = {name: cls(tester.lambda_client) for name, cls in [
+            ('ai_reasoning', validators.AIReasoningValidator), ('infrastructure', validators.InfrastructureValidator),
+            ('security', validators.SecurityValidator), ('performance', validators.PerformanceValidator),
+            ('industry', validators.IndustryValidator)]}
+        tester.lambda_client.invoke.side_effect = [
+            {'Payload': io.BytesIO(json.dumps(make_response('scale_instance')).encode())},
+            TimeoutError('read timed out'),
+            {'Payload': io.BytesIO(json.dumps(make_response('cleanup_logs')).encode())}
+        ]
+
+        path = str(tmp_path / 'results.ndjson')
+        with NDJSONResultSink(path) as sink:
+            tester.run_comprehensive_validation(cases, sink)
+        # A run that crashed mid-write leaves a truncated last line
+        with open(path, 'a') as f:
+            f.write('{"test": "cut-off", "alarm": {"det')
+        batch = validators.replay_corpus(path)
+
+        assert batch['total'] == 2
+        assert batch['test_names'] == ['cpu', 'disk']
+        assert batch['actions'] == ['scale_instance', 'cleanup_logs']
@@ -0,0 +1,67 @@
+import json
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import boto3
+from moto import mock_s3, mock_secretsmanager
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+import clients
+import lambda_function
+from warmup import is_warmup_event, run_warmup
+
+SCHEDULED_EVENT = {'source': 'aws.events', 'detail-type': 'Scheduled Event', 'detail': {}}
+
+class TestWarmup:
+
+    def setup_method(self):
+        clients.reset()
+
+    def test_warmup_event_detection(self):
+        """Test scheduled events and explicit pings are warm-ups, alarms are not"""
+        assert is_warmup_event(SCHEDULED_EVENT)
+        assert is_warmup_event({'warmup': True})
+        assert not is_warmup_event({'source': 'aws.cloudwatch', 'detail-type': 'CloudWatch Alarm State Change'})
+        assert not is_warmup_event(None)
+
+    def test_failing_and_slow_tasks_are_reported_not_raised(self, capsys):
+        """Test warm-up stays within budget and reports metrics under the Warmup dimension"""
+        def fail():
+            raise RuntimeError('endpoint down')
+
+        result = run_warmup('test', {'ok': lambda: None, 'fail': fail, 'slow': lambda: __import__('time').sleep(1)},
+                            budget_seconds=0.2)
+
+        assert result['tasks']['ok']['ok']
+        assert result['tasks']['fail']['error'] == 'endpoint down'
+        assert result['tasks']['slow']['error'] == 'budget exceeded'
+        assert result['duration_ms'] < 1000
+        emf = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+        assert emf['InvocationType'] == 'Warmup'
+        assert emf['WarmupTaskFailures'] == 2
+
+    @mock_s3
+    @mock_secretsmanager
+    def test_warmup_primes_secret_cache_without_audit_log(self):
+        """Test a warm-up invocation writes no audit log and the next alarm reuses the secret"""
+        s3 = boto3.client('s3', region_name='us-east-1')
+        s3.create_bucket(Bucket='test-bucket')
+        secret_arn = boto3.client('secretsmanager', region_name='us-east-1').create_secret(
+            Name='test-secret', SecretString=json.dumps({'nvidia_api_key': 'test-key'}))['ARN']
+
+        with patch.dict(os.environ, {'S3_BUCKET': 'test-bucket', 'SECRETS_ARN': secret_arn, 'MODE': 'DRY_RUN'}), \
+                patch('requests.Session.post') as mock_post:
+            mock_post.return_value = MagicMock(status_code=200)
+            result = lambda_function.lambda_handler(SCHEDULED_EVENT, None)
+
+            body = json.loads(result['body'])
+            assert result['statusCode'] == 200
+            assert body['warmup'] is True
+            assert body['tasks']['nim']['ok']
+            assert s3.list_objects_v2(Bucket='test-bucket').get('KeyCount') == 0
+
+            secrets_client = clients.get_client('secretsmanager')
+            with patch.object(secrets_client, 'get_secret_value') as get_secret_value:
+                assert lambda_function.get_nim_credentials(secrets_client, secret_arn)['api_key'] == 'test-key'
+                get_secret_value.assert_not_called()